@@ -0,0 +1,102 @@
+"""
+Benchmark: brand logos while scrolling the whole vehicles list
+
+Seeds VEHICLES vehicles (default 100k, or the first argument) over the
+known brands, writes a logo for two thirds of them to a temporary logo
+directory, then scrolls the vehicles list from top to bottom. Reports the
+scroll time, how many logo decodes were requested (at most one per brand
+is expected) and the logo cache's size against its cap.
+
+Needs PyQt6; runs offscreen.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QApplication
+
+import utils.brand_manager
+from database.db_manager import DatabaseManager
+from ui.views.vehicles_view import VehiclesView
+from utils.brand_logo_cache import brand_logo_cache
+from utils.brand_manager import BrandManager
+
+VEHICLES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+BRANDS = BrandManager.get_all_brands()
+
+
+def write_logos(directory):
+    """A 256px logo for two thirds of the brands"""
+    for i, brand in enumerate(BRANDS):
+        if i % 3:
+            image = QImage(256, 256, QImage.Format.Format_ARGB32)
+            image.fill(QColor.fromHsv(i * 7 % 360, 160, 200))
+            image.save(os.path.join(directory, f"{brand}.png"))
+
+
+def seed(path):
+    """Create a database with VEHICLES vehicles"""
+    db = DatabaseManager(path)
+    db.add_vehicles_bulk(
+        (
+            {
+                'license_plate': f"BEN-{i:07d}",
+                'brand': BRANDS[i % len(BRANDS)],
+                'model': f"Model {i % 300}",
+                'year': 2000 + i % 25,
+            }
+            for i in range(VEHICLES)
+        ),
+        chunk_size=5000
+    )
+    return db
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  BRAND LOGO SCROLL BENCHMARK")
+    print("=" * 50)
+
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        logo_dir = os.path.join(tmp, 'brand')
+        os.makedirs(logo_dir)
+        write_logos(logo_dir)
+        utils.brand_manager.BRAND_DIR = logo_dir
+        db = seed(os.path.join(tmp, 'logos.db'))
+        print(f"Seeded {VEHICLES} vehicles, {len(BRANDS)} brands")
+
+        view = VehiclesView(db)
+        view.resize(1200, 800)
+        view.show()
+
+        start = time.perf_counter()
+        frames = 0
+        while not view.model.exhausted or view.model.fetching:
+            view.table.scrollToBottom()
+            app.processEvents()
+            frames += 1
+        view.table.scrollToBottom()
+        while brand_logo_cache.pending:
+            app.processEvents()
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+
+        stats = brand_logo_cache.stats()
+        print(f"\n📌 Scrolled {view.model.rowCount()} rows in {elapsed:.2f} s ({frames} frames)")
+        print(f"📌 Logo decodes requested: {stats['decodes']} for {len(BRANDS)} brands")
+        print(f"📌 Logo files decoded: {BrandManager.logo_images.stats()['misses']}")
+        print(f"📌 Logo cache: {stats['entries']} entries, "
+              f"{stats['size'] / 1024:.1f} KiB of {stats['maxsize'] / 1024:.0f} KiB, "
+              f"hit rate {stats['hit_rate']:.1%}")
+
+        view.async_db.shutdown()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
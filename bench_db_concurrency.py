@@ -0,0 +1,146 @@
+"""
+Benchmark: concurrent read throughput while the UI thread writes
+
+Compares the old design (one rollback-journal connection shared by every
+caller behind a lock) with the WAL ConnectionPool used by DatabaseManager.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from database.db_manager import DatabaseManager
+
+VEHICLES = 20000
+READER_THREADS = 4
+DURATION = 3.0
+# The writer behaves like UI edits: one small write every WRITE_INTERVAL
+WRITE_INTERVAL = 0.01
+
+REPORT_QUERY = """
+    SELECT brand, COUNT(*), AVG(mileage), MAX(year)
+    FROM vehicles
+    GROUP BY brand
+"""
+
+
+def seed(db_path):
+    """Create a database with VEHICLES rows"""
+    db = DatabaseManager(db_path)
+    db.add_vehicles_bulk(
+        {
+            'license_plate': f"BEN-{i:06d}",
+            'brand': f"Brand {i % 50}",
+            'model': f"Model {i % 300}",
+            'year': 2000 + i % 25,
+            'mileage': i * 7,
+        }
+        for i in range(VEHICLES)
+    )
+    db.close()
+
+
+def run(read, write):
+    """Run reader threads and one paced writer for DURATION seconds
+
+    Returns (reads per second, mean write latency ms, max write latency ms).
+    """
+    stop = threading.Event()
+    reads = [0] * READER_THREADS
+    latencies = []
+
+    def reader(slot):
+        while not stop.is_set():
+            read()
+            reads[slot] += 1
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            write(i)
+            latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+            time.sleep(WRITE_INTERVAL)
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(READER_THREADS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(reads) / DURATION, sum(latencies) / len(latencies), max(latencies)
+
+
+def bench_single_connection(db_path):
+    """Old design: every caller shares one connection"""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = DELETE")
+    lock = threading.Lock()
+
+    def read():
+        with lock:
+            conn.execute(REPORT_QUERY).fetchall()
+
+    def write(i):
+        with lock:
+            conn.execute("UPDATE vehicles SET mileage = mileage + 1 WHERE id = ?", (i % VEHICLES + 1,))
+            conn.commit()
+
+    result = run(read, write)
+    conn.close()
+    return result
+
+
+def bench_pool(db_path):
+    """New design: WAL, per-thread readers, serialized writer"""
+    db = DatabaseManager(db_path)
+
+    def read():
+        db.pool.reader().execute(REPORT_QUERY).fetchall()
+
+    def write(i):
+        with db.pool.write() as conn:
+            conn.execute("UPDATE vehicles SET mileage = mileage + 1 WHERE id = ?", (i % VEHICLES + 1,))
+
+    result = run(read, write)
+    db.close()
+    return result
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  DATABASE CONCURRENCY BENCHMARK")
+    print("=" * 50)
+    print(f"{VEHICLES} vehicles, {READER_THREADS} reader threads + 1 writer, {DURATION}s each")
+    print(f"CPUs: {os.cpu_count()}, SQLite {sqlite3.sqlite_version}, Python {sys.version.split()[0]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single_path = os.path.join(tmp, 'single.db')
+        pool_path = os.path.join(tmp, 'pool.db')
+        seed(single_path)
+        seed(pool_path)
+
+        # seed() leaves pool_path in WAL mode; the single connection resets to DELETE
+        single = bench_single_connection(single_path)
+        pooled = bench_pool(pool_path)
+
+    for label, (reads, mean_latency, max_latency) in (
+        ("Single shared connection", single),
+        ("WAL connection pool", pooled),
+    ):
+        print(f"\n📌 {label}")
+        print(f"   reads:         {reads:8.1f} /s")
+        print(f"   write latency: {mean_latency:8.2f} ms mean, {max_latency:8.2f} ms max")
+
+    print(f"\nRead throughput: {pooled[0] / max(single[0], 1e-9):.2f}x")
+    print(f"Mean write latency: {single[1] / max(pooled[1], 1e-9):.2f}x lower")
+
+
+if __name__ == "__main__":
+    main()
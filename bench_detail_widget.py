@@ -0,0 +1,72 @@
+"""
+Benchmark: consecutive selections in VehicleDetailWidget
+
+Shows SELECTIONS different vehicles (default 1000, or the first argument)
+one after another, as when arrowing through the list, and reports the
+per-selection time including the repaint. Badges are built once, so each
+selection should only change label texts.
+
+Needs PyQt6; runs offscreen.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
+
+from ui.widgets.vehicle_detail_widget import VehicleDetailWidget
+from utils.pixmap_cache import pixmap_cache
+
+SELECTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+def vehicles():
+    """Distinct vehicle records to cycle through"""
+    return [
+        {
+            'id': i,
+            'license_plate': f"BEN-{i:04d}",
+            'brand': "Toyota",
+            'model': "Yaris",
+            'year': 2000 + i % 25,
+            'insurance_expiry': f"2026-{i % 12 + 1:02d}-01",
+            'kteo_next': f"2027-{i % 12 + 1:02d}-15",
+            'kek_renewal': None if i % 3 else "2026-03-01",
+        }
+        for i in range(SELECTIONS)
+    ]
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  VEHICLE DETAIL WIDGET BENCHMARK")
+    print("=" * 50)
+
+    app = QApplication(sys.argv)
+    start = time.perf_counter()
+    widget = VehicleDetailWidget()
+    widget.resize(1200, 300)
+    print(f"Widget built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    step_times = []
+    for vehicle in vehicles():
+        start = time.perf_counter()
+        widget.show_vehicle(vehicle, db=None)
+        app.processEvents()
+        step_times.append(time.perf_counter() - start)
+
+    total = sum(step_times)
+    step_times.sort()
+    print(f"\n📌 {SELECTIONS} selections: {total * 1000:.1f} ms total")
+    print(f"   median {step_times[len(step_times) // 2] * 1000:.3f} ms, "
+          f"p95 {step_times[int(len(step_times) * 0.95)] * 1000:.3f} ms, "
+          f"max {step_times[-1] * 1000:.3f} ms")
+    print(f"📌 Widgets alive: {len(widget.findChildren(QObject))}")
+    print(f"📌 Pixmap cache: {pixmap_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: cold start of the application
+
+Seeds a database with VEHICLES rows (default 100k, or the first argument),
+then launches main.py RUNS times with FLEET_STARTUP_TIMING=exit and reports
+the median time to each startup milestone: first_frame (window painted)
+and interactive (vehicles list showing its first page). The wall time
+includes interpreter startup.
+
+Needs PyQt6; runs offscreen.
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from database.db_manager import DatabaseManager
+from utils.startup_timer import REPORT_PREFIX
+
+VEHICLES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+RUNS = 5
+
+MILESTONE_LINE = re.compile(re.escape(REPORT_PREFIX) + r" (\w+): ([\d.]+) ms")
+
+
+def seed(path):
+    """Create a migrated database with VEHICLES vehicles"""
+    db = DatabaseManager(path)
+    db.add_vehicles_bulk(
+        (
+            {
+                'license_plate': f"BEN-{i:07d}",
+                'brand': f"Brand {i % 50}",
+                'model': f"Model {i % 300}",
+                'year': 2000 + i % 25,
+            }
+            for i in range(VEHICLES)
+        ),
+        chunk_size=5000
+    )
+    # Startup would otherwise compact the seeded change log once
+    db.compact_changes()
+    db.close()
+
+
+def launch(db_path):
+    """Run main.py once, returning (wall seconds, {milestone: ms})"""
+    env = dict(
+        os.environ,
+        QT_QPA_PLATFORM="offscreen",
+        FLEET_STARTUP_TIMING="exit",
+        FLEET_DB=db_path,
+    )
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "main.py"], env=env, capture_output=True, text=True, timeout=120
+    ).stdout
+    wall = time.perf_counter() - start
+    return wall, {name: float(ms) for name, ms in MILESTONE_LINE.findall(output)}
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  COLD START BENCHMARK")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'startup.db')
+        seed(path)
+        print(f"Seeded {VEHICLES} vehicles")
+
+        walls = []
+        milestones = {}
+        for _ in range(RUNS):
+            wall, marks = launch(path)
+            if 'interactive' not in marks:
+                print("❌ main.py did not report an interactive window")
+                return
+            walls.append(wall)
+            for name, ms in marks.items():
+                milestones.setdefault(name, []).append(ms)
+
+        print(f"\n📌 Median of {RUNS} runs (from main.py import):")
+        for name, values in sorted(milestones.items(), key=lambda item: median(item[1])):
+            print(f"   {name}: {median(values):.1f} ms")
+        print(f"📌 Process wall time: {median(walls) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
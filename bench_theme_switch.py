@@ -0,0 +1,107 @@
+"""
+Benchmark: theme switches with every view open
+
+Opens the main window on a seeded database, visits every view, shows a
+vehicle in the detail card and opens the Add Vehicle dialog, then switches
+between the light and dark themes SWITCHES times (default 20, or the first
+argument). Each switch is one application-wide setStyleSheet() of a
+precompiled sheet; the time includes the repaint.
+
+Needs PyQt6; runs offscreen.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import DatabaseManager
+from ui.dialogs.add_vehicle_dialog import AddVehicleDialog
+from ui.main_window import MainWindow
+from ui.style_engine import style_engine
+from utils.theme_manager import theme
+
+SWITCHES = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+VEHICLES = 2000
+
+
+def seed(path):
+    """Create a database with VEHICLES vehicles"""
+    db = DatabaseManager(path)
+    db.add_vehicles_bulk(
+        {
+            'license_plate': f"BEN-{i:05d}",
+            'brand': f"Brand {i % 50}",
+            'model': f"Model {i % 300}",
+            'year': 2000 + i % 25,
+        }
+        for i in range(VEHICLES)
+    )
+    return db
+
+
+def wait_for(app, condition, timeout=10.0):
+    """Process events until condition() holds"""
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  THEME SWITCH BENCHMARK")
+    print("=" * 50)
+
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = seed(os.path.join(tmp, 'themes.db'))
+
+        start = time.perf_counter()
+        for name in theme.themes:
+            style_engine.stylesheet(name)
+        print(f"Stylesheets compiled in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        window = MainWindow(db)
+        window.show()
+        for view_name in window.VIEW_NAMES:
+            window.switch_view(view_name)
+        window.switch_view("Vehicles")
+        view = window.vehicles_view
+        wait_for(app, lambda: view.proxy.rowCount() > 0)
+        view.detail_widget.show_vehicle(view.proxy.vehicle_at(0), db)
+        dialog = AddVehicleDialog(db, view)
+        dialog.show()
+        app.processEvents()
+        print(f"Widgets open: {len(app.allWidgets())}")
+
+        step_times = []
+        for i in range(SWITCHES):
+            theme.set_theme("dark" if i % 2 == 0 else "light")
+            start = time.perf_counter()
+            window.apply_theme()
+            app.processEvents()
+            step_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        window.apply_theme()
+        app.processEvents()
+        unchanged = time.perf_counter() - start
+
+        step_times.sort()
+        print(f"\n📌 {SWITCHES} switches: {sum(step_times) * 1000:.1f} ms total")
+        print(f"   median {step_times[len(step_times) // 2] * 1000:.1f} ms, "
+              f"max {step_times[-1] * 1000:.1f} ms")
+        print(f"📌 Re-applying the same theme: {unchanged * 1000:.2f} ms")
+        print(f"📌 Widgets with their own stylesheet: "
+              f"{sum(1 for widget in app.allWidgets() if widget.styleSheet())}")
+
+        dialog.close()
+        window.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
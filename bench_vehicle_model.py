@@ -0,0 +1,88 @@
+"""
+Benchmark: opening and scrolling the vehicles list with VehicleTableModel
+
+Seeds VEHICLES rows (default 1M, or the first argument), then measures the
+time until the first page is shown and the per-step cost of scrolling to
+the bottom of what is loaded (which keeps triggering fetchMore).
+
+Needs PyQt6; runs offscreen.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from database.db_manager import DatabaseManager
+from ui.models import VehicleTableModel
+
+VEHICLES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+SCROLL_STEPS = 200
+
+
+def seed(db):
+    """Insert VEHICLES vehicles in bulk"""
+    db.add_vehicles_bulk(
+        (
+            {
+                'license_plate': f"BEN-{i:07d}",
+                'brand': f"Brand {i % 50}",
+                'model': f"Model {i % 300}",
+                'year': 2000 + i % 25,
+                'mileage': i * 7,
+                'insurance_expiry': "2026-01-01",
+                'kteo_next': "2026-06-01",
+            }
+            for i in range(VEHICLES)
+        ),
+        chunk_size=5000
+    )
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  VEHICLE LIST MODEL BENCHMARK")
+    print("=" * 50)
+
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.db')
+        db = DatabaseManager(path)
+        start = time.perf_counter()
+        seed(db)
+        print(f"Seeded {VEHICLES} vehicles in {time.perf_counter() - start:.1f}s")
+        db.close()
+
+        start = time.perf_counter()
+        db = DatabaseManager(path)
+        model = VehicleTableModel(db)
+        table = QTableView()
+        table.setModel(model)
+        table.resize(1200, 800)
+        table.show()
+        model.fetchMore()
+        app.processEvents()
+        opened = time.perf_counter() - start
+        print(f"\n📌 Open (database + first page + paint): {opened * 1000:.1f} ms, {model.rowCount()} rows")
+
+        scrollbar = table.verticalScrollBar()
+        step_times = []
+        for _ in range(SCROLL_STEPS):
+            start = time.perf_counter()
+            scrollbar.setValue(scrollbar.maximum())
+            app.processEvents()
+            step_times.append(time.perf_counter() - start)
+
+        step_times.sort()
+        print(f"📌 Scroll to end x{SCROLL_STEPS}: {model.rowCount()} rows loaded")
+        print(f"   median {step_times[len(step_times) // 2] * 1000:.2f} ms, "
+              f"p95 {step_times[int(len(step_times) * 0.95)] * 1000:.2f} ms, "
+              f"max {step_times[-1] * 1000:.2f} ms")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
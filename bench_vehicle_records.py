@@ -0,0 +1,93 @@
+"""
+Benchmark: memory of 100k vehicles as dicts vs Vehicle records
+
+Both sides fetch the same rows; tracemalloc measures what the result list
+keeps alive. Records save the per-row dict and share repeated text values
+(brand, model, dates, ...) instead of holding a copy per row.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from database.db_manager import DatabaseManager
+from database.models import vehicle_factory
+
+VEHICLES = 100000
+
+
+def seed():
+    """In-memory database with VEHICLES fully populated rows"""
+    db = DatabaseManager(':memory:')
+    db.add_vehicles_bulk(
+        {
+            'license_plate': f"BEN-{i:06d}",
+            'brand': f"Brand {i % 50}",
+            'model': f"Model {i % 300}",
+            'year': 2000 + i % 25,
+            'vehicle_type': "Car",
+            'vin_number': f"VIN{i:014d}",
+            'mileage': i * 7,
+            'engine_cc': 1400,
+            'fuel_type': "Petrol",
+            'color': "White",
+            'notes': "",
+            'insurance_expiry': "2026-01-01",
+            'kteo_next': "2026-06-01",
+            'kek_renewal': "2027-01-01",
+        }
+        for i in range(VEHICLES)
+    )
+    return db
+
+
+def measure(fetch):
+    """Return (bytes held by the fetched list, seconds to fetch)"""
+    # Timed without tracemalloc, which slows allocation down a lot
+    start = time.perf_counter()
+    rows = fetch()
+    elapsed = time.perf_counter() - start
+    assert len(rows) == VEHICLES
+    del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = fetch()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return held, elapsed
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  VEHICLE RECORD MEMORY BENCHMARK")
+    print("=" * 50)
+    print(f"{VEHICLES} vehicles, Python {sys.version.split()[0]}")
+
+    db = seed()
+    conn = db.pool.reader()
+
+    def as_dicts():
+        return [dict(row) for row in conn.execute("SELECT * FROM vehicles")]
+
+    def as_records():
+        cursor = conn.cursor()
+        cursor.row_factory = vehicle_factory
+        return cursor.execute("SELECT * FROM vehicles").fetchall()
+
+    dicts = measure(as_dicts)
+    records = measure(as_records)
+    db.close()
+
+    for label, (held, elapsed) in (("dict per row", dicts), ("Vehicle records", records)):
+        print(f"\n📌 {label}")
+        print(f"   memory: {held / 2 ** 20:8.1f} MiB ({held / VEHICLES:6.0f} B/vehicle)")
+        print(f"   fetch:  {elapsed * 1000:8.1f} ms")
+
+    print(f"\nMemory: {dicts[0] / max(records[0], 1):.2f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: vehicle writes per second, one commit per write vs group commit
+
+Runs each mode with the pool's default synchronous=NORMAL and with FULL,
+where every commit also fsyncs the WAL.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from database.db_manager import DatabaseManager
+
+WRITES = 2000
+THREADS = 4
+
+
+def vehicle(i):
+    return {'license_plate': f"WQ-{i:06d}", 'brand': "Brand", 'model': "Model", 'mileage': i}
+
+
+def open_db(tmp, name, synchronous):
+    db = DatabaseManager(os.path.join(tmp, name))
+    db.pool.writer.execute(f"PRAGMA synchronous = {synchronous}")
+    return db
+
+
+def per_write_commit(db):
+    """Old behaviour: every add_vehicle commits on its own"""
+    for i in range(WRITES):
+        db.add_vehicle(vehicle(i))
+
+
+def queued(db):
+    """Fire-and-forget queue_add_vehicle, then one flush()"""
+    futures = [db.queue_add_vehicle(vehicle(i)) for i in range(WRITES)]
+    db.flush()
+    assert all(future.exception() is None for future in futures)
+
+
+def threaded_sync(db):
+    """THREADS callers using the blocking API with the queue enabled"""
+    db.enable_write_queue()
+    per_thread = WRITES // THREADS
+
+    def worker(offset):
+        for i in range(offset, offset + per_thread):
+            db.add_vehicle(vehicle(i))
+
+    threads = [threading.Thread(target=worker, args=(n * per_thread,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run(tmp, label, mode, synchronous):
+    db = open_db(tmp, f"{label}-{synchronous}.db", synchronous)
+    start = time.perf_counter()
+    mode(db)
+    elapsed = time.perf_counter() - start
+    commits = db.write_queue.commits if db.write_queue else WRITES
+    db.close()
+    return WRITES / elapsed, commits
+
+
+def main():
+    print("=" * 50)
+    print("⏱️  WRITE QUEUE BENCHMARK")
+    print("=" * 50)
+    print(f"{WRITES} inserts, SQLite {sqlite3.sqlite_version}, Python {sys.version.split()[0]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for synchronous in ("NORMAL", "FULL"):
+            print(f"\n📌 synchronous = {synchronous}")
+            baseline = None
+            for label, mode in (
+                ("commit per write", per_write_commit),
+                ("queued + flush()", queued),
+                (f"{THREADS} threads, sync API", threaded_sync),
+            ):
+                rate, commits = run(tmp, label.split()[0], mode, synchronous)
+                baseline = baseline or rate
+                print(f"   {label:24} {rate:9.0f} writes/s  {commits:5d} commits  {rate / baseline:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures
+
+make_db: factory for databases in the test's temporary directory, seeded
+with the given vehicles and closed when the test ends.
+"""
+import pytest
+
+from database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    """make_db(vehicles=(), name='fleet.db') -> seeded DatabaseManager"""
+    databases = []
+
+    def make(vehicles=(), name='fleet.db'):
+        db = DatabaseManager(str(tmp_path / name))
+        vehicles = list(vehicles)
+        if vehicles:
+            db.add_vehicles_bulk(vehicles)
+        databases.append(db)
+        return db
+
+    yield make
+    for db in databases:
+        db.close()
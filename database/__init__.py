@@ -1,4 +1,5 @@
 """Database package initialization"""
 from .db_manager import DatabaseManager
+from .models import Vehicle
 
-__all__ = ['DatabaseManager']
+__all__ = ['DatabaseManager', 'Vehicle']
@@ -0,0 +1,152 @@
+"""
+Async DB - Runs DatabaseManager calls off the GUI thread
+
+Calls run on a small thread pool (each worker reads through its own WAL
+reader connection) and results come back on the GUI thread, either to a
+callback / the result_ready signal or as an awaitable for qasync code.
+
+Requests may carry a key: a new request with the same key cancels the
+previous one, so only the latest search or page load ever reaches the UI.
+The synchronous DatabaseManager API is unchanged for scripts.
+"""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, InvalidStateError
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+DB_WORKERS = 2
+
+
+class DatabaseRequest:
+    """One submitted call and where its result goes"""
+
+    __slots__ = ('key', 'future', 'callback', 'error_callback', 'cancelled')
+
+    def __init__(self, key, callback, error_callback):
+        self.key = key
+        self.future = Future()
+        self.cancelled = False
+        self.callback = callback
+        self.error_callback = error_callback
+
+
+class AsyncDatabase(QObject):
+    """Qt-friendly asynchronous facade over a DatabaseManager"""
+
+    # (key, result) / (key, error message) for every delivered request
+    result_ready = pyqtSignal(object, object)
+    error = pyqtSignal(object, str)
+
+    # Emitted from worker threads; queued to the GUI thread
+    _finished = pyqtSignal(object)
+
+    def __init__(self, db, workers=DB_WORKERS, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-worker")
+        self.pending = {}
+        self.closed = False
+        self._finished.connect(self._deliver)
+
+    def submit(self, method, *args, key=None, callback=None, error_callback=None, **kwargs):
+        """Run method(*args, **kwargs) on a worker thread, returning a Future
+
+        callback(result) or error_callback(exception) run on the GUI thread
+        unless the request was cancelled or superseded by a newer one with
+        the same key.
+        """
+        if key is not None:
+            self.cancel(key)
+
+        request = DatabaseRequest(key, callback, error_callback)
+        if key is not None:
+            self.pending[key] = request
+        self.executor.submit(self._run, request, method, args, kwargs)
+        return request.future
+
+    def call(self, method, *args, key=None, **kwargs):
+        """Awaitable version of submit() for asyncio/qasync code"""
+        return asyncio.wrap_future(self.submit(method, *args, key=key, **kwargs))
+
+    def cancel(self, key):
+        """Cancel the pending request with this key, if any"""
+        request = self.pending.pop(key, None)
+        if request:
+            # A request already running finishes, but its result is dropped
+            request.cancelled = True
+            request.future.cancel()
+
+    def shutdown(self, wait=False):
+        """Cancel pending requests and stop the worker threads
+
+        With wait, returns once calls already running have finished, e.g.
+        before closing the database they read from. Requests finishing
+        afterwards, keyed or not, are never delivered.
+        """
+        self.closed = True
+        for key in list(self.pending):
+            self.cancel(key)
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, request, method, args, kwargs):
+        """Worker thread: run the call unless it was cancelled meanwhile"""
+        if request.cancelled:
+            return
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            settle = request.future.set_exception
+            value = e
+        else:
+            settle = request.future.set_result
+            value = result
+
+        try:
+            settle(value)
+        except InvalidStateError:
+            # Cancelled while running
+            return
+        self._finished.emit(request)
+
+    def _deliver(self, request):
+        """GUI thread: hand a finished request to its callback"""
+        if request.key is not None and self.pending.get(request.key) is request:
+            del self.pending[request.key]
+        if request.cancelled or self.closed:
+            return
+
+        error = request.future.exception()
+        if error is None:
+            result = request.future.result()
+            if request.callback:
+                request.callback(result)
+            self.result_ready.emit(request.key, result)
+        else:
+            if request.error_callback:
+                request.error_callback(error)
+            else:
+                print(f"❌ Database error: {error}")
+            self.error.emit(request.key, str(error))
+
+
+def dispatch(async_db, method, *args, callback=None, error_callback=None, key=None, **kwargs):
+    """Run a call through async_db, or synchronously when it is None
+
+    Lets widgets that may live without an AsyncDatabase share one code
+    path; the callbacks behave the same either way.
+    """
+    if async_db is not None:
+        return async_db.submit(
+            method, *args, key=key, callback=callback, error_callback=error_callback, **kwargs
+        )
+
+    try:
+        result = method(*args, **kwargs)
+    except Exception as e:
+        if error_callback is None:
+            raise
+        error_callback(e)
+        return None
+    if callback:
+        callback(result)
+    return result
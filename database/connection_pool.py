@@ -0,0 +1,148 @@
+"""
+Connection Pool - WAL mode SQLite connections shared between threads
+
+A single writer connection is serialized by a lock, and every thread gets
+its own read-only connection. In WAL mode readers see the last committed
+state and never block (or get blocked by) the writer, so background
+workers can query while the UI writes. A thread's reader is closed when
+the thread ends, or earlier through release_reader().
+"""
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+BUSY_TIMEOUT_MS = 5000
+WRITE_RETRIES = 5
+RETRY_DELAY = 0.05
+
+
+class _ReaderHandle:
+    """A thread's reader; dropped with the thread's locals when it ends"""
+
+    __slots__ = ('conn', 'close', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.close = None
+
+
+def is_busy_error(error):
+    """True for the transient 'database is locked/busy' errors"""
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+class ConnectionPool:
+    """One serialized writer plus per-thread reader connections"""
+
+    def __init__(self, db_path, busy_timeout=BUSY_TIMEOUT_MS):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+        # Every connection to an in-memory database is a separate database
+        self.in_memory = db_path == ':memory:' or str(db_path).startswith('file::memory:')
+
+        self.writer = self._open()
+        self.journal_mode = self.writer.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        # NORMAL is crash-safe in WAL mode and avoids an fsync per commit
+        self.writer.execute("PRAGMA synchronous = NORMAL")
+
+    def _open(self):
+        """Open a connection in autocommit mode; transactions are explicit"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout / 1000,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        return conn
+
+    def reader(self):
+        """Return the calling thread's read connection"""
+        if self.in_memory:
+            return self.writer
+
+        handle = getattr(self._local, 'handle', None)
+        if handle is None:
+            conn = self._open()
+            conn.execute("PRAGMA query_only = ON")
+            handle = _ReaderHandle(conn)
+            # Runs on release_reader() or once the thread's locals are freed
+            handle.close = weakref.finalize(handle, self._close_reader, conn)
+            self._local.handle = handle
+            with self._readers_lock:
+                self._readers.append(conn)
+        return handle.conn
+
+    def release_reader(self):
+        """Close the calling thread's read connection, if it has one
+
+        Short-lived threads (QThread workers in particular) should call this
+        before they finish instead of relying on their locals being freed.
+        """
+        handle = getattr(self._local, 'handle', None)
+        if handle is not None:
+            del self._local.handle
+            handle.close()
+
+    def _close_reader(self, conn):
+        """Close a reader unless close() already did"""
+        with self._readers_lock:
+            if conn not in self._readers:
+                return
+            self._readers.remove(conn)
+        conn.close()
+
+    @contextmanager
+    def write(self):
+        """Run a block inside a serialized write transaction
+
+        Commits on success and rolls back on error. Nested calls from the
+        same thread join the outer transaction.
+        """
+        with self.write_lock:
+            if self.writer.in_transaction:
+                yield self.writer
+                return
+
+            self._begin()
+            try:
+                yield self.writer
+            except BaseException:
+                self.writer.rollback()
+                raise
+            else:
+                self.writer.commit()
+
+    def _begin(self):
+        """BEGIN IMMEDIATE, retrying when another process holds the lock"""
+        for attempt in range(WRITE_RETRIES):
+            try:
+                self.writer.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if not is_busy_error(e) or attempt == WRITE_RETRIES - 1:
+                    raise
+                time.sleep(RETRY_DELAY * (2 ** attempt))
+
+    def close(self):
+        """Close the writer and all reader connections"""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Connection already closed by its thread
+                pass
+
+        with self.write_lock:
+            self.writer.close()
@@ -3,147 +3,519 @@ Database Manager - Handles all database operations
 """
 import sqlite3
 import os
+import re
+import json
+import unicodedata
+from datetime import date
+from itertools import islice
+
+from .connection_pool import ConnectionPool
+from .models import vehicle_factory, Change
+from .vehicle_cache import VehicleCache
+from .write_queue import WriteQueue, WRITE_BATCH_SIZE, WRITE_MAX_DELAY
+from .migrations import migrate, get_version, EXPIRY_FIELDS, day_expression
+
+# Column order and defaults shared by add_vehicle and add_vehicles_bulk
+VEHICLE_COLUMNS = (
+    ('license_plate', None),
+    ('brand', None),
+    ('model', None),
+    ('year', None),
+    ('vehicle_type', None),
+    ('vin_number', None),
+    ('mileage', 0),
+    ('engine_cc', None),
+    ('fuel_type', None),
+    ('color', None),
+    ('notes', None),
+    ('insurance_expiry', None),
+    ('kteo_next', None),
+    ('kek_renewal', None),
+    ('status', 'Active'),
+    ('has_gps', 0),
+)
+
+INSERT_VEHICLE_SQL = f"""
+    INSERT INTO vehicles ({', '.join(name for name, _ in VEHICLE_COLUMNS)})
+    VALUES ({', '.join('?' * len(VEHICLE_COLUMNS))})
+"""
+
+# Rows per transaction for bulk imports (also keeps IN (...) lists small)
+BULK_CHUNK_SIZE = 500
+
+# Columns a query may project or order by
+SELECTABLE_COLUMNS = ('id',) + tuple(name for name, _ in VEHICLE_COLUMNS) + ('created_at', 'updated_at')
+
+# What the vehicles list shows - no notes or VIN
+LIST_COLUMNS = (
+    'id', 'license_plate', 'brand', 'model', 'year', 'mileage',
+    'insurance_expiry', 'kteo_next', 'kek_renewal', 'created_at', 'updated_at'
+)
+
+# Columns the list can be sorted by; each has an index (migration 6) so a
+# sorted page is an index range scan. id is appended to break ties.
+ORDERABLE_COLUMNS = (
+    'created_at', 'updated_at', 'id', 'license_plate', 'brand', 'model',
+    'year', 'mileage', 'insurance_expiry', 'kteo_next'
+)
+
+# Orderable columns that never hold NULL (created_at always gets its
+# CURRENT_TIMESTAMP default); the rest need NULL-safe keyset predicates
+NOT_NULL_COLUMNS = ('created_at', 'id', 'license_plate', 'brand', 'model')
+
+PAGE_SIZE = 500
+
+# Change-log entries kept by compaction (older positions need a full reload)
+CHANGE_LOG_KEEP = 10000
+
+SEARCH_LIMIT = 50
+# bm25 weights in vehicles_fts column order: plate and VIN hits rank above notes
+SEARCH_WEIGHTS = (10.0, 10.0, 4.0, 4.0, 6.0, 1.0)
+# Columns scanned by the LIKE fallback when FTS5 is unavailable
+LIKE_SEARCH_COLUMNS = ('license_plate', 'brand', 'model', 'vin_number', 'notes')
+
+
+GPS_VEHICLES_SQL = """
+    SELECT * FROM vehicles 
+    WHERE has_gps = 1 
+    ORDER BY brand, model
+"""
+
+EPOCH = date(1970, 1, 1)
+
+
+def expiring_sql(field):
+    """Range query over the covering index of an expiry field"""
+    if field not in EXPIRY_FIELDS:
+        raise ValueError(f"Unknown expiry field: {field}")
+    day = day_expression(field)
+    return f"""
+        SELECT id, license_plate, brand, model, {field}, {day} - ? AS days_left
+        FROM vehicles
+        WHERE {day} BETWEEN ? AND ?
+        ORDER BY {day}
+    """
+
+
+def day_number(day):
+    """Days since 1970-01-01, as indexed by the expiry indexes"""
+    return (day - EPOCH).days
+
+
+def projection(columns, required=(), table=None):
+    """SELECT list for the requested columns, always including required ones"""
+    prefix = f"{table}." if table else ""
+    if columns is None:
+        return f"{prefix}*"
+    
+    selected = list(dict.fromkeys(tuple(required) + tuple(columns)))
+    unknown = [name for name in selected if name not in SELECTABLE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown vehicle columns: {', '.join(unknown)}")
+    return ", ".join(prefix + name for name in selected)
+
+
+def search_terms(query):
+    """Split a search box text into lowercase words without accents"""
+    text = unicodedata.normalize('NFD', query.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return re.findall(r'\w+', text)
+
+
+def fts_query(terms):
+    """FTS5 MATCH expression requiring a prefix match for every term"""
+    # Terms are \w+ only, so quoting them cannot break the expression
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def sort_order(order_by, descending=True):
+    """Normalize an order to ((column, descending), ...) ending with id
+    
+    order_by is a column name (sorted by descending) or a sequence of
+    (column, descending) pairs for multi-column sorts.
+    """
+    if isinstance(order_by, str):
+        order_by = ((order_by, descending),)
+    order = []
+    for column, column_descending in order_by:
+        if column not in ORDERABLE_COLUMNS:
+            raise ValueError(f"Cannot page vehicles by {column}")
+        order.append((column, bool(column_descending)))
+        if column == 'id':
+            break
+    else:
+        # id keeps the order total; it follows the last column's direction
+        order.append(('id', order[-1][1] if order else True))
+    return tuple(order)
+
+
+def keyset_condition(order, key):
+    """WHERE condition (sql, params) for rows sorting after key in order
+    
+    SQLite sorts NULLs first ascending and last descending. A row-value
+    comparison cannot express that (NULL compares as unknown), so it is
+    only used when the direction is uniform and no column may be NULL.
+    """
+    directions = {column_descending for _, column_descending in order}
+    if len(directions) == 1 and all(column in NOT_NULL_COLUMNS for column, _ in order):
+        columns = ", ".join(column for column, _ in order)
+        comparison = "<" if order[0][1] else ">"
+        return f"({columns}) {comparison} ({', '.join('?' * len(key))})", list(key)
+    
+    # (c1 after v1) OR (c1 IS v1 AND c2 after v2) OR ...
+    alternatives = []
+    params = []
+    for position, (column, column_descending) in enumerate(order):
+        value = key[position]
+        if value is None:
+            if column_descending:
+                # NULLs come last descending: nothing sorts after them
+                continue
+            after = f"{column} IS NOT NULL"
+        elif column_descending and column not in NOT_NULL_COLUMNS:
+            after = f"({column} < ? OR {column} IS NULL)"
+        else:
+            after = f"{column} {'<' if column_descending else '>'} ?"
+        
+        ties = [f"{previous} IS ?" for previous, _ in order[:position]]
+        alternatives.append(" AND ".join(ties + [after]))
+        params.extend(key[:position])
+        if value is not None:
+            params.append(value)
+    
+    if not alternatives:
+        return "0", []
+    sql = " OR ".join(f"({alternative})" for alternative in alternatives)
+    
+    # A range bound on the first column lets SQLite seek in its index
+    first_column, first_descending = order[0]
+    if key[0] is not None and not first_descending:
+        return f"{first_column} >= ? AND ({sql})", [key[0]] + params
+    if key[0] is not None and first_column in NOT_NULL_COLUMNS:
+        return f"{first_column} <= ? AND ({sql})", [key[0]] + params
+    return f"({sql})", params
+
+
+def vehicle_values(vehicle_data):
+    """Map a vehicle dict to INSERT parameters in VEHICLE_COLUMNS order"""
+    return tuple(vehicle_data.get(name, default) for name, default in VEHICLE_COLUMNS)
+
 
 class DatabaseManager:
     def __init__(self, db_path="fleet_manager.db"):
         """Initialize database connection"""
         self.db_path = db_path
+        self.pool = None
         self.conn = None
+        self.write_queue = None
         self.connect()
         self.create_tables()
     
     def connect(self):
-        """Connect to database"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        """Connect to database (WAL mode, per-thread readers, one writer)"""
+        self.pool = ConnectionPool(self.db_path)
+        # Writer connection, kept for callers that used the single connection
+        self.conn = self.pool.writer
     
     def create_tables(self):
-        """Create all necessary tables"""
-        cursor = self.conn.cursor()
+        """Create or upgrade tables via versioned migrations"""
+        migrate(self.pool)
+        self.vehicle_cache = VehicleCache(self.pool)
+        if self.change_log_length() > CHANGE_LOG_KEEP * 2:
+            self.compact_changes()
+        self.has_search_index = self.pool.writer.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'vehicles_fts'"
+        ).fetchone() is not None
+    
+    def vehicle_cursor(self):
+        """Cursor on the calling thread's reader that returns Vehicle records"""
+        cursor = self.pool.reader().cursor()
+        cursor.row_factory = vehicle_factory
+        return cursor
+    
+    def enable_write_queue(self, max_batch=WRITE_BATCH_SIZE, max_delay=WRITE_MAX_DELAY):
+        """Route vehicle writes through a group-commit WriteQueue
         
-        # Vehicles table - UPDATED με όλα τα νέα fields
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS vehicles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                license_plate TEXT UNIQUE NOT NULL,
-                brand TEXT NOT NULL,
-                model TEXT NOT NULL,
-                year INTEGER,
-                vehicle_type TEXT,
-                vin_number TEXT,
-                mileage INTEGER DEFAULT 0,
-                engine_cc INTEGER,
-                fuel_type TEXT,
-                color TEXT,
-                notes TEXT,
-                insurance_expiry TEXT,
-                kteo_next TEXT,
-                kek_renewal TEXT,
-                status TEXT DEFAULT 'Active',
-                has_gps INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        Synchronous calls still wait for their own commit but share it with
+        concurrent writes; queue_* methods return a Future instead.
+        """
+        if self.write_queue is None:
+            self.write_queue = WriteQueue(self.pool, max_batch, max_delay)
+        return self.write_queue
+    
+    def release_reader(self):
+        """Close the calling thread's read connection (end of a worker thread)"""
+        self.pool.release_reader()
+    
+    def flush(self):
+        """Wait until every queued write is committed"""
+        if self.write_queue:
+            self.write_queue.flush()
+    
+    def _write(self, operation, *args):
+        """Run operation(conn, *args) now or through the write queue"""
+        if self.write_queue:
+            return self.write_queue.submit(operation, *args).result()
+        with self.pool.write() as conn:
+            return operation(conn, *args)
+    
+    def _queue(self, operation, *args, invalidate=(None, None)):
+        """Queue operation(conn, *args), returning a Future
         
-        # Check if has_gps column exists, if not add it
-        cursor.execute("PRAGMA table_info(vehicles)")
-        columns = [column[1] for column in cursor.fetchall()]
+        invalidate is the (vehicle_id, license_plate) to drop from the
+        vehicle cache once the write has committed.
+        """
+        return self.enable_write_queue().submit(
+            operation, *args,
+            after_commit=lambda: self.vehicle_cache.invalidate(*invalidate)
+        )
+    
+    def add_vehicle(self, vehicle_data):
+        """Add a new vehicle"""
+        try:
+            return self._write(self._insert_vehicle, vehicle_data)
+        finally:
+            self.vehicle_cache.invalidate(license_plate=vehicle_data.get('license_plate'))
+    
+    def queue_add_vehicle(self, vehicle_data):
+        """Queue a new vehicle; the Future resolves to its id once committed"""
+        return self._queue(
+            self._insert_vehicle, vehicle_data,
+            invalidate=(None, vehicle_data.get('license_plate'))
+        )
+    
+    @staticmethod
+    def _insert_vehicle(conn, vehicle_data):
+        """INSERT one vehicle, returning its id"""
+        return conn.execute(INSERT_VEHICLE_SQL, vehicle_values(vehicle_data)).lastrowid
+    
+    def add_vehicles_bulk(self, vehicles, chunk_size=BULK_CHUNK_SIZE):
+        """Insert many vehicles using executemany in chunked transactions
         
-        if 'has_gps' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN has_gps INTEGER DEFAULT 0")
+        Returns (inserted_ids, conflicts). inserted_ids follows input order,
+        conflicts is a list of dicts (index, license_plate, error) for rows
+        that were skipped, e.g. duplicate license plates.
+        """
+        # Queued single writes go first, as they were issued first
+        self.flush()
+        inserted_ids = []
+        conflicts = []
+        records = enumerate(vehicles)
         
-        if 'vehicle_type' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN vehicle_type TEXT")
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            ids, chunk_conflicts = self._insert_chunk(chunk)
+            inserted_ids.extend(ids)
+            conflicts.extend(chunk_conflicts)
         
-        if 'vin_number' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN vin_number TEXT")
+        return inserted_ids, conflicts
+    
+    def _insert_chunk(self, chunk):
+        """Insert one chunk of (index, vehicle_data) in a single transaction"""
+        conflicts = []
+        rows = []
+        seen = set()
         
-        if 'engine_cc' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN engine_cc INTEGER")
+        for index, vehicle_data in chunk:
+            values = vehicle_values(vehicle_data)
+            plate = values[0]
+            if plate in seen:
+                conflicts.append({
+                    'index': index,
+                    'license_plate': plate,
+                    'error': 'duplicate license_plate in import'
+                })
+                continue
+            seen.add(plate)
+            rows.append((index, values))
         
-        if 'notes' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN notes TEXT")
+        with self.pool.write() as conn:
+            # Rows clashing with plates already stored are reported, not inserted
+            existing = self._ids_for_plates(conn, [values[0] for _, values in rows])
+            if existing:
+                for index, values in rows:
+                    if values[0] in existing:
+                        conflicts.append({
+                            'index': index,
+                            'license_plate': values[0],
+                            'error': 'license_plate already exists'
+                        })
+                rows = [(index, values) for index, values in rows if values[0] not in existing]
+            
+            conn.execute("SAVEPOINT bulk_chunk")
+            try:
+                conn.executemany(INSERT_VEHICLE_SQL, [values for _, values in rows])
+                conn.execute("RELEASE SAVEPOINT bulk_chunk")
+            except sqlite3.Error:
+                # Some row violates a constraint - isolate it row by row
+                conn.execute("ROLLBACK TO SAVEPOINT bulk_chunk")
+                conn.execute("RELEASE SAVEPOINT bulk_chunk")
+                rows, failed = self._insert_rows_individually(conn, rows)
+                conflicts.extend(failed)
+            
+            ids_by_plate = self._ids_for_plates(conn, [values[0] for _, values in rows])
         
-        if 'insurance_expiry' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN insurance_expiry TEXT")
+        inserted_ids = [ids_by_plate[values[0]] for _, values in rows]
         
-        if 'kteo_next' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN kteo_next TEXT")
+        conflicts.sort(key=lambda conflict: conflict['index'])
+        return inserted_ids, conflicts
+    
+    def _insert_rows_individually(self, conn, rows):
+        """Fallback for a failing chunk: insert rows one by one, same transaction"""
+        inserted = []
+        failed = []
         
-        if 'kek_renewal' not in columns:
-            cursor.execute("ALTER TABLE vehicles ADD COLUMN kek_renewal TEXT")
+        for index, values in rows:
+            conn.execute("SAVEPOINT bulk_row")
+            try:
+                conn.execute(INSERT_VEHICLE_SQL, values)
+                conn.execute("RELEASE SAVEPOINT bulk_row")
+                inserted.append((index, values))
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO SAVEPOINT bulk_row")
+                conn.execute("RELEASE SAVEPOINT bulk_row")
+                failed.append({'index': index, 'license_plate': values[0], 'error': str(e)})
         
-        self.conn.commit()
+        return inserted, failed
     
-    def add_vehicle(self, vehicle_data):
-        """Add a new vehicle"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO vehicles (
-                license_plate, brand, model, year, vehicle_type, vin_number,
-                mileage, engine_cc, fuel_type, color, notes,
-                insurance_expiry, kteo_next, kek_renewal, status, has_gps
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            vehicle_data.get('license_plate'),
-            vehicle_data.get('brand'),
-            vehicle_data.get('model'),
-            vehicle_data.get('year'),
-            vehicle_data.get('vehicle_type'),
-            vehicle_data.get('vin_number'),
-            vehicle_data.get('mileage', 0),
-            vehicle_data.get('engine_cc'),
-            vehicle_data.get('fuel_type'),
-            vehicle_data.get('color'),
-            vehicle_data.get('notes'),
-            vehicle_data.get('insurance_expiry'),
-            vehicle_data.get('kteo_next'),
-            vehicle_data.get('kek_renewal'),
-            vehicle_data.get('status', 'Active'),
-            vehicle_data.get('has_gps', 0)
-        ))
-        self.conn.commit()
-        return cursor.lastrowid
+    def _ids_for_plates(self, conn, plates):
+        """Map license plates to vehicle ids"""
+        if not plates:
+            return {}
+        
+        # One JSON parameter: any chunk_size stays under SQLite's variable limit
+        cursor = conn.execute(
+            "SELECT id, license_plate FROM vehicles "
+            "WHERE license_plate IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(plates)),)
+        )
+        return {row['license_plate']: row['id'] for row in cursor.fetchall()}
     
     def get_all_vehicles(self):
         """Get all vehicles"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM vehicles ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        
         vehicles = []
-        for row in rows:
-            vehicles.append(dict(row))
-        
+        for chunk in self.iter_vehicles():
+            vehicles.extend(chunk)
         return vehicles
     
+    def iter_vehicles(self, columns=None, chunk_size=PAGE_SIZE, order_by='created_at', descending=True):
+        """Yield vehicles in lists of at most chunk_size, newest first by default
+        
+        Each chunk is a separate keyset query, so no statement stays open
+        between chunks and memory is bounded by chunk_size.
+        """
+        after_key = None
+        while True:
+            vehicles, after_key = self.get_vehicles_page(
+                after_key, chunk_size, order_by, columns, descending
+            )
+            if vehicles:
+                yield vehicles
+            if after_key is None:
+                return
+    
+    def get_vehicles_page(self, after_key=None, limit=PAGE_SIZE, order_by='created_at',
+                          columns=None, descending=True, ids=None, search=None):
+        """Get one page of vehicles after a keyset position
+        
+        after_key is the next_key of the previous page (None for the first
+        page). Returns (vehicles, next_key); next_key is None on the last
+        page. Rows inserted concurrently never shift or repeat a page.
+        order_by is a column or a sequence of (column, descending) pairs
+        (see sort_order). ids, if given, restricts the pages to those
+        vehicle ids; search to the vehicles matching that query, as
+        search_vehicles() finds them (re-evaluated on every page, so new
+        matches show up without resending their ids).
+        """
+        order = sort_order(order_by, descending)
+        key_columns = [column for column, _ in order]
+        sql = f"SELECT {projection(columns, key_columns)} FROM vehicles"
+        conditions = []
+        params = []
+        
+        if after_key is not None:
+            condition, condition_params = keyset_condition(order, after_key)
+            conditions.append(condition)
+            params.extend(condition_params)
+        
+        if ids is not None:
+            # One JSON parameter instead of a placeholder per id
+            conditions.append("id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(ids)))
+        
+        if search is not None:
+            terms = search_terms(search)
+            if not terms:
+                return [], None
+            condition, condition_params = self._search_condition(terms)
+            conditions.append(condition)
+            params.extend(condition_params)
+        
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        
+        sql += " ORDER BY " + ", ".join(
+            f"{column} {'DESC' if column_descending else 'ASC'}" for column, column_descending in order
+        )
+        sql += " LIMIT ?"
+        params.append(limit)
+        
+        cursor = self.vehicle_cursor()
+        cursor.execute(sql, params)
+        vehicles = cursor.fetchall()
+        
+        next_key = None
+        if len(vehicles) == limit:
+            last = vehicles[-1]
+            next_key = tuple(last[column] for column in key_columns)
+        return vehicles, next_key
+    
     def get_vehicle_by_license(self, license_plate):
-        """Get vehicle by license plate"""
-        cursor = self.conn.cursor()
+        """Get vehicle by license plate (cached)"""
+        return self.vehicle_cache.get(
+            'plate', license_plate, lambda: self._load_vehicle_by_license(license_plate)
+        )
+    
+    def _load_vehicle_by_license(self, license_plate):
+        """Query a vehicle by license plate"""
+        cursor = self.vehicle_cursor()
         cursor.execute("""
             SELECT * FROM vehicles WHERE license_plate = ?
         """, (license_plate,))
-        
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        return cursor.fetchone()
     
     def get_vehicle_by_id(self, vehicle_id):
-        """Get vehicle by ID"""
-        cursor = self.conn.cursor()
+        """Get vehicle by ID (cached)"""
+        return self.vehicle_cache.get(
+            'id', vehicle_id, lambda: self._load_vehicle_by_id(vehicle_id)
+        )
+    
+    def _load_vehicle_by_id(self, vehicle_id):
+        """Query a vehicle by ID"""
+        cursor = self.vehicle_cursor()
         cursor.execute("SELECT * FROM vehicles WHERE id = ?", (vehicle_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            return dict(row)
-        return None
+        return cursor.fetchone()
     
     def update_vehicle(self, vehicle_id, vehicle_data):
         """Update vehicle information"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        try:
+            self._write(self._update_vehicle, vehicle_id, vehicle_data)
+        finally:
+            self.vehicle_cache.invalidate(vehicle_id, vehicle_data.get('license_plate'))
+    
+    def queue_update_vehicle(self, vehicle_id, vehicle_data):
+        """Queue a vehicle update, returning a Future"""
+        return self._queue(
+            self._update_vehicle, vehicle_id, vehicle_data,
+            invalidate=(vehicle_id, vehicle_data.get('license_plate'))
+        )
+    
+    @staticmethod
+    def _update_vehicle(conn, vehicle_id, vehicle_data):
+        """UPDATE one vehicle"""
+        conn.execute("""
             UPDATE vehicles SET
                 license_plate = ?,
                 brand = ?,
@@ -182,36 +554,226 @@ class DatabaseManager:
             vehicle_data.get('has_gps', 0),
             vehicle_id
         ))
-        self.conn.commit()
     
     def delete_vehicle(self, license_plate):
         """Delete vehicle from database"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM vehicles WHERE license_plate = ?", (license_plate,))
-            self.conn.commit()
-            return True
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            self._write(self._delete_vehicle, license_plate)
+        finally:
+            self.vehicle_cache.invalidate(license_plate=license_plate)
+        return True
+    
+    def queue_delete_vehicle(self, license_plate):
+        """Queue a vehicle deletion, returning a Future"""
+        return self._queue(
+            self._delete_vehicle, license_plate,
+            invalidate=(None, license_plate)
+        )
+    
+    def schema_version(self):
+        """Migration version of the open database"""
+        return get_version(self.pool.reader())
+    
+    def latest_change_seq(self):
+        """Sequence number of the newest vehicle change (0 if none yet)"""
+        row = self.pool.reader().execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'vehicle_changes'"
+        ).fetchone()
+        return row[0] if row else 0
+    
+    def change_log_length(self):
+        """Upper bound on the number of change-log entries, without a scan"""
+        row = self.pool.reader().execute(
+            "SELECT MIN(seq), MAX(seq) FROM vehicle_changes"
+        ).fetchone()
+        return 0 if row[0] is None else row[1] - row[0] + 1
+    
+    def changes_since(self, seq):
+        """Vehicle changes committed after seq, as Change tuples in order
+        
+        Returns None when entries after seq were compacted away; the
+        caller must reload everything and continue from latest_change_seq().
+        A vehicle may appear once per change or only with its last change.
+        """
+        conn = self.pool.reader()
+        # One snapshot for the truncation check and the rows
+        conn.execute("BEGIN")
+        try:
+            truncated_through = conn.execute(
+                "SELECT truncated_through FROM change_log_state"
+            ).fetchone()[0]
+            if seq < truncated_through:
+                return None
+            rows = conn.execute(
+                "SELECT seq, op, vehicle_id FROM vehicle_changes WHERE seq > ? ORDER BY seq",
+                (seq,)
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return [Change(*row) for row in rows]
+    
+    def get_changed_vehicles(self, seq, columns=None, search=None):
+        """Current state of the vehicles changed after seq
+        
+        Returns (latest_seq, {vehicle_id: Vehicle or None if deleted}) read
+        from one snapshot, or None when entries after seq were compacted
+        away (the caller must reload everything). With search, vehicles
+        that no longer match that query are reported as None too.
+        """
+        conn = self.pool.reader()
+        conn.execute("BEGIN")
+        try:
+            truncated_through = conn.execute(
+                "SELECT truncated_through FROM change_log_state"
+            ).fetchone()[0]
+            if seq < truncated_through:
+                return None
+            latest_seq, changed_ids = conn.execute(
+                "SELECT MAX(seq), json_group_array(DISTINCT vehicle_id) "
+                "FROM vehicle_changes WHERE seq > ?",
+                (seq,)
+            ).fetchone()
+            if latest_seq is None:
+                return seq, {}
+            
+            changed = dict.fromkeys(json.loads(changed_ids))
+            sql = (
+                f"SELECT {projection(columns, ('id',))} FROM vehicles "
+                "WHERE id IN (SELECT value FROM json_each(?))"
+            )
+            params = [changed_ids]
+            if search is not None:
+                terms = search_terms(search)
+                # A query without words matches nothing, as in search_vehicles()
+                condition, condition_params = self._search_condition(terms) if terms else ("0", [])
+                sql += f" AND {condition}"
+                params.extend(condition_params)
+            cursor = self.vehicle_cursor()
+            cursor.execute(sql, params)
+            for vehicle in cursor:
+                changed[vehicle['id']] = vehicle
+        finally:
+            conn.execute("COMMIT")
+        return latest_seq, changed
+    
+    def compact_changes(self, keep=CHANGE_LOG_KEEP):
+        """Shrink the change log, returning the number of entries removed
+        
+        Entries superseded by a newer one for the same vehicle are dropped,
+        then everything but the newest keep entries.
+        """
+        with self.pool.write() as conn:
+            removed = conn.execute("""
+                DELETE FROM vehicle_changes
+                WHERE seq < (
+                    SELECT MAX(newer.seq) FROM vehicle_changes newer
+                    WHERE newer.vehicle_id = vehicle_changes.vehicle_id
+                )
+            """).rowcount
+            
+            cutoff = conn.execute(
+                "SELECT seq FROM vehicle_changes ORDER BY seq DESC LIMIT 1 OFFSET ?", (keep,)
+            ).fetchone()
+            if cutoff:
+                removed += conn.execute(
+                    "DELETE FROM vehicle_changes WHERE seq <= ?", (cutoff[0],)
+                ).rowcount
+                conn.execute(
+                    "UPDATE change_log_state SET truncated_through = MAX(truncated_through, ?)",
+                    (cutoff[0],)
+                )
+        return removed
+    
+    def cache_stats(self):
+        """Hit/miss/eviction counters of the vehicle cache"""
+        return self.vehicle_cache.stats()
+    
+    @staticmethod
+    def _delete_vehicle(conn, license_plate):
+        """DELETE one vehicle by plate"""
+        conn.execute("DELETE FROM vehicles WHERE license_plate = ?", (license_plate,))
+    
+    def search_vehicles(self, query, limit=SEARCH_LIMIT, columns=None):
+        """Find vehicles whose plate, brand, model, VIN or notes match query
+        
+        Every word must match the start of a word in some field; results
+        are ranked best first. limit=None returns all matches.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        limit = -1 if limit is None else limit
+        
+        cursor = self.vehicle_cursor()
+        if self.has_search_index:
+            weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+            cursor.execute(f"""
+                SELECT {projection(columns, ('id',), 'v')}
+                FROM vehicles_fts
+                JOIN vehicles v ON v.id = vehicles_fts.rowid
+                WHERE vehicles_fts MATCH ?
+                ORDER BY bm25(vehicles_fts, {weights})
+                LIMIT ?
+            """, (fts_query(terms), limit))
+        else:
+            condition, params = self._search_condition(terms)
+            cursor.execute(f"""
+                SELECT {projection(columns, ('id',))} FROM vehicles
+                WHERE {condition}
+                ORDER BY license_plate
+                LIMIT ?
+            """, params + [limit])
+        
+        return cursor.fetchall()
+    
+    def _search_condition(self, terms):
+        """WHERE condition (sql, params) for vehicles matching every term"""
+        if self.has_search_index:
+            return "id IN (SELECT rowid FROM vehicles_fts WHERE vehicles_fts MATCH ?)", [fts_query(terms)]
+        
+        any_column = "(" + " OR ".join(f"{name} LIKE ?" for name in LIKE_SEARCH_COLUMNS) + ")"
+        params = [f"%{term}%" for term in terms for _ in LIKE_SEARCH_COLUMNS]
+        return " AND ".join([any_column] * len(terms)), params
     
     def get_vehicles_with_gps(self):
         """Get all vehicles that have GPS trackers"""
-        cursor = self.conn.cursor()
+        cursor = self.vehicle_cursor()
+        cursor.execute(GPS_VEHICLES_SQL)
+        return cursor.fetchall()
+    
+    def get_brand_models(self):
+        """Get every distinct (brand, model) pair, read off idx_vehicles_brand"""
+        cursor = self.pool.reader().cursor()
         cursor.execute("""
-            SELECT * FROM vehicles 
-            WHERE has_gps = 1 
+            SELECT DISTINCT brand, model FROM vehicles
+            WHERE brand IS NOT NULL AND model IS NOT NULL
             ORDER BY brand, model
         """)
-        rows = cursor.fetchall()
+        return [(row['brand'], row['model']) for row in cursor.fetchall()]
+    
+    def get_expiring(self, field, within_days, today=None, include_overdue=False):
+        """Get vehicles whose insurance/KTEO/KEK date falls in the next within_days
         
-        vehicles = []
-        for row in rows:
-            vehicles.append(dict(row))
+        field is one of EXPIRY_FIELDS. Each result also has days_left
+        (negative when overdue). Served by the field's covering index.
+        """
+        today = day_number(today or date.today())
+        first_day = -2 ** 63 if include_overdue else today
         
-        return vehicles
+        cursor = self.vehicle_cursor()
+        cursor.execute(expiring_sql(field), (today, first_day, today + within_days))
+        return cursor.fetchall()
+    
+    def explain_query_plan(self, sql, params=()):
+        """Return the EXPLAIN QUERY PLAN detail lines for a query"""
+        cursor = self.pool.reader().cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row['detail'] for row in cursor.fetchall()]
     
     def close(self):
         """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        if self.write_queue:
+            self.write_queue.close()
+            self.write_queue = None
+        if self.pool:
+            self.pool.close()
@@ -0,0 +1,385 @@
+"""
+Migrations - Versioned schema changes keyed on PRAGMA user_version
+
+Each migration runs once, in version order, inside its own write
+transaction together with the user_version bump, so a failed step leaves
+the database at the previous version. On an up-to-date database startup
+costs a single PRAGMA user_version read.
+
+Add a migration by appending a function:
+
+    @migration(2, "Add drivers table")
+    def add_drivers(conn):
+        conn.execute("CREATE TABLE drivers (...)")
+
+Migrations that rewrite large tables should use batched=True and
+rebuild_table(), which copies rows in short transactions instead of
+holding the write lock for the whole rewrite.
+"""
+import sqlite3
+
+MIGRATIONS = []
+
+REBUILD_BATCH_SIZE = 5000
+
+
+class Migration:
+    """A single schema step"""
+
+    def __init__(self, version, description, func, batched=False):
+        self.version = version
+        self.description = description
+        self.func = func
+        self.batched = batched
+
+
+def migration(version, description, batched=False):
+    """Register a migration function for the given schema version
+
+    Regular migrations receive the writer connection inside an open
+    transaction. Batched migrations receive (pool, version) and must set
+    the version themselves, e.g. through rebuild_table().
+    """
+    def register(func):
+        if MIGRATIONS and version != MIGRATIONS[-1].version + 1:
+            raise ValueError(f"Migration {version} is out of order")
+        MIGRATIONS.append(Migration(version, description, func, batched))
+        return func
+    return register
+
+
+def latest_version():
+    """Schema version after all migrations"""
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def get_version(conn):
+    """Read the schema version stored in the database header"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def set_version(conn, version):
+    """Store the schema version (transactional, like any other write)"""
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def migrate(pool):
+    """Bring the database up to latest_version(), returning the version"""
+    version = get_version(pool.writer)
+    if version >= latest_version():
+        return version
+
+    for step in MIGRATIONS:
+        if step.version <= version:
+            continue
+
+        if step.batched:
+            step.func(pool, step.version)
+        else:
+            with pool.write() as conn:
+                # Another process may have migrated while we waited for the lock
+                if get_version(conn) >= step.version:
+                    continue
+                step.func(conn)
+                set_version(conn, step.version)
+
+        version = step.version
+        print(f"✅ Database migrated to v{version}: {step.description}")
+
+    return version
+
+
+def rebuild_table(pool, table, create_sql, columns, version,
+                  select_columns=None, post_sql=(), batch_size=REBUILD_BATCH_SIZE):
+    """Rebuild a table in batches without holding the write lock throughout
+
+    create_sql creates the new table and must use the placeholder {table}
+    for its name. columns are copied from the old table (select_columns may
+    transform them). Writes made while copying are captured by helper
+    triggers and replayed in the final short transaction, which also swaps
+    the tables, runs post_sql (indexes, triggers) and sets the version.
+    """
+    new_table = f"{table}__rebuild"
+    log_table = f"{table}__rebuild_log"
+    select_columns = select_columns or columns
+
+    with pool.write() as conn:
+        # Leftovers from an interrupted rebuild are simply discarded
+        _drop_rebuild_objects(conn, table, new_table, log_table)
+        conn.execute(create_sql.format(table=new_table))
+        conn.execute(f"CREATE TABLE {log_table} (id INTEGER PRIMARY KEY)")
+        for event, refs in (("INSERT", ("NEW",)), ("UPDATE", ("OLD", "NEW")), ("DELETE", ("OLD",))):
+            log_rows = " ".join(
+                f"INSERT OR IGNORE INTO {log_table} (id) VALUES ({ref}.rowid);" for ref in refs
+            )
+            conn.execute(f"""
+                CREATE TRIGGER {table}__rebuild_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN {log_rows} END
+            """)
+
+        # Keep rowids stable; an INTEGER PRIMARY KEY column already is the rowid
+        integer_keys = [
+            column[1] for column in conn.execute(f"PRAGMA table_info({new_table})")
+            if column[5] and column[2].upper() == "INTEGER"
+        ]
+        rowid = "" if set(integer_keys) & set(columns) else "rowid, "
+
+    column_list = rowid + ", ".join(columns)
+    select_list = rowid + ", ".join(select_columns)
+
+    last_rowid = 0
+    while True:
+        with pool.write() as conn:
+            row = conn.execute(f"""
+                SELECT MAX(rowid) FROM (
+                    SELECT rowid FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?
+                )
+            """, (last_rowid, batch_size)).fetchone()
+            if row[0] is None:
+                break
+            conn.execute(f"""
+                INSERT INTO {new_table} ({column_list})
+                SELECT {select_list} FROM {table}
+                WHERE rowid > ? AND rowid <= ?
+            """, (last_rowid, row[0]))
+            last_rowid = row[0]
+
+    with pool.write() as conn:
+        # Replay rows changed during the copy, then rows added after it
+        conn.execute(f"DELETE FROM {new_table} WHERE rowid IN (SELECT id FROM {log_table})")
+        conn.execute(f"""
+            INSERT INTO {new_table} ({column_list})
+            SELECT {select_list} FROM {table}
+            WHERE rowid IN (SELECT id FROM {log_table}) OR rowid > ?
+        """, (last_rowid,))
+
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"DROP TABLE {log_table}")
+        conn.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+        for sql in post_sql:
+            conn.execute(sql)
+        set_version(conn, version)
+
+
+def _drop_rebuild_objects(conn, table, new_table, log_table):
+    """Remove the helper table, log and triggers of a rebuild"""
+    for event in ("insert", "update", "delete"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}__rebuild_{event}")
+    conn.execute(f"DROP TABLE IF EXISTS {new_table}")
+    conn.execute(f"DROP TABLE IF EXISTS {log_table}")
+
+
+# --- Schema history ---------------------------------------------------------
+
+@migration(1, "Vehicles table")
+def create_vehicles_table(conn):
+    """Create the vehicles table, upgrading pre-versioning databases"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS vehicles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            license_plate TEXT UNIQUE NOT NULL,
+            brand TEXT NOT NULL,
+            model TEXT NOT NULL,
+            year INTEGER,
+            vehicle_type TEXT,
+            vin_number TEXT,
+            mileage INTEGER DEFAULT 0,
+            engine_cc INTEGER,
+            fuel_type TEXT,
+            color TEXT,
+            notes TEXT,
+            insurance_expiry TEXT,
+            kteo_next TEXT,
+            kek_renewal TEXT,
+            status TEXT DEFAULT 'Active',
+            has_gps INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Databases created before user_version was used may lack newer columns
+    columns = [column[1] for column in conn.execute("PRAGMA table_info(vehicles)")]
+    for name, definition in (
+        ('has_gps', "INTEGER DEFAULT 0"),
+        ('vehicle_type', "TEXT"),
+        ('vin_number', "TEXT"),
+        ('engine_cc', "INTEGER"),
+        ('notes', "TEXT"),
+        ('insurance_expiry', "TEXT"),
+        ('kteo_next', "TEXT"),
+        ('kek_renewal', "TEXT"),
+    ):
+        if name not in columns:
+            conn.execute(f"ALTER TABLE vehicles ADD COLUMN {name} {definition}")
+
+    # ALTER TABLE cannot add updated_at's CURRENT_TIMESTAMP default, so
+    # existing rows start from created_at and new ones are set on update
+    if 'updated_at' not in columns:
+        conn.execute("ALTER TABLE vehicles ADD COLUMN updated_at TIMESTAMP")
+        conn.execute("UPDATE vehicles SET updated_at = created_at")
+
+
+# Date columns stored as 'yyyy-MM-dd' text, indexed as integer day numbers
+EXPIRY_FIELDS = ('insurance_expiry', 'kteo_next', 'kek_renewal')
+
+
+def day_expression(field):
+    """SQL for a date column as days since 1970-01-01
+
+    Queries must use this exact expression to hit the expiry indexes.
+    """
+    return f"CAST(julianday({field}) - 2440587.5 AS INTEGER)"
+
+
+@migration(2, "Expiry day-number indexes and secondary indexes")
+def add_expiry_indexes(conn):
+    """Index expiry dates as day numbers and the list filters"""
+    for field in EXPIRY_FIELDS:
+        # An expression index rather than a VIRTUAL generated column: SQLite
+        # cannot use covering indexes on tables that have virtual columns
+        conn.execute(f"""
+            CREATE INDEX idx_vehicles_{field}
+            ON vehicles ({day_expression(field)}, {field}, license_plate, brand, model)
+        """)
+
+    conn.execute("CREATE INDEX idx_vehicles_brand ON vehicles (brand, model)")
+    conn.execute("CREATE INDEX idx_vehicles_status ON vehicles (status)")
+    # Matches get_vehicles_with_gps: WHERE has_gps = 1 ORDER BY brand, model
+    conn.execute("CREATE INDEX idx_vehicles_gps ON vehicles (has_gps, brand, model)")
+
+
+@migration(3, "Keyset pagination index")
+def add_created_at_index(conn):
+    """Index for paging the list in its default created_at order"""
+    # The rowid (id) is implicitly appended, giving the (created_at, id) key
+    conn.execute("CREATE INDEX idx_vehicles_created_at ON vehicles (created_at)")
+
+
+# Full-text search columns of vehicles_fts, in bm25 weight order.
+# plate_key is the plate without separators so "ΑΒΓ1234" finds "ΑΒΓ-1234".
+SEARCH_COLUMNS = ('license_plate', 'plate_key', 'brand', 'model', 'vin_number', 'notes')
+
+# unicode61 only strips Latin diacritics; Greek accents are folded in SQL
+# so the triggers work from any connection, not just ones with a UDF
+GREEK_ACCENTS = {
+    'ά': 'α', 'έ': 'ε', 'ή': 'η', 'ί': 'ι', 'ό': 'ο', 'ύ': 'υ', 'ώ': 'ω',
+    'ϊ': 'ι', 'ϋ': 'υ', 'ΐ': 'ι', 'ΰ': 'υ',
+    'Ά': 'Α', 'Έ': 'Ε', 'Ή': 'Η', 'Ί': 'Ι', 'Ό': 'Ο', 'Ύ': 'Υ', 'Ώ': 'Ω',
+}
+
+
+def fold_accents_sql(expression):
+    """SQL expression with Greek accents removed"""
+    for accented, plain in GREEK_ACCENTS.items():
+        expression = f"replace({expression}, '{accented}', '{plain}')"
+    return expression
+
+
+def search_values(ref):
+    """SQL values indexed for a vehicle row; ref is NEW, OLD or a table name"""
+    plate = f"{ref}.license_plate"
+    return (
+        plate,
+        f"replace(replace({plate}, '-', ''), ' ', '')",
+        fold_accents_sql(f"{ref}.brand"),
+        fold_accents_sql(f"{ref}.model"),
+        f"{ref}.vin_number",
+        fold_accents_sql(f"{ref}.notes"),
+    )
+
+
+def search_trigger_sql():
+    """Triggers keeping vehicles_fts in sync (recreate after rebuild_table)"""
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(search_values("NEW"))
+    old_values = ", ".join(search_values("OLD"))
+    # Contentless FTS5 deletes need the exact values that were indexed
+    delete_old = f"""
+        INSERT INTO vehicles_fts (vehicles_fts, rowid, {columns})
+        VALUES ('delete', OLD.id, {old_values});
+    """
+    insert_new = f"INSERT INTO vehicles_fts (rowid, {columns}) VALUES (NEW.id, {new_values});"
+    return (
+        f"CREATE TRIGGER vehicles_fts_insert AFTER INSERT ON vehicles BEGIN {insert_new} END",
+        f"CREATE TRIGGER vehicles_fts_delete AFTER DELETE ON vehicles BEGIN {delete_old} END",
+        f"""
+        CREATE TRIGGER vehicles_fts_update
+        AFTER UPDATE OF license_plate, brand, model, vin_number, notes ON vehicles
+        BEGIN {delete_old} {insert_new} END
+        """,
+    )
+
+
+@migration(4, "Full-text search index")
+def add_search_index(conn):
+    """Create the vehicles_fts index, its sync triggers and initial contents"""
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE vehicles_fts USING fts5(
+                {", ".join(SEARCH_COLUMNS)},
+                content='',
+                tokenize='unicode61',
+                prefix='2 3'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        # SQLite built without FTS5: search_vehicles() falls back to LIKE
+        print(f"⚠️ Full-text search unavailable: {e}")
+        return
+
+    for sql in search_trigger_sql():
+        conn.execute(sql)
+    conn.execute(f"""
+        INSERT INTO vehicles_fts (rowid, {", ".join(SEARCH_COLUMNS)})
+        SELECT id, {", ".join(search_values("vehicles"))} FROM vehicles
+    """)
+
+
+def change_log_trigger_sql():
+    """Triggers recording vehicle writes in vehicle_changes (recreate after rebuild_table)"""
+    return tuple(
+        f"""
+        CREATE TRIGGER vehicle_changes_{op}
+        AFTER {op.upper()} ON vehicles
+        BEGIN
+            INSERT INTO vehicle_changes (op, vehicle_id) VALUES ('{op}', {ref}.id);
+        END
+        """
+        for op, ref in (('insert', 'NEW'), ('update', 'NEW'), ('delete', 'OLD'))
+    )
+
+
+@migration(5, "Vehicle change log")
+def add_change_log(conn):
+    """Log every vehicle write with a monotonic sequence number"""
+    # AUTOINCREMENT: sequence numbers are never reused, even after compaction
+    conn.execute("""
+        CREATE TABLE vehicle_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            op TEXT NOT NULL,
+            vehicle_id INTEGER NOT NULL
+        )
+    """)
+    # Compaction keeps only the newest entry per vehicle
+    conn.execute("CREATE INDEX idx_vehicle_changes_vehicle ON vehicle_changes (vehicle_id, seq)")
+    # Highest sequence number dropped by truncation; older positions are stale
+    conn.execute("CREATE TABLE change_log_state (truncated_through INTEGER NOT NULL)")
+    conn.execute("INSERT INTO change_log_state (truncated_through) VALUES (0)")
+    for sql in change_log_trigger_sql():
+        conn.execute(sql)
+
+
+# List sort columns without an index usable for ORDER BY column, id.
+# license_plate has its UNIQUE index, created_at idx_vehicles_created_at and
+# brand, model sorts use idx_vehicles_brand.
+SORT_INDEX_COLUMNS = ('updated_at', 'brand', 'model', 'year', 'mileage', 'insurance_expiry', 'kteo_next')
+
+
+@migration(6, "List sort indexes")
+def add_sort_indexes(conn):
+    """Index each sortable list column so sorted pages are index scans"""
+    # The rowid (id) is implicitly appended, matching the (column, id) key
+    for column in SORT_INDEX_COLUMNS:
+        conn.execute(f"CREATE INDEX idx_vehicles_sort_{column} ON vehicles ({column})")
@@ -0,0 +1,121 @@
+"""
+Models - Compact read-only records for database rows
+
+A Vehicle keeps the tuple SQLite returned plus a column index shared by
+every row of the same query, instead of a dict per row. Values stay as
+fetched; dates are parsed only when asked for. Vehicles are Mappings, so
+code written for the old dicts (get, [], keys, {**vehicle}) keeps working.
+"""
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+from datetime import date
+
+# Low-cardinality text columns: equal values share one interned string
+SHARED_COLUMNS = frozenset((
+    'brand', 'model', 'vehicle_type', 'fuel_type', 'color', 'status',
+    'insurance_expiry', 'kteo_next', 'kek_renewal', 'created_at', 'updated_at'
+))
+
+# One vehicle_changes entry; op is 'insert', 'update' or 'delete'
+Change = namedtuple('Change', 'seq op vehicle_id')
+
+# Column index per column list, shared by all rows with those columns
+_indexes = {}
+# (cursor.description, index, shared positions) of the last query
+_last_description = (None, None, None)
+
+
+def column_index(names):
+    """Shared {column: position} dict for a tuple of column names"""
+    index = _indexes.get(names)
+    if index is None:
+        index = _indexes.setdefault(names, {name: i for i, name in enumerate(names)})
+    return index
+
+
+class Vehicle(Mapping):
+    """Immutable vehicle row with dict-style and attribute access"""
+
+    __slots__ = ('_values', '_index')
+
+    def __init__(self, index, values):
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_values', values)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a plain dict"""
+        return cls(column_index(tuple(data)), tuple(data.values()))
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        position = self._index.get(key)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getattr__(self, name):
+        # Only reached for names that are not slots or methods
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Vehicle records are read-only")
+
+    def __reduce__(self):
+        return (Vehicle.from_dict, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"Vehicle({self.to_dict()!r})"
+
+    def to_dict(self):
+        """Plain dict copy, e.g. as the starting point for an edit"""
+        return dict(zip(self._index, self._values))
+
+    def date(self, field):
+        """A 'yyyy-MM-dd' column as a date, or None if empty or invalid"""
+        value = self.get(field)
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value[:10])
+        except (TypeError, ValueError):
+            return None
+
+
+def vehicle_factory(cursor, row):
+    """sqlite3 row_factory building Vehicle records"""
+    global _last_description
+
+    description = cursor.description
+    last = _last_description
+    if last[0] is description:
+        _, index, shared = last
+    else:
+        index = column_index(tuple(column[0] for column in description))
+        shared = [position for name, position in index.items() if name in SHARED_COLUMNS]
+        # Holding the description keeps its identity from being reused
+        _last_description = (description, index, shared)
+
+    if shared:
+        values = list(row)
+        for position in shared:
+            value = values[position]
+            if value.__class__ is str:
+                values[position] = sys.intern(value)
+        row = tuple(values)
+    return Vehicle(index, row)
@@ -0,0 +1,101 @@
+"""
+Vehicle Cache - Read-through cache of full vehicle records
+
+Records are cached under ('id', id) and ('plate', license_plate) and
+dropped when DatabaseManager writes them; the two entries of a record are
+always evicted together. Writes by other processes are caught through the
+writer connection's PRAGMA data_version, which only changes when some
+other connection commits; the whole cache is then cleared. The check runs
+on every read without taking the write lock (SQLite serializes single
+statements on a shared connection), so cache hits never wait for a write
+transaction.
+
+A generation counter bumped by every invalidation keeps a read that raced
+with a write from caching the value it read before the write.
+"""
+import sqlite3
+import threading
+
+from utils.lru_cache import LRUCache
+
+VEHICLE_CACHE_SIZE = 1024
+
+
+class VehicleCache:
+    """Bounded LRU of Vehicle records keyed by id and license plate"""
+
+    def __init__(self, pool, maxsize=VEHICLE_CACHE_SIZE):
+        self.pool = pool
+        # Every record takes an id and a plate entry
+        self.cache = LRUCache(maxsize * 2, on_evict=self._evicted)
+        self.generation = 0
+        self.external_invalidations = 0
+        self._lock = threading.Lock()
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self):
+        """Writer's data_version; changes only on other connections' commits"""
+        if sqlite3.threadsafety == 3:
+            # Serialized build: safe beside another thread's transaction
+            return self.pool.writer.execute("PRAGMA data_version").fetchall()[0][0]
+        with self.pool.write_lock:
+            return self.pool.writer.execute("PRAGMA data_version").fetchall()[0][0]
+
+    def check_external_writes(self):
+        """Clear the cache if another process committed since the last check"""
+        version = self._read_data_version()
+        if version != self._data_version:
+            with self._lock:
+                self._data_version = version
+                self.generation += 1
+                self.cache.clear()
+                self.external_invalidations += 1
+
+    def get(self, kind, key, load):
+        """Return the record for ('id' | 'plate', key), calling load() on a miss"""
+        self.check_external_writes()
+        vehicle = self.cache.get((kind, key))
+        if vehicle is not None:
+            return vehicle
+
+        generation = self.generation
+        vehicle = load()
+        if vehicle is not None:
+            with self._lock:
+                if generation == self.generation:
+                    self.cache.put(('id', vehicle['id']), vehicle)
+                    self.cache.put(('plate', vehicle['license_plate']), vehicle)
+        return vehicle
+
+    def invalidate(self, vehicle_id=None, license_plate=None):
+        """Drop a vehicle's entries after it was written"""
+        with self._lock:
+            self.generation += 1
+            for kind, key in (('id', vehicle_id), ('plate', license_plate)):
+                if key is None:
+                    continue
+                vehicle = self.cache.pop((kind, key))
+                if vehicle is not None:
+                    # Also drop the entry under the other key
+                    self.cache.pop(('id', vehicle['id']))
+                    self.cache.pop(('plate', vehicle['license_plate']))
+
+    def _evicted(self, key, vehicle):
+        """Evict the other entry of a record whose id or plate entry was evicted"""
+        kind, _ = key
+        other = ('plate', vehicle['license_plate']) if kind == 'id' else ('id', vehicle['id'])
+        # Called from put(), possibly under self._lock; the LRU locks itself
+        if self.cache.peek(other) is vehicle:
+            self.cache.pop(other)
+
+    def clear(self):
+        """Drop everything"""
+        with self._lock:
+            self.generation += 1
+            self.cache.clear()
+
+    def stats(self):
+        """Hit/miss/eviction counters of the underlying LRU"""
+        stats = self.cache.stats()
+        stats['external_invalidations'] = self.external_invalidations
+        return stats
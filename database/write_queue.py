@@ -0,0 +1,147 @@
+"""
+Write Queue - Group commit for small database writes
+
+Writes are handed to a background thread that runs everything queued
+(up to max_batch) back to back in one transaction. Writes arriving while
+a group commits form the next group, so busy periods batch themselves;
+max_delay optionally lingers for more writes before committing, bounding
+the added latency. Each write runs in its own SAVEPOINT,
+so a failing write is rolled back alone and reported through its Future
+while the rest of the group still commits.
+
+A Future completes only after its group has committed (and after the
+write's after_commit hook ran), and flush() returns once everything
+queued before it is committed.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+WRITE_BATCH_SIZE = 200
+# Blocking callers cannot add more writes while they wait, so by default
+# a group commits as soon as the queue is empty
+WRITE_MAX_DELAY = 0.0
+
+
+class QueuedWrite:
+    """An operation waiting in the queue; operation(conn, *args)"""
+
+    __slots__ = ('operation', 'args', 'future', 'after_commit')
+
+    def __init__(self, operation, args, after_commit=None):
+        self.operation = operation
+        self.args = args
+        self.future = Future()
+        self.after_commit = after_commit
+
+
+class WriteQueue:
+    """Background writer committing queued operations in groups"""
+
+    def __init__(self, pool, max_batch=WRITE_BATCH_SIZE, max_delay=WRITE_MAX_DELAY):
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.commits = 0
+        self.writes = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="db-write-queue", daemon=True)
+        self._thread.start()
+
+    def submit(self, operation, *args, after_commit=None):
+        """Queue operation(conn, *args), returning a Future for its result
+
+        after_commit(), if given, runs on the queue thread once the write
+        committed and before its Future completes.
+        """
+        write = QueuedWrite(operation, args, after_commit)
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("Write queue is closed")
+            self._queue.put(write)
+        return write.future
+
+    def flush(self, timeout=None):
+        """Commit everything queued so far and wait for it"""
+        # A no-op write is a barrier: writes run in order, and a barrier
+        # also ends its group without waiting for max_delay
+        if threading.current_thread() is self._thread:
+            return
+        self.submit(None).result(timeout)
+
+    def close(self):
+        """Commit pending writes and stop the background thread"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Collect writes into groups and commit them"""
+        while True:
+            write = self._queue.get()
+            if write is None:
+                return
+
+            group = [write]
+            deadline = time.monotonic() + self.max_delay
+            stop = False
+            while write.operation is not None and len(group) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        write = self._queue.get(timeout=remaining)
+                    else:
+                        write = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if write is None:
+                    stop = True
+                    break
+                group.append(write)
+
+            self._commit(group)
+            if stop:
+                return
+
+    def _commit(self, group):
+        """Run a group of writes in one transaction and settle their futures"""
+        results = []
+        try:
+            with self.pool.write() as conn:
+                for write in group:
+                    if write.operation is None:
+                        results.append((write, None, None))
+                        continue
+                    conn.execute("SAVEPOINT queued_write")
+                    try:
+                        result = write.operation(conn, *write.args)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO queued_write")
+                        results.append((write, None, e))
+                    else:
+                        results.append((write, result, None))
+                    conn.execute("RELEASE queued_write")
+        except Exception as e:
+            # The whole group failed to commit (e.g. database locked)
+            for write in group:
+                write.future.set_exception(e)
+            return
+
+        self.commits += 1
+        self.writes += sum(1 for write in group if write.operation is not None)
+        for write, result, error in results:
+            if error is None:
+                if write.after_commit:
+                    try:
+                        write.after_commit()
+                    except Exception as e:
+                        print(f"❌ Error after queued write: {e}")
+                write.future.set_result(result)
+            else:
+                write.future.set_exception(error)
@@ -1,10 +1,12 @@
 """
 Fleet Manager - Main Entry Point
 """
+from utils.startup_timer import startup_timer
+
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from database.db_manager import DatabaseManager
 from ui.main_window import MainWindow
 
 def main():
@@ -15,15 +17,24 @@ def main():
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
+    startup_timer.mark("qt_ready")
     
-    # Initialize database
-    db = DatabaseManager()
-    
-    # Create main window
-    window = MainWindow(db)
+    # Show the window first; the database opens in the background
+    window = MainWindow()
+    window.first_frame.connect(lambda: startup_timer.mark("first_frame"))
+    window.ready.connect(on_ready)
     window.show()
+    # FLEET_DB points at another database file (e.g. for bench_startup.py)
+    window.load_database(os.environ.get("FLEET_DB", "fleet_manager.db"))
     
     sys.exit(app.exec())
 
+def on_ready():
+    """The vehicles list shows its first page: startup is over"""
+    startup_timer.mark("interactive")
+    startup_timer.report()
+    if startup_timer.exit_when_interactive:
+        QApplication.quit()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,68 @@
+"""
+Tests: prefix trie and brand/model autocomplete index
+"""
+from utils.brand_model_index import BrandModelIndex
+from utils.prefix_trie import PrefixTrie
+
+
+def test_trie_prefixes():
+    trie = PrefixTrie(["Alfa Romeo", "Audi", "Citroën", "Mercedes-Benz", "Rover", "Rolls-Royce"])
+    assert trie.complete("a") == ["Alfa Romeo", "Audi"]
+    # Any word of a name, case and accents ignored; ordered by the matched word
+    assert trie.complete("RO") == ["Rolls-Royce", "Alfa Romeo", "Rover"]
+    assert trie.complete("benz") == ["Mercedes-Benz"]
+    assert trie.complete("citroe") == ["Citroën"]
+    assert trie.complete("zz") == []
+    assert trie.complete("ro", limit=2) == ["Rolls-Royce", "Alfa Romeo"]
+
+
+def test_trie_keeps_first_spelling():
+    trie = PrefixTrie(["Vespa", "VESPA", "vespa "])
+    assert len(trie) == 1
+    assert "vEsPa" in trie
+    assert trie.complete("v") == ["Vespa"]
+    assert not trie.insert("  ")
+
+
+# A few brands and models
+VEHICLES = [
+    {'license_plate': 'ΙΚΥ-1001', 'brand': 'Toyota', 'model': 'Corolla'},
+    {'license_plate': 'ΙΚΥ-1002', 'brand': 'Toyota', 'model': 'Corolla'},
+    {'license_plate': 'ΙΚΥ-1003', 'brand': 'Toyota', 'model': 'C-HR'},
+    {'license_plate': 'ΙΚΥ-1004', 'brand': 'Fiat', 'model': 'Cinquecento'},
+    {'license_plate': 'ΙΚΥ-1005', 'brand': 'Zastava', 'model': 'Koral'},
+]
+
+
+def test_index_from_database(make_db):
+    db = make_db(VEHICLES)
+    assert ('Toyota', 'Corolla') in db.get_brand_models()
+    assert len(db.get_brand_models()) == 4
+
+    index = BrandModelIndex(["Fiat", "Toyota"])
+    assert not index.is_loaded(db)
+    index.load(db)
+    assert index.is_loaded(db)
+
+    # Database brands join the known ones; models stay per brand
+    assert index.suggest_brands("z") == ["Zastava"]
+    assert index.suggest_models("toyota", "c") == ["C-HR", "Corolla"]
+    assert index.suggest_models("Fiat", "c") == ["Cinquecento"]
+    assert index.suggest_models("Zastava", "c") == []
+    assert index.suggest_models("Unknown", "c") == []
+    assert index.suggest_models("", "c") == []
+
+    index.invalidate()
+    assert not index.is_loaded(db)
+
+
+def test_index_add():
+    index = BrandModelIndex(["Toyota"])
+    index.add("Toyota", "Yaris")
+    index.add("Lada", "Niva")
+    index.add("  ", "Ghost")
+    assert index.suggest_models("Toyota", "ya") == ["Yaris"]
+    assert index.suggest_brands("la") == ["Lada"]
+    assert index.suggest_models("LADA", "n") == ["Niva"]
+    assert index.suggest_brands("t", limit=1) == ["Toyota"]
+
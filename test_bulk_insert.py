@@ -0,0 +1,76 @@
+"""
+Tests: chunked bulk insert and its conflict reporting
+"""
+import sqlite3
+
+
+def vehicle(plate, **fields):
+    return {'license_plate': plate, 'brand': "Brand", 'model': "Model", **fields}
+
+
+def plates(db):
+    return [v['license_plate'] for v in sorted(db.get_all_vehicles(), key=lambda v: v['id'])]
+
+
+def test_ids_follow_input_order_across_chunks(make_db):
+    db = make_db()
+    # 10 rows in chunks of 3: two full chunks, a third, a one-row tail
+    ids, conflicts = db.add_vehicles_bulk((vehicle(f"C-{i:02d}") for i in range(10)), chunk_size=3)
+    assert conflicts == []
+    assert ids == list(range(1, 11))
+    assert plates(db) == [f"C-{i:02d}" for i in range(10)]
+    assert [db.get_vehicle_by_id(i)['license_plate'] for i in (3, 4, 10)] == ["C-02", "C-03", "C-09"]
+
+    assert db.add_vehicles_bulk([]) == ([], [])
+
+
+def test_duplicates_within_the_batch(make_db):
+    db = make_db()
+    # The second "D-1" is in the same chunk, the third in a later one
+    ids, conflicts = db.add_vehicles_bulk(
+        [vehicle("D-1"), vehicle("D-2"), vehicle("D-1", model="Other"), vehicle("D-3"), vehicle("D-1")],
+        chunk_size=3
+    )
+    assert ids == [1, 2, 3]
+    assert conflicts == [
+        {'index': 2, 'license_plate': "D-1", 'error': 'duplicate license_plate in import'},
+        {'index': 4, 'license_plate': "D-1", 'error': 'license_plate already exists'},
+    ]
+    assert db.get_vehicle_by_license("D-1")['model'] == "Model"
+
+
+def test_plates_already_stored(make_db):
+    db = make_db([vehicle("E-1"), vehicle("E-2")])
+    ids, conflicts = db.add_vehicles_bulk([vehicle("E-0"), vehicle("E-2"), vehicle("E-3")])
+    assert ids == [3, 4]
+    assert conflicts == [{'index': 1, 'license_plate': "E-2", 'error': 'license_plate already exists'}]
+    assert plates(db) == ["E-1", "E-2", "E-0", "E-3"]
+
+
+def test_constraint_failure_falls_back_to_single_rows(make_db):
+    db = make_db()
+    ids, conflicts = db.add_vehicles_bulk(
+        [vehicle("F-1"), vehicle("F-2", brand=None), vehicle("F-3"), vehicle("F-4", model=None)],
+        chunk_size=10
+    )
+    # The rest of the chunk is still inserted, in order
+    assert ids == [1, 2]
+    assert [conflict['index'] for conflict in conflicts] == [1, 3]
+    assert [conflict['license_plate'] for conflict in conflicts] == ["F-2", "F-4"]
+    assert "NOT NULL" in conflicts[0]['error'] and "brand" in conflicts[0]['error']
+    assert "model" in conflicts[1]['error']
+    assert plates(db) == ["F-1", "F-3"]
+    assert db.get_vehicle_by_id(ids[1])['license_plate'] == "F-3"
+
+    # Later chunks are unaffected
+    ids, conflicts = db.add_vehicles_bulk([vehicle("F-5")])
+    assert conflicts == [] and db.get_vehicle_by_id(ids[0])['license_plate'] == "F-5"
+
+
+def test_chunks_larger_than_the_variable_limit(make_db):
+    db = make_db([vehicle("G-0000")])
+    # The default limit of SQLite builds before 3.32
+    db.pool.writer.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    ids, conflicts = db.add_vehicles_bulk((vehicle(f"G-{i:04d}") for i in range(1500)), chunk_size=1500)
+    assert conflicts == [{'index': 0, 'license_plate': "G-0000", 'error': 'license_plate already exists'}]
+    assert ids == list(range(2, 1501))
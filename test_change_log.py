@@ -0,0 +1,70 @@
+"""
+Tests: vehicle change log and compaction
+"""
+
+
+def vehicle(plate):
+    return {'license_plate': plate, 'brand': "Brand", 'model': "Model"}
+
+
+def test_changes_are_logged_in_order(make_db):
+    db = make_db()
+    assert db.latest_change_seq() == 0
+    assert db.changes_since(0) == []
+
+    first = db.add_vehicle(vehicle("A"))
+    db.update_vehicle(first, {**db.get_vehicle_by_id(first), 'model': "Other"})
+    ids, _ = db.add_vehicles_bulk([vehicle("B"), vehicle("C")])
+    db.delete_vehicle("B")
+
+    changes = db.changes_since(0)
+    assert [(change.op, change.vehicle_id) for change in changes] == [
+        ('insert', first), ('update', first),
+        ('insert', ids[0]), ('insert', ids[1]), ('delete', ids[0]),
+    ]
+    assert [change.seq for change in changes] == [1, 2, 3, 4, 5]
+    assert db.latest_change_seq() == 5
+    assert db.changes_since(5) == []
+
+
+def test_compaction_keeps_latest_and_reports_truncation(make_db):
+    db = make_db()
+    vehicle_id = db.add_vehicle(vehicle("A"))
+    for model in ("X", "Y", "Z"):
+        db.update_vehicle(vehicle_id, {**db.get_vehicle_by_id(vehicle_id), 'model': model})
+    db.add_vehicles_bulk([vehicle(f"P-{i}") for i in range(5)])
+
+    # Superseded updates go; positions before them stay valid
+    assert db.compact_changes(keep=100) == 3
+    assert [change.seq for change in db.changes_since(0)] == [4, 5, 6, 7, 8, 9]
+
+    # Truncation makes older positions stale
+    db.compact_changes(keep=2)
+    assert db.changes_since(0) is None
+    assert db.changes_since(6) is None
+    assert [change.seq for change in db.changes_since(7)] == [8, 9]
+    assert db.latest_change_seq() == 9
+
+
+def test_changed_vehicles_since_a_position(make_db):
+    db = make_db()
+    ids, _ = db.add_vehicles_bulk([vehicle("A"), vehicle("B"), vehicle("C")])
+    seq = db.latest_change_seq()
+    assert db.get_changed_vehicles(seq) == (seq, {})
+
+    db.update_vehicle(ids[0], {**db.get_vehicle_by_id(ids[0]), 'model': "Other"})
+    db.update_vehicle(ids[0], {**db.get_vehicle_by_id(ids[0]), 'model': "Last"})
+    db.delete_vehicle("B")
+    new_id = db.add_vehicle(vehicle("D"))
+
+    latest, changed = db.get_changed_vehicles(seq, columns=('license_plate', 'model'))
+    assert latest == db.latest_change_seq()
+    assert changed == {
+        ids[0]: {'id': ids[0], 'license_plate': "A", 'model': "Last"},
+        ids[1]: None,
+        new_id: {'id': new_id, 'license_plate': "D", 'model': "Model"},
+    }
+
+    db.compact_changes(keep=1)
+    assert db.get_changed_vehicles(seq) is None
+
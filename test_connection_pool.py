@@ -0,0 +1,47 @@
+"""
+Tests: per-thread reader connections and their release
+"""
+import sqlite3
+import threading
+
+import pytest
+
+
+def run_in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+
+def test_reader_is_closed_when_its_thread_ends(make_db):
+    db = make_db([{'license_plate': "R-1", 'brand': "Fiat", 'model': "Panda"}])
+    before = list(db.pool._readers)
+    readers = []
+
+    def read():
+        readers.append(db.pool.reader())
+        assert db.get_vehicle_by_license("R-1")['model'] == "Panda"
+
+    run_in_thread(read)
+    run_in_thread(read)
+    assert readers[0] is not readers[1]
+    assert db.pool._readers == before
+    with pytest.raises(sqlite3.ProgrammingError):
+        readers[0].execute("SELECT 1")
+
+
+def test_release_reader(make_db):
+    db = make_db()
+    db.release_reader()
+    conn = db.pool.reader()
+    assert db.pool.reader() is conn
+    db.release_reader()
+    assert conn not in db.pool._readers
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    # The next read opens a fresh connection; releasing twice is harmless
+    assert db.pool.reader() is not conn
+    db.release_reader()
+    db.release_reader()
+    assert db.pool._readers == []
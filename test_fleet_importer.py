@@ -0,0 +1,168 @@
+"""
+Tests: streaming CSV/JSON fleet import and its rejects file
+"""
+import csv
+import json
+
+import pytest
+
+import utils.fleet_importer
+from utils.fleet_importer import import_file, iter_records
+from utils.vehicle_validator import normalize_vehicle, validate_vehicle
+
+VIN = "JTDBR32E720123456"
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def read_rejects(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_csv_import(make_db, tmp_path):
+    path = write(tmp_path / "fleet.csv", (
+        "license_plate,brand,model,year,vin_number,has_gps\n"
+        "ικυ-1234, Toyota ,Corolla,2018,jtdbr32e720123456,ναι\n"
+        "ΙΚΧ-5678,Fiat,Panda,,,\n"
+    ))
+    db = make_db()
+    summary = import_file(db, path, str(tmp_path / "rejects.csv"), workers=1)
+    assert summary == {'processed': 2, 'inserted': 2, 'rejected': 0, 'rejects_path': None}
+    vehicle = db.get_vehicle_by_license("ΙΚΥ-1234")
+    assert (vehicle['brand'], vehicle['year'], vehicle['vin_number'], vehicle['has_gps']) == ("Toyota", 2018, VIN, 1)
+    assert db.get_vehicle_by_license("ΙΚΧ-5678")['year'] is None
+
+
+def test_json_array_across_read_blocks(make_db, tmp_path, monkeypatch):
+    # Records longer than a read block still decode whole
+    monkeypatch.setattr(utils.fleet_importer, 'READ_BLOCK_SIZE', 16)
+    records = [{'license_plate': f"J-{i}", 'brand': "Fiat", 'model': "Panda", 'year': 2010 + i} for i in range(5)]
+    path = write(tmp_path / "fleet.json", " [\n" + ",\n".join(json.dumps(r) for r in records) + "\n]\n")
+    assert [record for _, record in iter_records(path)] == records
+
+    db = make_db()
+    summary = import_file(db, path, workers=1, chunk_size=2)
+    assert (summary['processed'], summary['inserted']) == (5, 5)
+    assert db.get_vehicle_by_license("J-4")['year'] == 2014
+
+
+def test_json_lines_and_rejects_file(make_db, tmp_path):
+    path = write(tmp_path / "fleet.jsonl", "\n".join([
+        json.dumps({'license_plate': "L-1", 'brand': "Fiat", 'model': "Uno"}),
+        "",
+        json.dumps({'license_plate': "L-2", 'brand': "Fiat"}),
+        json.dumps({'license_plate': "L-3", 'brand': "Fiat", 'model': "Tipo", 'year': "παλιό"}),
+        json.dumps(["not", "an", "object"]),
+        json.dumps({'license_plate': "L-1", 'brand': "Fiat", 'model': "Uno"}),
+    ]))
+    rejects_path = str(tmp_path / "rejects.csv")
+    db = make_db()
+    summary = import_file(db, path, rejects_path, workers=1)
+    assert summary == {'processed': 5, 'inserted': 1, 'rejected': 4, 'rejects_path': rejects_path}
+
+    rejects = read_rejects(rejects_path)
+    assert [reject['row'] for reject in rejects] == ["3", "4", "5", "6"]
+    assert rejects[0]['reasons'] == "Παρακαλώ εισάγετε μοντέλο!"
+    assert "year" in rejects[1]['reasons']
+    assert rejects[3]['reasons'] == "duplicate license_plate in import"
+    assert json.loads(rejects[0]['record'])['license_plate'] == "L-2"
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_malformed_json_line_is_rejected(make_db, tmp_path, workers):
+    path = write(tmp_path / "fleet.jsonl", "\n".join([
+        json.dumps({'license_plate': "M-1", 'brand': "Fiat", 'model': "Uno"}),
+        "{bad",
+        json.dumps({'license_plate': "M-2", 'brand': "Fiat", 'model': "Uno"}),
+    ]))
+    rejects_path = str(tmp_path / "rejects.csv")
+    db = make_db()
+    summary = import_file(db, path, rejects_path, workers=workers)
+    assert (summary['inserted'], summary['rejected']) == (2, 1)
+
+    [reject] = read_rejects(rejects_path)
+    assert reject['row'] == "2"
+    assert reject['reasons'].startswith("Μη έγκυρο JSON")
+    assert json.loads(reject['record']) == "{bad"
+
+
+def test_corrupt_json_array_fails_without_reading_on(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils.fleet_importer, 'READ_BLOCK_SIZE', 64)
+    monkeypatch.setattr(utils.fleet_importer, 'MAX_RECORD_SIZE', 256)
+    good = json.dumps({'license_plate': "K-1", 'brand': "Fiat", 'model': "Uno"})
+    path = write(tmp_path / "fleet.json", f"[{good}, {{\"license_plate\": \"K-2\" oops" + " " * 10000 + "]")
+
+    records = iter_records(path)
+    assert next(records)[0] == 1
+    with pytest.raises(ValueError, match="element 2"):
+        next(records)
+
+    path = write(tmp_path / "truncated.json", f"[{good}, {good[:20]}")
+    with pytest.raises(ValueError, match="element 2"):
+        list(iter_records(path))
+
+
+def test_non_object_array_elements_are_rejected(make_db, tmp_path, monkeypatch):
+    # Block boundaries inside a number must not split it
+    monkeypatch.setattr(utils.fleet_importer, 'READ_BLOCK_SIZE', 7)
+    good = json.dumps({'license_plate': "O-1", 'brand': "Fiat", 'model': "Uno"})
+    path = write(tmp_path / "fleet.json", f"[{good}, 1234567890, [1, 2], null,\n{good.replace('O-1', 'O-2')}]")
+    rejects_path = str(tmp_path / "rejects.csv")
+    db = make_db()
+    summary = import_file(db, path, rejects_path, workers=1)
+    assert (summary['inserted'], summary['rejected']) == (2, 3)
+
+    rejects = read_rejects(rejects_path)
+    assert [reject['row'] for reject in rejects] == ["2", "3", "4"]
+    assert [json.loads(reject['record']) for reject in rejects] == ["1234567890", "[1, 2]", "null"]
+    assert all(reject['reasons'].startswith("Μη έγκυρο JSON") for reject in rejects)
+
+
+@pytest.mark.parametrize('text, error', [
+    ('[{"a": 1} {"a": 2}]', "after element 1"),
+    ('[{"a": 1},, {"a": 2}]', "at element 2"),
+    ('[, {"a": 1}]', "at element 1"),
+    ('[{"a": 1},]', "at element 2"),
+    ('[{"a": 1}', "after element 1"),
+])
+def test_array_separators(tmp_path, text, error):
+    path = write(tmp_path / "fleet.json", text)
+    with pytest.raises(ValueError, match=error):
+        list(iter_records(path))
+
+
+def test_empty_array(tmp_path):
+    assert list(iter_records(write(tmp_path / "fleet.json", " [ ] "))) == []
+
+
+def test_non_string_fields():
+    # JSON numbers in text columns are stored as text
+    vehicle, errors = normalize_vehicle({'license_plate': 123, 'brand': "Fiat", 'model': 500, 'vin_number': 12345})
+    assert errors == []
+    assert (vehicle['license_plate'], vehicle['model'], vehicle['vin_number']) == ("123", "500", "12345")
+    assert [field for field, _ in validate_vehicle(vehicle)] == ['vin_number']
+
+    # Objects, lists and booleans are rejected, not stringified
+    _, errors = normalize_vehicle({'license_plate': "N-1", 'brand': ["Fiat"], 'color': {'r': 1}, 'notes': True})
+    assert [field for field, _ in errors] == ['brand', 'color', 'notes']
+
+    # Direct callers may pass a number
+    assert [field for field, _ in validate_vehicle(
+        {'license_plate': "N-2", 'brand': "Fiat", 'model': "Uno", 'vin_number': 42}
+    )] == ['vin_number']
+
+
+def test_non_string_fields_are_rejected_not_fatal(make_db, tmp_path):
+    path = write(tmp_path / "fleet.json", json.dumps([
+        {'license_plate': "V-1", 'brand': "Fiat", 'model': "Uno", 'vin_number': 12345},
+        {'license_plate': "V-2", 'brand': "Fiat", 'model': 500, 'vin_number': VIN},
+        {'license_plate': "V-3", 'brand': {'name': "Fiat"}, 'model': "Uno"},
+    ]))
+    db = make_db()
+    summary = import_file(db, path, str(tmp_path / "rejects.csv"), workers=1)
+    assert (summary['inserted'], summary['rejected']) == (1, 2)
+    assert db.get_vehicle_by_license("V-2")['model'] == "500"
@@ -0,0 +1,55 @@
+"""
+Tests: on-disk colorized icon atlases (needs PyQt6; runs offscreen)
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtGui = pytest.importorskip("PyQt6.QtGui")
+
+from utils.icon_atlas import IconAtlas
+
+COLORS = {'normal': "#2E3440", 'selected': "#FFFFFF"}
+
+
+@pytest.fixture
+def atlas(tmp_path):
+    """IconAtlas over two source icons, caching under tmp_path"""
+    app = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    for name in ("car", "gear"):
+        image = QtGui.QImage(128, 128, QtGui.QImage.Format.Format_ARGB32)
+        image.fill(QtGui.QColor("black"))
+        image.save(str(icons / f"{name}.png"))
+    yield IconAtlas(str(icons), cache_dir=str(tmp_path / "atlas"))
+    del app
+
+
+def test_atlases_of_each_color_are_kept(atlas, monkeypatch):
+    # IconManager builds a normal and a selected atlas per theme and DPR
+    for color in COLORS.values():
+        assert set(atlas.load("light", color, COLORS, 2.0)) == {"car", "gear"}
+    paths = [atlas.atlas_path("light", color, 2.0) for color in COLORS.values()]
+    assert all(os.path.exists(path) for path in paths)
+    assert sorted(os.listdir(atlas.cache_dir)) == sorted(os.path.basename(path) for path in paths)
+
+    # The next launch loads both from disk
+    def build(*args):
+        raise AssertionError("atlas rebuilt")
+    monkeypatch.setattr(atlas, 'build', build)
+    for color in COLORS.values():
+        pixmaps = atlas.load("light", color, COLORS, 2.0)
+        assert pixmaps["car"].devicePixelRatio() == 2.0
+
+
+def test_changed_colors_rebuild_in_place(atlas):
+    atlas.load("dark", "#ECEFF4", COLORS, 1.0)
+    path = atlas.atlas_path("dark", "#ECEFF4", 1.0)
+    before = os.path.getmtime(path)
+    os.utime(path, (before - 10, before - 10))
+
+    atlas.load("dark", "#ECEFF4", {**COLORS, 'normal': "#000000"}, 1.0)
+    assert os.path.getmtime(path) > before - 10
+    assert os.listdir(atlas.cache_dir) == [os.path.basename(path)]
@@ -0,0 +1,78 @@
+"""
+Tests: saving, loading and reconciling the vehicle list snapshot
+"""
+from database.db_manager import LIST_COLUMNS
+from utils.list_snapshot import load_snapshot, reconcile_snapshot, save_snapshot, snapshot_path
+
+
+VEHICLES = [
+    {'license_plate': f"SNP-{i:03d}", 'brand': "Brand", 'model': "Model", 'year': 2000 + i}
+    for i in range(20)
+]
+
+
+def take_snapshot(db, rows=10):
+    """What VehicleTableModel.snapshot() saves for the first rows"""
+    change_seq = db.latest_change_seq()
+    vehicles, next_key = db.get_vehicles_page(None, rows, columns=LIST_COLUMNS)
+    return {
+        'schema_version': db.schema_version(),
+        'change_seq': change_seq,
+        'columns': list(LIST_COLUMNS),
+        'sort_columns': [],
+        'rows': [[vehicle.get(column) for column in LIST_COLUMNS] for vehicle in vehicles],
+        'next_key': list(next_key),
+        'exhausted': False,
+        'scroll_row': 3,
+    }
+
+
+def test_round_trip_and_unusable_files(make_db):
+    db = make_db(VEHICLES)
+    snapshot = take_snapshot(db)
+    save_snapshot(db.db_path, snapshot)
+    loaded = load_snapshot(db.db_path)
+    assert loaded == {'format': 1, **snapshot}
+    assert reconcile_snapshot(db, loaded) == (snapshot['change_seq'], {})
+
+    with open(snapshot_path(db.db_path), 'w', encoding='utf-8') as f:
+        f.write('{"format": 1, "columns"')
+    assert load_snapshot(db.db_path) is None
+    save_snapshot(db.db_path, {**snapshot, 'columns': ['id']})
+    assert load_snapshot(db.db_path) is None
+    save_snapshot(db.db_path, {**snapshot, 'sort_columns': [['notes', False]]})
+    assert load_snapshot(db.db_path) is None
+
+
+def test_reconcile_returns_logged_changes(make_db):
+    db = make_db(VEHICLES)
+    snapshot = take_snapshot(db)
+    vehicle = db.get_vehicle_by_license("SNP-019")
+    db.update_vehicle(vehicle['id'], {**vehicle, 'model': "Other"})
+    db.delete_vehicle("SNP-018")
+
+    latest, changed = reconcile_snapshot(db, snapshot)
+    assert latest == db.latest_change_seq()
+    assert changed[vehicle['id']]['model'] == "Other"
+    assert list(changed.values())[1] is None
+
+
+def test_stale_snapshots_are_rejected(make_db):
+    db = make_db(VEHICLES)
+    snapshot = take_snapshot(db)
+    assert reconcile_snapshot(db, {**snapshot, 'schema_version': 1}) is None
+    # Database restored from an older copy
+    assert reconcile_snapshot(db, {**snapshot, 'change_seq': snapshot['change_seq'] + 5}) is None
+
+    # A row changed without a change-log entry
+    with db.pool.write() as conn:
+        conn.execute("UPDATE vehicles SET updated_at = '2000-01-01 00:00:00' WHERE id = 20")
+        conn.execute("DELETE FROM vehicle_changes WHERE seq > ?", (snapshot['change_seq'],))
+    assert reconcile_snapshot(db, snapshot) is None
+
+    # Log compacted past the snapshot position
+    snapshot = take_snapshot(db)
+    db.add_vehicle({'license_plate': "SNP-NEW", 'brand': "Brand", 'model': "Model"})
+    db.compact_changes(keep=0)
+    assert reconcile_snapshot(db, snapshot) is None
+
@@ -0,0 +1,181 @@
+"""
+Tests: user_version migrations and batched table rebuilds
+"""
+import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
+
+import pytest
+
+from database.connection_pool import ConnectionPool
+from database.db_manager import DatabaseManager, LIST_COLUMNS, VEHICLE_COLUMNS
+from database.migrations import (
+    EXPIRY_FIELDS, SORT_INDEX_COLUMNS, create_vehicles_table, get_version, latest_version, rebuild_table
+)
+
+SHIPPED_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fleet_manager.db")
+
+# Vehicles table as created before schema versioning
+LEGACY_SCHEMA = """
+    CREATE TABLE vehicles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        license_plate TEXT UNIQUE NOT NULL,
+        brand TEXT NOT NULL,
+        model TEXT NOT NULL,
+        year INTEGER,
+        vin TEXT,
+        color TEXT,
+        fuel_type TEXT,
+        mileage INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'Active',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+LEGACY_ROWS = 50
+
+
+def legacy_db(path):
+    """Pre-versioning database with LEGACY_ROWS vehicles"""
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO vehicles (license_plate, brand, model, year, vin, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(f"OLD-{i:03d}", "Fiat", f"Model {i % 4}", 2000 + i % 20, f"V{i}", f"2020-01-{i % 28 + 1:02d} 10:00:00")
+         for i in range(LEGACY_ROWS)]
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def schema_version(db):
+    return get_version(db.pool.reader())
+
+
+def columns(db):
+    return [column[1] for column in db.pool.reader().execute("PRAGMA table_info(vehicles)")]
+
+
+def indexes(db):
+    return {row[0] for row in db.pool.reader().execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_pre_versioning_database_is_upgraded(tmp_path):
+    path = legacy_db(str(tmp_path / "legacy.db"))
+    db = DatabaseManager(path)
+    try:
+        assert schema_version(db) == latest_version()
+
+        # New columns added, legacy ones and every row kept
+        assert set(name for name, _ in VEHICLE_COLUMNS) | {'created_at', 'updated_at', 'vin'} <= set(columns(db))
+        assert db.pool.reader().execute("SELECT COUNT(*) FROM vehicles").fetchone()[0] == LEGACY_ROWS
+        assert db.get_vehicle_by_license("OLD-007")['model'] == "Model 3"
+
+        expected_indexes = {'idx_vehicles_brand', 'idx_vehicles_status', 'idx_vehicles_gps', 'idx_vehicles_created_at'}
+        expected_indexes |= {f"idx_vehicles_{field}" for field in EXPIRY_FIELDS}
+        expected_indexes |= {f"idx_vehicles_sort_{column}" for column in SORT_INDEX_COLUMNS}
+        assert expected_indexes <= indexes(db)
+
+        # The list, search and sort queries work on the upgraded table
+        vehicles, _ = db.get_vehicles_page(None, 10, columns=LIST_COLUMNS)
+        assert len(vehicles) == 10
+        assert db.get_vehicles_page(None, 5, [('updated_at', True)], columns=('id',))[0]
+        if db.has_search_index:
+            assert len(db.search_vehicles("old", limit=None)) == LEGACY_ROWS
+    finally:
+        db.close()
+
+    # Up to date: reopening runs nothing
+    db = DatabaseManager(path)
+    assert schema_version(db) == latest_version()
+    db.close()
+
+
+def test_first_migration_adds_updated_at(tmp_path):
+    # The list query reads updated_at from v1 on, not only after the sort indexes
+    path = legacy_db(str(tmp_path / "legacy.db"))
+    conn = sqlite3.connect(path)
+    create_vehicles_table(conn)
+    conn.commit()
+    names = [column[1] for column in conn.execute("PRAGMA table_info(vehicles)")]
+    assert set(LIST_COLUMNS) <= set(names)
+    assert conn.execute("SELECT COUNT(*) FROM vehicles WHERE updated_at IS NOT created_at").fetchone()[0] == 0
+    conn.execute(f"SELECT {', '.join(LIST_COLUMNS)} FROM vehicles").fetchall()
+    conn.close()
+
+
+@pytest.mark.skipif(not os.path.exists(SHIPPED_DB), reason="no shipped database")
+def test_shipped_database_copy_is_upgraded(tmp_path):
+    path = str(tmp_path / "shipped.db")
+    shutil.copyfile(SHIPPED_DB, path)
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT COUNT(*) FROM vehicles").fetchone()[0]
+    conn.close()
+
+    db = DatabaseManager(path)
+    try:
+        assert schema_version(db) == latest_version()
+        vehicles, _ = db.get_vehicles_page(None, 10, columns=LIST_COLUMNS)
+        assert len(vehicles) == min(rows, 10)
+        assert db.pool.reader().execute("SELECT COUNT(*) FROM vehicles").fetchone()[0] == rows
+    finally:
+        db.close()
+
+
+class InterruptedPool:
+    """A pool whose Nth write transaction is preceded by another writer's"""
+
+    def __init__(self, pool, at, changes):
+        self.pool = pool
+        self.at = at
+        self.changes = changes
+        self.calls = 0
+
+    @contextmanager
+    def write(self):
+        self.calls += 1
+        if self.calls == self.at:
+            with self.pool.write() as conn:
+                self.changes(conn)
+        with self.pool.write() as conn:
+            yield conn
+
+
+def test_rebuild_table_in_batches_keeps_concurrent_writes(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "rebuild.db"))
+    with pool.write() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.executemany("INSERT INTO items (id, name) VALUES (?, ?)", [(i, f"item {i}") for i in range(1, 24)])
+        # Leftover of an interrupted rebuild
+        conn.execute("CREATE TABLE items__rebuild (junk TEXT)")
+
+    def changes(conn):
+        # After two batches: change a copied row, delete one, add one
+        conn.execute("UPDATE items SET name = 'changed' WHERE id = 1")
+        conn.execute("DELETE FROM items WHERE id = 2")
+        conn.execute("INSERT INTO items (id, name) VALUES (100, 'new')")
+
+    writer = InterruptedPool(pool, at=4, changes=changes)
+    rebuild_table(
+        writer, 'items',
+        "CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT NOT NULL, upper_name TEXT)",
+        ('id', 'name', 'upper_name'), version=7,
+        select_columns=('id', 'name', 'upper(name)'),
+        post_sql=("CREATE INDEX idx_items_name ON items (name)",),
+        batch_size=5
+    )
+    # Setup, five batches of 5 and the empty probe, then the swap
+    assert writer.calls == 8
+
+    conn = pool.writer
+    rows = conn.execute("SELECT id, name, upper_name FROM items ORDER BY id").fetchall()
+    assert [tuple(row) for row in rows[:2]] == [(1, 'changed', 'CHANGED'), (3, 'item 3', 'ITEM 3')]
+    assert [row[0] for row in rows] == [1] + list(range(3, 24)) + [100]
+    assert get_version(conn) == 7
+
+    objects = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert 'idx_items_name' in objects
+    assert not any("__rebuild" in name for name in objects)
+    pool.close()
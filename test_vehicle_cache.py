@@ -0,0 +1,138 @@
+"""
+Tests: read-through vehicle cache and LRU counters
+"""
+import sqlite3
+import threading
+
+from database.vehicle_cache import VehicleCache
+from utils.lru_cache import LRUCache
+
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['evictions'] == 1
+
+    sized = LRUCache(10, sizeof=len)
+    sized.put('x', "123456")
+    sized.put('y', "1234")
+    sized.put('z', "1")
+    assert 'x' not in sized and sized.size == 5
+
+    evicted = []
+    hooked = LRUCache(1, on_evict=lambda key, value: evicted.append((key, value)))
+    hooked.put('a', 1)
+    hooked.put('b', 2)
+    hooked.pop('b')
+    assert evicted == [('a', 1)]
+
+
+def test_reads_are_cached_and_writes_invalidate(make_db):
+    db = make_db()
+    vehicle_id = db.add_vehicle({'license_plate': "A-1", 'brand': "Fiat", 'model': "Panda"})
+
+    vehicle = db.get_vehicle_by_license("A-1")
+    assert db.get_vehicle_by_id(vehicle_id) is vehicle
+    assert db.cache_stats()['hits'] == 1
+
+    db.update_vehicle(vehicle_id, {**vehicle, 'license_plate': "A-2", 'model': "Tipo"})
+    assert db.get_vehicle_by_license("A-1") is None
+    assert db.get_vehicle_by_id(vehicle_id)['model'] == "Tipo"
+
+    db.queue_update_vehicle(vehicle_id, {**vehicle, 'license_plate': "A-2", 'model': "500"}).result()
+    assert db.get_vehicle_by_license("A-2")['model'] == "500"
+
+    db.delete_vehicle("A-2")
+    assert db.get_vehicle_by_id(vehicle_id) is None
+
+
+def test_id_and_plate_entries_are_evicted_together(make_db):
+    db = make_db([{'license_plate': plate, 'brand': "Fiat", 'model': "Panda"} for plate in ("A", "B", "C")])
+    db.vehicle_cache = cache = VehicleCache(db.pool, maxsize=2)
+    a = db.get_vehicle_by_id(1)
+    db.get_vehicle_by_id(2)
+    # A's plate entry is now recent but its id entry is the oldest
+    db.get_vehicle_by_license("A")
+    db.get_vehicle_by_id(3)
+    assert ('id', 1) not in cache.cache and ('plate', "A") not in cache.cache
+    assert ('id', 3) in cache.cache and ('plate', "C") in cache.cache
+
+    # A plate change then leaves no stale record under the old plate
+    db.update_vehicle(1, {**a, 'license_plate': "D"})
+    assert db.get_vehicle_by_license("A") is None
+    assert db.get_vehicle_by_license("D")['id'] == 1
+
+
+def test_cache_hits_do_not_wait_for_writes(make_db):
+    db = make_db([{'license_plate': "H-1", 'brand': "Fiat", 'model': "Panda"}])
+    vehicle = db.get_vehicle_by_id(1)
+
+    # Another thread holds the writer, as during a long import chunk
+    holding = threading.Event()
+    release = threading.Event()
+
+    def write():
+        with db.pool.write():
+            holding.set()
+            release.wait(5)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    holding.wait(5)
+    result = []
+    reader = threading.Thread(target=lambda: result.append(db.get_vehicle_by_id(1)))
+    reader.start()
+    reader.join(1)
+    finished = not reader.is_alive()
+    release.set()
+    writer.join()
+    reader.join()
+    assert finished and result == [vehicle]
+
+
+def test_external_writes_clear_the_cache(make_db):
+    db = make_db()
+    vehicle_id = db.add_vehicle({'license_plate': "B-1", 'brand': "Fiat", 'model': "Panda"})
+    assert db.get_vehicle_by_id(vehicle_id)['model'] == "Panda"
+
+    other = sqlite3.connect(db.db_path)
+    other.execute("UPDATE vehicles SET model = 'Uno' WHERE id = ?", (vehicle_id,))
+    other.commit()
+    other.close()
+
+    assert db.get_vehicle_by_id(vehicle_id)['model'] == "Uno"
+    assert db.cache_stats()['external_invalidations'] == 1
+
+
+def test_external_writes_are_seen_while_the_writer_is_held(make_db):
+    db = make_db([{'license_plate': "X-1", 'brand': "Fiat", 'model': "Panda"}])
+    assert db.get_vehicle_by_id(1)['model'] == "Panda"
+
+    other = sqlite3.connect(db.db_path)
+    other.execute("UPDATE vehicles SET model = 'Uno' WHERE id = 1")
+    other.commit()
+    other.close()
+
+    # The next read sees it, even with a write in flight and no pause since
+    holding = threading.Event()
+    release = threading.Event()
+
+    def write():
+        with db.pool.write():
+            holding.set()
+            release.wait(5)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    holding.wait(5)
+    try:
+        assert db.get_vehicle_by_id(1)['model'] == "Uno"
+    finally:
+        release.set()
+        writer.join()
@@ -0,0 +1,107 @@
+"""
+Tests: full-text vehicle search and its sync triggers
+"""
+from database.db_manager import search_terms
+from utils.vehicle_search import run_search
+
+
+# A handful of searchable vehicles
+VEHICLES = [
+    {'license_plate': 'ΙΚΥ-1234', 'brand': 'Toyota', 'model': 'Corolla',
+     'vin_number': 'JTDBR32E720123456', 'notes': 'Αλλαγή λαδιών τον Μάιο'},
+    {'license_plate': 'ΙΚΧ-5678', 'brand': 'Toyota', 'model': 'Yaris'},
+    {'license_plate': 'ΖΑΑ-9012', 'brand': 'Fiat', 'model': 'Panda',
+     'notes': 'Toyota ανταλλακτικά'},
+]
+
+
+def plates(vehicles):
+    return [vehicle['license_plate'] for vehicle in vehicles]
+
+
+def test_prefix_and_ranking(make_db):
+    db = make_db(VEHICLES)
+    assert db.has_search_index
+    # Brand matches rank above a mention in the notes
+    assert plates(db.search_vehicles('toy'))[-1] == 'ΖΑΑ-9012'
+    assert plates(db.search_vehicles('toyota yar')) == ['ΙΚΧ-5678']
+    assert plates(db.search_vehicles('jtdbr')) == ['ΙΚΥ-1234']
+    assert db.search_vehicles('  -- ') == []
+
+
+def test_plates_and_greek_text(make_db):
+    db = make_db(VEHICLES)
+    assert plates(db.search_vehicles('ικυ-12')) == ['ΙΚΥ-1234']
+    assert plates(db.search_vehicles('ΙΚΥ12')) == ['ΙΚΥ-1234']
+    # Accents are ignored on both sides
+    assert plates(db.search_vehicles('λαδιων')) == ['ΙΚΥ-1234']
+    assert plates(db.search_vehicles('ΑΛΛΑΓΉ')) == ['ΙΚΥ-1234']
+
+
+def test_index_follows_updates_and_deletes(make_db):
+    db = make_db(VEHICLES)
+    vehicle = db.get_vehicle_by_license('ΙΚΧ-5678')
+    db.update_vehicle(vehicle['id'], {**vehicle, 'model': 'Aygo'})
+    assert db.search_vehicles('yaris') == []
+    assert plates(db.search_vehicles('aygo')) == ['ΙΚΧ-5678']
+
+    db.delete_vehicle('ΙΚΧ-5678')
+    assert db.search_vehicles('aygo') == []
+    assert db.search_vehicles('toyota', columns=('license_plate',)) == [
+        {'id': 1, 'license_plate': 'ΙΚΥ-1234'},
+        {'id': 3, 'license_plate': 'ΖΑΑ-9012'},
+    ]
+
+
+def test_narrowing_matches_the_index(make_db):
+    db = make_db(VEHICLES)
+    result = run_search(db, 'toy')
+    assert result.ids == {1, 2, 3}
+    for query in ('toyota', 'toyota yar', 'toy ανταλ', 'toyota corolla λαδ'):
+        terms = search_terms(query)
+        assert result.refines(terms)
+        expected = {vehicle['id'] for vehicle in db.search_vehicles(query, limit=None)}
+        assert result.narrow(terms) == expected
+    # A different word cannot be answered from the loaded result
+    assert not result.refines(search_terms('fiat'))
+
+    # Over the narrowing limit only the ids are kept
+    assert not run_search(db, 'toy', narrow_limit=2).refines(search_terms('toyota'))
+
+
+def test_page_restricted_to_ids(make_db):
+    db = make_db(VEHICLES)
+    vehicles, next_key = db.get_vehicles_page(limit=1, ids=frozenset({1, 3}), order_by='id')
+    assert [vehicle['id'] for vehicle in vehicles] == [3]
+    vehicles, next_key = db.get_vehicles_page(next_key, limit=1, ids=frozenset({1, 3}), order_by='id')
+    assert [vehicle['id'] for vehicle in vehicles] == [1]
+    assert db.get_vehicles_page(next_key, limit=1, ids=[1, 3], order_by='id') == ([], None)
+
+
+def test_page_restricted_to_search(make_db):
+    db = make_db(VEHICLES)
+    vehicles, next_key = db.get_vehicles_page(limit=1, search='toyota', order_by='id')
+    assert [vehicle['id'] for vehicle in vehicles] == [3]
+    vehicles, next_key = db.get_vehicles_page(next_key, limit=2, search='toyota', order_by='id')
+    assert [vehicle['id'] for vehicle in vehicles] == [2, 1]
+    assert db.get_vehicles_page(limit=5, search=' -- ') == ([], None)
+
+    # Vehicles added later match without a new search
+    db.add_vehicle({'license_plate': 'ΥΧΒ-1111', 'brand': 'Toyota', 'model': 'Aygo'})
+    vehicles, _ = db.get_vehicles_page(limit=5, search='toyota ay', order_by='id')
+    assert plates(vehicles) == ['ΥΧΒ-1111']
+
+
+def test_changed_vehicles_outside_search(make_db):
+    db = make_db(VEHICLES)
+    seq = db.latest_change_seq()
+    yaris = db.get_vehicle_by_license('ΙΚΧ-5678')
+    db.update_vehicle(yaris['id'], {**yaris, 'brand': 'Lexus'})
+    db.add_vehicle({'license_plate': 'ΥΧΒ-1111', 'brand': 'Toyota', 'model': 'Aygo'})
+
+    # No longer matching reads as removed; new matches are returned
+    latest_seq, changed = db.get_changed_vehicles(seq, columns=('license_plate',), search='toyota')
+    assert latest_seq == db.latest_change_seq()
+    assert changed[yaris['id']] is None
+    assert [vehicle['license_plate'] for vehicle in changed.values() if vehicle] == ['ΥΧΒ-1111']
+    assert db.get_changed_vehicles(seq)[1][yaris['id']]['brand'] == 'Lexus'
@@ -0,0 +1,81 @@
+"""
+Tests: sorted keyset paging of the vehicles list
+"""
+from functools import cmp_to_key
+
+from database.db_manager import sort_order
+
+
+def fleet():
+    """Vehicles whose sort columns have ties and NULLs"""
+    return (
+        {
+            'license_plate': f"SRT-{i:03d}",
+            'brand': "ABC"[i % 3],
+            'model': "xyz"[i * 7 % 3],
+            'year': (None, 2001, 2005, 2003)[i % 4],
+            'mileage': (None, 500, 100)[i * 5 % 3] if i % 5 else None,
+            'kteo_next': None if i % 6 == 0 else f"2026-0{i % 9 + 1}-01",
+        }
+        for i in range(60)
+    )
+
+
+def compare(a, b, order):
+    """Python version of SQLite's ORDER BY (NULLs smallest)"""
+    for column, descending in order:
+        x, y = a[column], b[column]
+        if x == y:
+            continue
+        result = -1 if x is None or (y is not None and x < y) else 1
+        return -result if descending else result
+    return 0
+
+
+def all_pages(db, order, limit=7):
+    ids = []
+    key = None
+    while True:
+        vehicles, key = db.get_vehicles_page(key, limit, order, columns=('id',))
+        ids.extend(vehicle['id'] for vehicle in vehicles)
+        if key is None:
+            return ids
+
+
+def test_pages_follow_multi_column_order_with_nulls(make_db):
+    db = make_db(fleet())
+    vehicles = db.get_all_vehicles()
+    for order in (
+        [('year', False)],
+        [('year', True)],
+        [('mileage', True), ('year', False)],
+        [('brand', False), ('model', True)],
+        [('kteo_next', True), ('brand', True), ('year', True)],
+        [('license_plate', False)],
+    ):
+        full_order = sort_order(order)
+        expected = sorted(vehicles, key=cmp_to_key(lambda a, b: compare(a, b, full_order)))
+        assert all_pages(db, order) == [vehicle['id'] for vehicle in expected], order
+
+
+def test_sorting_combines_with_id_filter(make_db):
+    db = make_db(fleet())
+    ids = [vehicle['id'] for vehicle in db.search_vehicles('srt', limit=None) if vehicle['brand'] == 'B']
+    assert len(ids) == 20
+    vehicles, _ = db.get_vehicles_page(
+        None, 100, [('year', True)], columns=('year',), ids=ids
+    )
+    assert sorted(vehicle['id'] for vehicle in vehicles) == sorted(ids)
+    years = [vehicle['year'] for vehicle in vehicles]
+    assert years == sorted(years, key=lambda year: (year is not None, year), reverse=True)
+
+
+def test_unknown_sort_column_is_rejected(make_db):
+    db = make_db(fleet())
+    try:
+        db.get_vehicles_page(None, 10, [('notes', False)])
+    except ValueError:
+        pass
+    else:
+        assert False, "notes is not a sort column"
+
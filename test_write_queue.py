@@ -0,0 +1,43 @@
+"""
+Tests: group-commit write queue
+"""
+import sqlite3
+
+
+def vehicle(plate):
+    return {'license_plate': plate, 'brand': "Brand", 'model': "Model"}
+
+
+def test_queued_writes_commit_in_groups(make_db):
+    db = make_db()
+    futures = [db.queue_add_vehicle(vehicle(f"Q-{i}")) for i in range(300)]
+    db.flush()
+    assert [future.result() for future in futures] == list(range(1, 301))
+    assert db.write_queue.writes == 300
+    assert db.write_queue.commits < 300
+    db.close()
+
+    # flush() and close() mean the writes are on disk
+    db = make_db()
+    assert len(db.get_all_vehicles()) == 300
+
+
+def test_failed_write_is_reported_and_isolated(make_db):
+    db = make_db()
+    first = db.queue_add_vehicle(vehicle("A"))
+    duplicate = db.queue_add_vehicle(vehicle("A"))
+    second = db.queue_add_vehicle(vehicle("B"))
+    db.flush()
+    assert isinstance(duplicate.exception(), sqlite3.IntegrityError)
+    assert first.result() and second.result()
+
+    # The blocking API goes through the queue and raises as before
+    try:
+        db.add_vehicle(vehicle("B"))
+        assert False, "duplicate plate was accepted"
+    except sqlite3.IntegrityError:
+        pass
+    db.queue_delete_vehicle("A")
+    db.flush()
+    assert [v['license_plate'] for v in db.get_all_vehicles()] == ["B"]
+
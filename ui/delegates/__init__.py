@@ -0,0 +1,3 @@
+from .brand_logo_delegate import BrandLogoDelegate
+
+__all__ = ['BrandLogoDelegate']
@@ -0,0 +1,64 @@
+"""
+Brand Logo Delegate - Brand column cells with the brand's logo
+
+Paints the logo as the cell's decoration, so no widget is created per row.
+Logos come from the shared brand_logo_cache: a cell whose logo is still
+being decoded (or that has none) shows a placeholder, and the view is
+repainted when the logo arrives.
+"""
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+from utils.brand_logo_cache import brand_logo_cache
+
+# Logical size of the logos
+LOGO_SIZE = 20
+
+PLACEHOLDER_COLOR = "#D8DEE9"
+
+
+class BrandLogoDelegate(QStyledItemDelegate):
+    """Draws a brand logo before the brand name"""
+
+    def __init__(self, view, cache=brand_logo_cache, logo_size=LOGO_SIZE):
+        super().__init__(view)
+        self.view = view
+        self.cache = cache
+        self.logo_size = logo_size
+        # Placeholder icon per device pixel ratio
+        self.placeholders = {}
+        cache.logo_ready.connect(self.on_logo_ready)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        brand = index.data(Qt.ItemDataRole.DisplayRole)
+        if not brand:
+            return
+        dpr = self.view.devicePixelRatioF()
+        pixmap = self.cache.logo(brand, self.logo_size, dpr)
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        option.decorationSize = QSize(self.logo_size, self.logo_size)
+        option.icon = QIcon(pixmap) if pixmap is not None else self.placeholder(dpr)
+
+    def placeholder(self, dpr):
+        """Rounded square shown until (or instead of) a logo"""
+        icon = self.placeholders.get(dpr)
+        if icon is None:
+            size = round(self.logo_size * dpr)
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(PLACEHOLDER_COLOR))
+            painter.drawRoundedRect(0, 0, size, size, size / 4, size / 4)
+            painter.end()
+            pixmap.setDevicePixelRatio(dpr)
+            icon = QIcon(pixmap)
+            self.placeholders[dpr] = icon
+        return icon
+
+    def on_logo_ready(self, brand):
+        """Repaint the visible rows (repaints are coalesced by Qt)"""
+        self.view.viewport().update()
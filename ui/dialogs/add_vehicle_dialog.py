@@ -9,14 +9,17 @@ from PyQt6.QtWidgets import (
     QFileDialog, QScrollArea, QWidget
     
 )
-from PyQt6.QtCore import Qt, QDate, QSize
+from PyQt6.QtCore import Qt, QDate, QSize, QStringListModel
 from PyQt6.QtGui import QIcon
 from utils.translator import translator
 from utils.icon_manager import icon_manager
+from ui.style_engine import style_engine
 from PyQt6.QtWidgets import QCheckBox
 from PyQt6.QtWidgets import QCompleter 
-from utils.brand_manager import BrandManager
+from utils.brand_manager import BrandManager, brand_model_index
 from utils.config import Config
+from utils.vehicle_validator import validate_vehicle
+from database.async_db import dispatch
 import os
 import shutil
 
@@ -31,14 +34,17 @@ class AddVehicleDialog(QDialog):
         self.insurance_file_path = None
         self.kteo_file_path = None
         
+        # Styled by the application stylesheet (ui/stylesheets.py)
+        self.setObjectName("addVehicleDialog")
         self.init_ui()
         self.apply_translations()
         
-        # Apply theme
-        if hasattr(parent, 'theme_manager'):
-            self.apply_theme(parent.theme_manager.current_theme)
-        else:
-            self.apply_theme("light")
+        # Brands and models already in the fleet, loaded once per database
+        if not brand_model_index.is_loaded(db):
+            dispatch(
+                getattr(parent, 'async_db', None), brand_model_index.load, db,
+                error_callback=self.on_index_failed
+            )
     
     def init_ui(self):
         """Initialize UI"""
@@ -52,13 +58,6 @@ class AddVehicleDialog(QDialog):
         
         container = QWidget()
         container.setObjectName("mainContainer")
-        container.setStyleSheet("""
-            QWidget#mainContainer {
-                background-color: white;
-                border: 1px solid #E5E9F0;
-                border-radius: 12px;
-            }
-        """)
         
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(25, 25, 25, 25)
@@ -78,39 +77,11 @@ class AddVehicleDialog(QDialog):
         scroll.setWidget(container)
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.Shape.NoFrame)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #ECEFF4;
-                width: 8px;
-                margin: 0px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #D8DEE9;
-                min-height: 30px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #5E81AC;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
 
         main_layout.addWidget(scroll, 1)
         
         button_container = QWidget()
-        button_container.setStyleSheet("QWidget { background-color: transparent; border-top: 1px solid #E5E9F0; border-radius: 0px; }")
+        button_container.setObjectName("buttonBar")
         button_layout = self.create_bottom_buttons()
         button_container.setLayout(button_layout)
         main_layout.addWidget(button_container)
@@ -130,7 +101,6 @@ class AddVehicleDialog(QDialog):
         
         title_label = QLabel(title)
         title_label.setObjectName("headerTitle")
-        title_label.setStyleSheet("QLabel#headerTitle { font-size: 13px; font-weight: 600; color: #2E3440; border: none; background: transparent; }")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         
@@ -140,7 +110,6 @@ class AddVehicleDialog(QDialog):
         """Πληροφορίες Οχήματος"""
         section = QWidget()
         section.setObjectName("borderedSection")
-        section.setStyleSheet("QWidget#borderedSection { background-color: transparent; border: 1px solid #E5E9F0; border-radius: 8px; }")
         
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
@@ -166,9 +135,9 @@ class AddVehicleDialog(QDialog):
         self.brand_field.addItems(BrandManager.get_all_brands())
         self.brand_field.setCurrentIndex(-1)
         self.brand_field.setPlaceholderText("Επιλέξτε ή γράψτε μάρκα")
-        self.brand_field.setCompleter(QCompleter(BrandManager.get_all_brands()))
-        self.brand_field.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self.brand_field.completer().setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.brand_completer = self.create_completer()
+        self.brand_field.setCompleter(self.brand_completer)
+        self.brand_field.lineEdit().textEdited.connect(self.on_brand_edited)
         self.brand_field.setMinimumWidth(180)
         grid.addWidget(self.brand_field, 0, 1)
         
@@ -180,6 +149,9 @@ class AddVehicleDialog(QDialog):
         self.model_field = QLineEdit()
         self.model_field.setPlaceholderText("π.χ. Corolla")
         self.model_field.setMinimumWidth(180)
+        self.model_completer = self.create_completer()
+        self.model_field.setCompleter(self.model_completer)
+        self.model_field.textEdited.connect(self.on_model_edited)
         grid.addWidget(self.model_field, 0, 3)
         
         self.license_label = QLabel("Αρ. Κυκλοφορίας:")
@@ -279,30 +251,6 @@ class AddVehicleDialog(QDialog):
         gps_layout.addStretch(1)
         
         self.gps_checkbox = QCheckBox("Διαθέτει GPS Tracker")
-        self.gps_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #4C566A;
-                font-size: 12px;
-                font-weight: 500;
-                spacing: 8px;
-                background: transparent;
-                border: none;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #D8DEE9;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #5E81AC;
-                border-color: #5E81AC;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #5E81AC;
-            }
-        """)
         gps_layout.addWidget(self.gps_checkbox)
         gps_layout.addStretch(1)
         
@@ -313,12 +261,10 @@ class AddVehicleDialog(QDialog):
         licence_layout.setSpacing(8)
 
         licence_title = QLabel("Άδεια Κυκλοφορίας:")
-        licence_title.setStyleSheet("color: #4C566A; font-size: 12px; font-weight: 500; border: none;")
         licence_layout.addWidget(licence_title)
 
         self.licence_label = QLabel("Δεν έχει επισυναφθεί αρχείο")
         self.licence_label.setObjectName("fileLabel")
-        self.licence_label.setStyleSheet("color: #95a5a6; font-style: italic; font-size: 11px; border: none;")
         licence_layout.addWidget(self.licence_label, 1)
 
         self.licence_attach_btn = QPushButton()
@@ -327,19 +273,6 @@ class AddVehicleDialog(QDialog):
         self.licence_attach_btn.clicked.connect(lambda: self.upload_document('licence'))
         self.licence_attach_btn.setFixedSize(32, 32)
         self.licence_attach_btn.setToolTip("Επισύναψη αρχείου")
-        self.licence_attach_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(94, 129, 172, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(94, 129, 172, 0.2);
-            }
-        """)
         licence_layout.addWidget(self.licence_attach_btn)
 
         self.licence_remove_btn = QPushButton()
@@ -349,22 +282,7 @@ class AddVehicleDialog(QDialog):
         self.licence_remove_btn.setEnabled(False)
         self.licence_remove_btn.setFixedSize(32, 32)
         self.licence_remove_btn.setToolTip("Αφαίρεση αρχείου")
-        self.licence_remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(191, 97, 106, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(191, 97, 106, 0.2);
-            }
-            QPushButton:disabled {
-                opacity: 0.5;
-            }
-        """)
+        self.licence_remove_btn.setObjectName("removeButton")
         licence_layout.addWidget(self.licence_remove_btn)
 
         grid.addLayout(licence_layout, 3, 4, 1, 2)
@@ -380,7 +298,6 @@ class AddVehicleDialog(QDialog):
         """Ασφαλιστήριο"""
         section = QWidget()
         section.setObjectName("borderedSection")
-        section.setStyleSheet("QWidget#borderedSection { background-color: transparent; border: 1px solid #E5E9F0; border-radius: 8px; }")
         
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
@@ -427,12 +344,10 @@ class AddVehicleDialog(QDialog):
         insurance_layout.setSpacing(8)
         
         insurance_title = QLabel("Ασφαλιστήριο:")
-        insurance_title.setStyleSheet("color: #4C566A; font-size: 12px; font-weight: 500; border: none;")
         insurance_layout.addWidget(insurance_title)
         
         self.insurance_label = QLabel("Δεν έχει επισυναφθεί αρχείο")
         self.insurance_label.setObjectName("fileLabel")
-        self.insurance_label.setStyleSheet("color: #95a5a6; font-style: italic; font-size: 11px; border: none;")
         insurance_layout.addWidget(self.insurance_label, 1)
         
         self.insurance_attach_btn = QPushButton()
@@ -441,19 +356,6 @@ class AddVehicleDialog(QDialog):
         self.insurance_attach_btn.clicked.connect(lambda: self.upload_document('insurance'))
         self.insurance_attach_btn.setFixedSize(32, 32)
         self.insurance_attach_btn.setToolTip("Επισύναψη αρχείου")
-        self.insurance_attach_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(94, 129, 172, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(94, 129, 172, 0.2);
-            }
-        """)
         insurance_layout.addWidget(self.insurance_attach_btn)
         
         self.insurance_remove_btn = QPushButton()
@@ -463,22 +365,7 @@ class AddVehicleDialog(QDialog):
         self.insurance_remove_btn.setEnabled(False)
         self.insurance_remove_btn.setFixedSize(32, 32)
         self.insurance_remove_btn.setToolTip("Αφαίρεση αρχείου")
-        self.insurance_remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(191, 97, 106, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(191, 97, 106, 0.2);
-            }
-            QPushButton:disabled {
-                opacity: 0.5;
-            }
-        """)
+        self.insurance_remove_btn.setObjectName("removeButton")
         insurance_layout.addWidget(self.insurance_remove_btn)
         
         grid.addLayout(insurance_layout, 1, 4, 1, 2)
@@ -494,7 +381,6 @@ class AddVehicleDialog(QDialog):
         """KTEO"""
         section = QWidget()
         section.setObjectName("borderedSection")
-        section.setStyleSheet("QWidget#borderedSection { background-color: transparent; border: 1px solid #E5E9F0; border-radius: 8px; }")
         
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
@@ -541,12 +427,10 @@ class AddVehicleDialog(QDialog):
         kteo_layout.setSpacing(8)
         
         kteo_title = QLabel("ΚΤΕΟ:")
-        kteo_title.setStyleSheet("color: #4C566A; font-size: 12px; font-weight: 500; border: none;")
         kteo_layout.addWidget(kteo_title)
         
         self.kteo_label = QLabel("Δεν έχει επισυναφθεί αρχείο")
         self.kteo_label.setObjectName("fileLabel")
-        self.kteo_label.setStyleSheet("color: #95a5a6; font-style: italic; font-size: 11px; border: none;")
         kteo_layout.addWidget(self.kteo_label, 1)
         
         self.kteo_attach_btn = QPushButton()
@@ -555,19 +439,6 @@ class AddVehicleDialog(QDialog):
         self.kteo_attach_btn.clicked.connect(lambda: self.upload_document('kteo'))
         self.kteo_attach_btn.setFixedSize(32, 32)
         self.kteo_attach_btn.setToolTip("Επισύναψη αρχείου")
-        self.kteo_attach_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(94, 129, 172, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(94, 129, 172, 0.2);
-            }
-        """)
         kteo_layout.addWidget(self.kteo_attach_btn)
         
         self.kteo_remove_btn = QPushButton()
@@ -577,22 +448,7 @@ class AddVehicleDialog(QDialog):
         self.kteo_remove_btn.setEnabled(False)
         self.kteo_remove_btn.setFixedSize(32, 32)
         self.kteo_remove_btn.setToolTip("Αφαίρεση αρχείου")
-        self.kteo_remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(191, 97, 106, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(191, 97, 106, 0.2);
-            }
-            QPushButton:disabled {
-                opacity: 0.5;
-            }
-        """)
+        self.kteo_remove_btn.setObjectName("removeButton")
         kteo_layout.addWidget(self.kteo_remove_btn)
         
         grid.addLayout(kteo_layout, 1, 4, 1, 2)
@@ -608,7 +464,6 @@ class AddVehicleDialog(QDialog):
         """KEK"""
         section = QWidget()
         section.setObjectName("borderedSection")
-        section.setStyleSheet("QWidget#borderedSection { background-color: transparent; border: 1px solid #E5E9F0; border-radius: 8px; }")
         
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
@@ -661,7 +516,6 @@ class AddVehicleDialog(QDialog):
         """Σημειώσεις"""
         section = QWidget()
         section.setObjectName("borderedSection")
-        section.setStyleSheet("QWidget#borderedSection { background-color: transparent; border: 1px solid #E5E9F0; border-radius: 8px; }")
         
         layout = QVBoxLayout(section)
         layout.setSpacing(15)
@@ -687,380 +541,17 @@ class AddVehicleDialog(QDialog):
         self.cancel_btn = QPushButton("Ακύρωση")
         self.cancel_btn.clicked.connect(self.reject)
         self.cancel_btn.setFixedSize(120, 40)
-        self.cancel_btn.setStyleSheet("QPushButton { background-color: #E5E9F0; color: #2E3440; border: none; border-radius: 6px; font-weight: 600; font-size: 13px; } QPushButton:hover { background-color: #D8DEE9; }")
+        self.cancel_btn.setObjectName("cancelButton")
         layout.addWidget(self.cancel_btn)
         
         self.save_btn = QPushButton("Δημιουργία")
         self.save_btn.clicked.connect(self.save_vehicle)
         self.save_btn.setFixedSize(120, 40)
-        self.save_btn.setStyleSheet("QPushButton { background-color: #5E81AC; color: white; border: none; border-radius: 6px; font-weight: 600; font-size: 13px; } QPushButton:hover { background-color: #81A1C1; }")
+        self.save_btn.setObjectName("saveButton")
         layout.addWidget(self.save_btn)
         
         return layout
 
-    def apply_theme(self, theme="light"):
-        """Apply theme to dialog with icon support"""
-        # Get icon paths
-        chevron_down = icon_manager.get_icon_path_for_css("chevron-down")
-        chevron_up = icon_manager.get_icon_path_for_css("chevron-up")
-        calendar = icon_manager.get_icon_path_for_css("calendar")
-        
-        if theme == "dark":
-            # DARK THEME
-            self.setStyleSheet(f"""
-                QDialog {{
-                    background-color: #2E3440;
-                }}
-                QWidget#mainContainer {{
-                    background-color: #3B4252;
-                    border: 1px solid #4C566A;
-                    border-radius: 12px;
-                }}
-                QWidget#borderedSection {{
-                    background-color: transparent;
-                    border: 1px solid #4C566A;
-                    border-radius: 8px;
-                }}
-                QLabel {{
-                    color: #ECEFF4;
-                    font-size: 12px;
-                    font-weight: 500;
-                    background: transparent;
-                    border: none;
-                }}
-                QLabel#fileLabel {{
-                    color: #D8DEE9;
-                    font-style: italic;
-                    font-size: 11px;
-                }}
-                QLineEdit, QSpinBox, QComboBox, QDateEdit, QTextEdit {{
-                    border: 1px solid #4C566A;
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    background-color: #434C5E;
-                    color: #ECEFF4;
-                    font-size: 13px;
-                }}
-                QLineEdit:focus, QSpinBox:focus, QComboBox:focus, QDateEdit:focus, QTextEdit:focus {{
-                    border: 2px solid #88C0D0;
-                    padding: 5px 11px;
-                }}
-                QLineEdit::placeholder, QTextEdit::placeholder {{
-                    color: #616E88;
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                    background: transparent;
-                    width: 20px;
-                }}
-                QComboBox::down-arrow {{
-                    image: url({chevron_down});
-                    width: 12px;
-                    height: 12px;
-                }}
-                QComboBox QAbstractItemView {{
-                    background-color: #434C5E;
-                    color: #ECEFF4;
-                    border: 1px solid #4C566A;
-                    selection-background-color: #5E81AC;
-                }}
-                QDateEdit::drop-down {{
-                    border: none;
-                    background: transparent;
-                    width: 20px;
-                }}
-                QDateEdit::down-arrow {{
-                    image: url({calendar});
-                    width: 12px;
-                    height: 12px;
-                }}
-                QSpinBox::up-button {{
-                    background: transparent;
-                    border: none;
-                }}
-                QSpinBox::down-button {{
-                    background: transparent;
-                    border: none;
-                }}
-                QSpinBox::up-arrow {{
-                    image: url({chevron_up});
-                    width: 10px;
-                    height: 10px;
-                }}
-                QSpinBox::down-arrow {{
-                    image: url({chevron_down});
-                    width: 10px;
-                    height: 10px;
-                }}
-                QCheckBox {{
-                    color: #ECEFF4;
-                    font-size: 12px;
-                    font-weight: 500;
-                    spacing: 8px;
-                    background: transparent;
-                    border: none;
-                }}
-                QCheckBox::indicator {{
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #4C566A;
-                    border-radius: 3px;
-                    background-color: #434C5E;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: #88C0D0;
-                    border-color: #88C0D0;
-                }}
-                QCheckBox::indicator:hover {{
-                    border-color: #88C0D0;
-                }}
-                QPushButton {{
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(136, 192, 208, 0.1);
-                }}
-                QPushButton:pressed {{
-                    background-color: rgba(136, 192, 208, 0.2);
-                }}
-                QPushButton#saveButton {{
-                    background-color: #88C0D0;
-                    color: #2E3440;
-                    border: none;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                }}
-                QPushButton#saveButton:hover {{
-                    background-color: #8FBCBB;
-                }}
-                QPushButton#saveButton:pressed {{
-                    background-color: #81A1C1;
-                }}
-                QPushButton#cancelButton {{
-                    background-color: #4C566A;
-                    color: #ECEFF4;
-                    border: 1px solid #5E6875;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                }}
-                QPushButton#cancelButton:hover {{
-                    background-color: #5E6875;
-                }}
-                QPushButton#cancelButton:pressed {{
-                    background-color: #434C5E;
-                }}
-                QScrollArea {{
-                    background-color: transparent;
-                    border: none;
-                }}
-                QScrollBar:vertical {{
-                    background-color: #3B4252;
-                    width: 8px;
-                    margin: 0px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background-color: #4C566A;
-                    min-height: 30px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::handle:vertical:hover {{
-                    background-color: #5E81AC;
-                }}
-                QScrollBar::add-line:vertical,
-                QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                }}
-                QScrollBar::add-page:vertical,
-                QScrollBar::sub-page:vertical {{
-                    background: none;
-                }}
-            """)
-        else:
-            # LIGHT THEME
-            self.setStyleSheet(f"""
-                QDialog {{
-                    background-color: #F5F7FA;
-                }}
-                QWidget#mainContainer {{
-                    background-color: white;
-                    border: 1px solid #E5E9F0;
-                    border-radius: 12px;
-                }}
-                QWidget#borderedSection {{
-                    background-color: transparent;
-                    border: 1px solid #E5E9F0;
-                    border-radius: 8px;
-                }}
-                QLabel {{
-                    color: #4C566A;
-                    font-size: 12px;
-                    font-weight: 500;
-                    background: transparent;
-                    border: none;
-                }}
-                QLabel#fileLabel {{
-                    color: #95a5a6;
-                    font-style: italic;
-                    font-size: 11px;
-                }}
-                QLineEdit, QSpinBox, QComboBox, QDateEdit, QTextEdit {{
-                    border: 1px solid #D8DEE9;
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    background-color: white;
-                    color: #2E3440;
-                    font-size: 13px;
-                }}
-                QLineEdit:focus, QSpinBox:focus, QComboBox:focus, QDateEdit:focus, QTextEdit:focus {{
-                    border: 2px solid #5E81AC;
-                    padding: 5px 11px;
-                }}
-                QLineEdit::placeholder, QTextEdit::placeholder {{
-                    color: #A0AEC0;
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                    background: transparent;
-                    width: 20px;
-                }}
-                QComboBox::down-arrow {{
-                    image: url({chevron_down});
-                    width: 12px;
-                    height: 12px;
-                }}
-                QComboBox QAbstractItemView {{
-                    background-color: white;
-                    color: #2E3440;
-                    border: 1px solid #D8DEE9;
-                    selection-background-color: #5E81AC;
-                    selection-color: white;
-                }}
-                QDateEdit::drop-down {{
-                    border: none;
-                    background: transparent;
-                    width: 20px;
-                }}
-                QDateEdit::down-arrow {{
-                    image: url({calendar});
-                    width: 12px;
-                    height: 12px;
-                }}
-                QSpinBox::up-button {{
-                    background: transparent;
-                    border: none;
-                }}
-                QSpinBox::down-button {{
-                    background: transparent;
-                    border: none;
-                }}
-                QSpinBox::up-arrow {{
-                    image: url({chevron_up});
-                    width: 10px;
-                    height: 10px;
-                }}
-                QSpinBox::down-arrow {{
-                    image: url({chevron_down});
-                    width: 10px;
-                    height: 10px;
-                }}
-                QCheckBox {{
-                    color: #4C566A;
-                    font-size: 12px;
-                    font-weight: 500;
-                    spacing: 8px;
-                    background: transparent;
-                    border: none;
-                }}
-                QCheckBox::indicator {{
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #D8DEE9;
-                    border-radius: 3px;
-                    background-color: white;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: #5E81AC;
-                    border-color: #5E81AC;
-                }}
-                QCheckBox::indicator:hover {{
-                    border-color: #5E81AC;
-                }}
-                QPushButton {{
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(94, 129, 172, 0.1);
-                }}
-                QPushButton:pressed {{
-                    background-color: rgba(94, 129, 172, 0.2);
-                }}
-                QPushButton#saveButton {{
-                    background-color: #5E81AC;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                }}
-                QPushButton#saveButton:hover {{
-                    background-color: #81A1C1;
-                }}
-                QPushButton#saveButton:pressed {{
-                    background-color: #4C7AA0;
-                }}
-                QPushButton#cancelButton {{
-                    background-color: #ECEFF4;
-                    color: #4C566A;
-                    border: 1px solid #D8DEE9;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                }}
-                QPushButton#cancelButton:hover {{
-                    background-color: #E5E9F0;
-                }}
-                QPushButton#cancelButton:pressed {{
-                    background-color: #D8DEE9;
-                }}
-                QScrollArea {{
-                    background-color: transparent;
-                    border: none;
-                }}
-                QScrollBar:vertical {{
-                    background-color: #ECEFF4;
-                    width: 8px;
-                    margin: 0px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background-color: #D8DEE9;
-                    min-height: 30px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::handle:vertical:hover {{
-                    background-color: #5E81AC;
-                }}
-                QScrollBar::add-line:vertical,
-                QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                }}
-                QScrollBar::add-page:vertical,
-                QScrollBar::sub-page:vertical {{
-                    background: none;
-                }}
-            """)
-    
     def apply_translations(self):
         """Apply translations"""
         self.setWindowTitle(translator.get("add_vehicle_dialog.title"))
@@ -1153,7 +644,7 @@ class AddVehicleDialog(QDialog):
                 shutil.copy2(file_path, dest_path)
                 
                 label.setText(f"✓ {os.path.basename(dest_path)}")
-                label.setStyleSheet("color: #27ae60; font-weight: 600; font-size: 12px; border: none;")
+                style_engine.set_property(label, "attached", True)
                 remove_btn.setEnabled(True)
                 
             except Exception as e:
@@ -1174,46 +665,56 @@ class AddVehicleDialog(QDialog):
             return
         
         label.setText("Δεν έχει επισυναφθεί αρχείο")
-        label.setStyleSheet("color: #95a5a6; font-style: italic; font-size: 12px; border: none;")
+        style_engine.set_property(label, "attached", False)
         remove_btn.setEnabled(False)
         
+    def create_completer(self):
+        """Popup completer showing the suggestions it is given, unfiltered"""
+        completer = QCompleter(QStringListModel(self), self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        return completer
+    
+    def show_suggestions(self, completer, suggestions):
+        """Fill a completer's popup, or hide it when nothing matches"""
+        completer.model().setStringList(suggestions)
+        if suggestions:
+            completer.complete()
+        else:
+            completer.popup().hide()
+    
+    def on_brand_edited(self, text):
+        """Suggest brands with a word starting with the typed text"""
+        suggestions = brand_model_index.suggest_brands(text) if text.strip() else []
+        self.show_suggestions(self.brand_completer, suggestions)
+    
+    def on_model_edited(self, text):
+        """Suggest the chosen brand's models with a word starting with the typed text"""
+        brand = self.brand_field.currentText()
+        suggestions = brand_model_index.suggest_models(brand, text) if text.strip() else []
+        self.show_suggestions(self.model_completer, suggestions)
+    
+    def on_index_failed(self, error):
+        """Keep the known brands when the fleet's could not be read"""
+        print(f"⚠️ Could not load brand suggestions: {error}")
+    
+    def field_widgets(self):
+        """Map vehicle fields to their input widgets"""
+        return {
+            'license_plate': self.license_plate_field,
+            'brand': self.brand_field,
+            'model': self.model_field,
+            'vin_number': self.vin_field,
+            'year': self.year_field,
+        }
+        
     def save_vehicle(self):
         """Save vehicle to database with validation"""
-        license_plate = self.license_plate_field.text().strip()
-        brand = self.brand_field.currentText().strip()
-        model = self.model_field.text().strip()
-        
-        if not license_plate:
-            QMessageBox.warning(self, "Σφάλμα", "Παρακαλώ εισάγετε αριθμό κυκλοφορίας!")
-            self.license_plate_field.setFocus()
-            return
-        
-        if not brand:
-            QMessageBox.warning(self, "Σφάλμα", "Παρακαλώ εισάγετε μάρκα!")
-            self.brand_field.setFocus()
-            return
-        
-        if not model:
-            QMessageBox.warning(self, "Σφάλμα", "Παρακαλώ εισάγετε μοντέλο!")
-            self.model_field.setFocus()
-            return
-        
         vin = self.vin_field.text().strip()
-        if vin and len(vin) != 17:
-            QMessageBox.warning(self, "Σφάλμα", "Το VIN πρέπει να είναι 17 χαρακτήρες!")
-            self.vin_field.setFocus()
-            return
-        
-        current_year = QDate.currentDate().year()
-        if self.year_field.value() > current_year + 1:
-            QMessageBox.warning(self, "Σφάλμα", f"Το έτος δεν μπορεί να είναι > {current_year + 1}!")
-            self.year_field.setFocus()
-            return
-        
         vehicle_data = {
-            'license_plate': license_plate.upper(),
-            'brand': brand,
-            'model': model,
+            'license_plate': self.license_plate_field.text().strip().upper(),
+            'brand': self.brand_field.currentText().strip(),
+            'model': self.model_field.text().strip(),
             'year': self.year_field.value(),
             'vehicle_type': self.type_field.currentText(),
             'vin_number': vin.upper() if vin else '',
@@ -1226,12 +727,32 @@ class AddVehicleDialog(QDialog):
             'kteo_next': self.kteo_next_field.date().toString('yyyy-MM-dd'),
             'kek_renewal': self.kek_next_field.date().toString('yyyy-MM-dd'),
             'status': 'Active',
-            'gps_enabled': 1 if self.gps_checkbox.isChecked() else 0
+            'has_gps': 1 if self.gps_checkbox.isChecked() else 0
         }
         
-        try:
-            self.db.add_vehicle(vehicle_data)
-            QMessageBox.information(self, "Επιτυχία", "Το όχημα προστέθηκε επιτυχώς!")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα αποθήκευσης:\n{str(e)}")
\ No newline at end of file
+        # Same rules as the CSV/JSON importer
+        errors = validate_vehicle(vehicle_data, QDate.currentDate().year())
+        if errors:
+            field, message = errors[0]
+            QMessageBox.warning(self, "Σφάλμα", message)
+            self.field_widgets()[field].setFocus()
+            return
+        
+        # Written on the parent view's worker threads when it has them
+        self.save_btn.setEnabled(False)
+        dispatch(
+            getattr(self.parent, 'async_db', None), self.db.add_vehicle, vehicle_data,
+            callback=self.on_vehicle_saved,
+            error_callback=self.on_save_failed
+        )
+    
+    def on_vehicle_saved(self, vehicle_id):
+        """Confirm the new vehicle and close"""
+        brand_model_index.add(self.brand_field.currentText(), self.model_field.text())
+        QMessageBox.information(self, "Επιτυχία", "Το όχημα προστέθηκε επιτυχώς!")
+        self.accept()
+    
+    def on_save_failed(self, error):
+        """Report a failed save and let the user retry"""
+        self.save_btn.setEnabled(True)
+        QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα αποθήκευσης:\n{str(error)}")
\ No newline at end of file
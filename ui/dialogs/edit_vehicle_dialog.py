@@ -3,6 +3,7 @@ Edit Vehicle Dialog - Same as Add but for EDITING
 """
 from PyQt6.QtWidgets import QDialog, QMessageBox
 from .add_vehicle_dialog import AddVehicleDialog
+from utils.brand_manager import brand_model_index
 
 class EditVehicleDialog(AddVehicleDialog):
     """Edit Vehicle Dialog - Extends AddVehicleDialog"""
@@ -40,6 +41,7 @@ class EditVehicleDialog(AddVehicleDialog):
         
         try:
             self.db.update_vehicle(license_plate, vehicle_data)  # UPDATE!
+            brand_model_index.add(vehicle_data['brand'], vehicle_data['model'])
             QMessageBox.information(self, "Επιτυχία", "Το όχημα ενημερώθηκε επιτυχώς!")
             self.accept()
         except Exception as e:
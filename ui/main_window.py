@@ -8,163 +8,66 @@ from PyQt6.QtWidgets import (
     QPushButton, 
     QLabel,
     QSpacerItem,
-    QSizePolicy
+    QSizePolicy,
+    QMessageBox
 )
 from PyQt6.QtGui import QIcon, QPixmap, QPainter
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtCore import QSize, Qt, QThread, QTimer, pyqtSignal
 
-from ui.views.vehicles_view import VehiclesView
-from ui.settings_dialog import SettingsDialog, load_preferences
+from utils import settings
 from utils.theme_manager import theme
+from ui.style_engine import style_engine
 from utils.icon_manager import icon_manager
+from utils.translator import translator
+from utils.list_snapshot import load_snapshot, save_snapshot
 
-# --- GLOBAL STYLESHEET ---
-GLOBAL_STYLE = """
-/* Main Window */
-QMainWindow {
-    background-color: #ECEFF4;
-}
-
-/* Header Area */
-QWidget#header_widget {
-    background-color: #FFFFFF;
-    border-bottom: 1px solid #D8DEE9;
-}
-
-QLabel#header_logo_text {
-    font-size: 10px;
-    font-weight: 600;
-    color: #4C566A;
-    letter-spacing: 1.5px;
-    line-height: 14px;
-}
-
-QLabel#header_user_label {
-    color: #2E3440;
-    font-size: 14px;
-    font-weight: 500;
-    padding-right: 10px;
-}
-
-QPushButton#header_icon_button {
-    background-color: #ECEFF4;
-    border: none;
-    border-radius: 20px;
-    padding: 8px;
-    min-width: 36px;
-    min-height: 36px;
-    font-size: 16px;
-}
-
-QPushButton#header_icon_button:hover {
-    background-color: #D8DEE9;
-}
-
-/* Body Container (gray background) */
-QWidget#body_container {
-    background-color: #ECEFF4;
-}
-
-/* Navigation Sidebar - WHITE CONTAINER */
-QWidget#navigation_menu {
-    background-color: #FFFFFF;
-    border-radius: 12px;
-}
-
-/* Navigation Buttons */
-QPushButton#nav_button {
-    background-color: transparent;
-    border: none;
-    color: #4C566A;
-    text-align: left;
-    padding: 12px 20px;
-    font-size: 14px;
-    font-weight: 500;
-    border-radius: 10px;
-    margin: 5px 10px;
-}
-
-QPushButton#nav_button:hover {
-    background-color: #ECEFF4;
-}
-
-QPushButton#nav_button:checked {
-    background-color: #5E81AC;
-    color: #FFFFFF;
-}
-
-/* Content Area - WHITE CONTAINER */
-QWidget#content_area {
-    background-color: #FFFFFF;
-    border-radius: 12px;
-}
-
-/* Search & Button */
-QLineEdit#search_box {
-    background-color: #FFFFFF;
-    border: 1px solid #D8DEE9;
-    border-radius: 8px;
-    padding: 10px 15px 10px 40px;
-    font-size: 14px;
-}
-
-QLineEdit#search_box:focus {
-    border: 1px solid #5E81AC;
-}
-
-QPushButton#add_button {
-    background-color: #5E81AC;
-    color: #FFFFFF;
-    font-size: 14px;
-    font-weight: 600;
-    border: none;
-    border-radius: 8px;
-    padding: 10px 24px;
-}
-
-QPushButton#add_button:hover {
-    background-color: #81A1C1;
-}
-
-/* Table */
-QTableWidget {
-    background-color: #FFFFFF;
-    border: 1px solid #E5E9F0;
-    gridline-color: transparent;
-}
-QTableWidget::item {
-    padding: 14px;
-    border-bottom: 1px solid #ECEFF4;
-    color: #2E3440;
-    border-left: none;
-    border-right: none;
-}
-QTableWidget::item:selected {
-    background-color: #5E81AC;
-    color: #FFFFFF;
-}
-QHeaderView::section {
-    background-color: #FFFFFF;
-    padding: 12px 8px;
-    border: none;
-    border-bottom: 1px solid #E5E9F0;
-    font-size: 10px;
-    font-weight: 600;
-    color: #4C566A;
-    text-transform: uppercase;
-    min-height: 50px;
-}
 
+class DatabaseLoader(QThread):
+    """Opens (and migrates) the database off the GUI thread"""
+    
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+    
+    def run(self):
+        from database.db_manager import DatabaseManager
+        try:
+            db = DatabaseManager(self.db_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        # Opening read through this thread's connection; the GUI uses its own
+        db.release_reader()
+        self.loaded.emit(db)
 
-"""
 
 class MainWindow(QMainWindow):
-    def __init__(self, db):
+    # Emitted once: after the first paint, and when the vehicles list
+    # shows its first page
+    first_frame = pyqtSignal()
+    ready = pyqtSignal()
+    
+    # Navigation order; views are built on first navigation
+    VIEW_NAMES = ("Vehicles", "Service", "Reminders", "Reports")
+    
+    def __init__(self, db=None):
         super().__init__()
+        # None until load_database() finishes
         self.db = db
+        self.views = {}
+        self.vehicles_view = None
+        self.current_view = None
+        self.painted = False
+        self.db_loader = None
+        self.db_path = None
+        # Vehicle list saved at the last exit, shown until the database opens
+        self.snapshot = None
         
         # Load saved preferences
-        load_preferences()
+        settings.load_preferences()
         
         self.setWindowTitle("Vehicle Fleet Manager")
         self.setGeometry(100, 100, 1400, 900)
@@ -174,6 +77,9 @@ class MainWindow(QMainWindow):
         
         # Then apply theme (needs nav_items to exist)
         self.apply_theme()
+        
+        # Colorize the other themes' icons once the window is up
+        QTimer.singleShot(0, self.prewarm_icons)
 
 
     def init_ui(self):
@@ -229,11 +135,8 @@ class MainWindow(QMainWindow):
         
         # Logo (circular placeholder)
         self.logo_label = QLabel()
+        self.logo_label.setObjectName("header_logo")
         self.logo_label.setFixedSize(50, 50)
-        self.logo_label.setStyleSheet("""
-            background-color: #5E81AC;
-            border-radius: 25px;
-        """)
         logo_layout.addWidget(self.logo_label)
         
         # Title
@@ -310,10 +213,7 @@ class MainWindow(QMainWindow):
 
     def update_navigation_text(self):
         """Update navigation button text with current language"""
-        try:
-            from ui.settings_dialog import current_language
-        except ImportError:
-            current_language = "el"
+        current_language = settings.current_language
         
         if current_language == "en":
             translations = {
@@ -349,40 +249,124 @@ class MainWindow(QMainWindow):
         self.create_views()
 
     def create_views(self):
-        """Create all views."""
-        self.vehicles_view = VehiclesView(self.db)
-        self.view_stack.addWidget(self.vehicles_view)
-        
-        # Placeholder views
-        for name in ["Service", "Reminders", "Reports", "Settings"]:
-            placeholder = QLabel(f"{name} View (Under Construction)")
-            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder.setStyleSheet("font-size: 20px; color: #4C566A;")
-            self.view_stack.addWidget(placeholder)
+        """Nothing is built up front; see create_view()"""
+        self.views = {}
+
+    def create_view(self, view_name):
+        """Build a view on its first navigation and add it to the stack"""
+        if view_name == "Vehicles" and self.db is None and self.snapshot is None:
+            # Replaced by the real view once the database is open
+            view = self.create_placeholder("Φόρτωση οχημάτων...")
+        elif view_name == "Vehicles":
+            from ui.views.vehicles_view import VehiclesView
+            view = VehiclesView(self.db, snapshot=self.snapshot)
+            self.snapshot = None
+            view.model.page_loaded.connect(self.on_vehicles_page_loaded)
+            self.vehicles_view = view
+        else:
+            view = self.create_placeholder(f"{view_name} View (Under Construction)")
+        
+        self.views[view_name] = view
+        self.view_stack.addWidget(view)
+        return view
+
+    def create_placeholder(self, text):
+        """Centered label standing in for a view"""
+        placeholder = QLabel(text)
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setObjectName("view_placeholder")
+        return placeholder
 
     def switch_view(self, view_name):
         """Switch between views."""
-        view_map = {
-            "Vehicles": 0,
-            "Service": 1,
-            "Reminders": 2,
-            "Reports": 3,
-            
-        }
+        if view_name not in self.VIEW_NAMES:
+            return
         
-        if view_name in view_map:
-            self.view_stack.setCurrentIndex(view_map[view_name])
-            
-            # Update button states
-            for name, button in self.nav_buttons.items():
-                button.setChecked(name == view_name)
-            
-            # Refresh data if needed
-            if view_name == "Vehicles" and hasattr(self.vehicles_view, 'refresh_data'):
-                self.vehicles_view.refresh_data()
+        view = self.views.get(view_name)
+        if view is None:
+            view = self.create_view(view_name)
+        self.view_stack.setCurrentWidget(view)
+        self.current_view = view_name
+        
+        # Update button states
+        for name, button in self.nav_buttons.items():
+            button.setChecked(name == view_name)
+        
+        # Refresh data if needed
+        if view_name == "Vehicles" and hasattr(self.vehicles_view, 'refresh_data'):
+            self.vehicles_view.refresh_data()
+
+    def load_database(self, db_path):
+        """Open the database in the background; views needing it wait
+
+        A snapshot of the vehicle list saved at the last exit is shown
+        meanwhile, if there is a usable one.
+        """
+        self.db_path = db_path
+        self.snapshot = load_snapshot(db_path)
+        if self.snapshot and self.vehicles_view is None and "Vehicles" in self.views:
+            self.replace_loading_view()
+        
+        self.db_loader = DatabaseLoader(db_path, self)
+        self.db_loader.loaded.connect(self.set_database)
+        self.db_loader.failed.connect(self.on_database_failed)
+        self.db_loader.start()
+
+    def set_database(self, db):
+        """Use an opened database, building the views that waited for it"""
+        self.db = db
+        if self.vehicles_view is not None:
+            self.vehicles_view.set_database(db)
+        else:
+            self.replace_loading_view()
+
+    def replace_loading_view(self):
+        """Swap the Vehicles loading placeholder for the real view"""
+        loading = self.views.pop("Vehicles", None)
+        if self.current_view == "Vehicles":
+            self.switch_view("Vehicles")
+        if loading is not None:
+            self.view_stack.removeWidget(loading)
+            loading.deleteLater()
+
+    def on_database_failed(self, error):
+        """Report a database that could not be opened"""
+        QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα βάσης δεδομένων:\n{error}")
+
+    def on_vehicles_page_loaded(self):
+        """The vehicles list has data on screen: the window is usable"""
+        self.vehicles_view.model.page_loaded.disconnect(self.on_vehicles_page_loaded)
+        self.ready.emit()
+
+    def prewarm_icons(self):
+        """Cache nav/header icons for every theme so switching reuses them"""
+        icon_names = [icon_name for _, icon_name in self.nav_items] + ["user", "settings"]
+        icon_manager.prewarm(icon_names, themes=tuple(icon_manager.colors))
+
+    def closeEvent(self, event):
+        """Save the vehicle list for an instant start next time, then close the database"""
+        if self.vehicles_view is not None and self.db is not None:
+            snapshot = self.vehicles_view.list_snapshot()
+            if snapshot:
+                save_snapshot(self.db_path or self.db.db_path, snapshot)
+        if self.vehicles_view is not None and self.vehicles_view.async_db is not None:
+            # No callbacks into closing widgets; running queries finish first
+            self.vehicles_view.async_db.shutdown(wait=True)
+        if self.db is not None:
+            # Commits the writes still waiting in the write queue
+            self.db.close()
+            self.db = None
+        super().closeEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_frame.emit()
     
     def open_settings(self):
         """Open Settings Dialog"""
+        from ui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self)
         result = dialog.exec()
         
@@ -393,15 +377,10 @@ class MainWindow(QMainWindow):
             self.refresh_ui_text()
     
     def apply_theme(self):
-        """Apply current theme (GLOBAL_STYLE + theme colors + reload icons)"""
-        from utils.icon_manager import icon_manager
-        
-        # Get theme stylesheet
-        theme_style = theme.get_stylesheet()
-        
-        # Combine GLOBAL_STYLE + theme colors
-        combined_style = GLOBAL_STYLE + "\n" + theme_style
-        self.setStyleSheet(combined_style)
+        """Apply current theme (compiled app-wide stylesheet + reload icons)"""
+        # One cached stylesheet per theme, set on the application: a single
+        # repolish, and a no-op if the theme did not change
+        style_engine.apply(theme.current_theme)
         
         # Reload all navigation icons (only if they exist)
         if hasattr(self, 'nav_items') and hasattr(self, 'nav_buttons'):
@@ -412,10 +391,7 @@ class MainWindow(QMainWindow):
     
     def refresh_ui_text(self):
         """Refresh all UI text with current language"""
-        try:
-            from ui.settings_dialog import current_language
-        except ImportError:
-            current_language = "el"  # Default fallback
+        current_language = settings.current_language
         
         if current_language == "en":
             # English
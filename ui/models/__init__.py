@@ -0,0 +1,4 @@
+from .vehicle_table_model import VehicleTableModel
+from .vehicle_filter_proxy import VehicleFilterProxyModel
+
+__all__ = ['VehicleTableModel', 'VehicleFilterProxyModel']
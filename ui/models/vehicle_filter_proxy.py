@@ -0,0 +1,32 @@
+"""
+Vehicle Filter Proxy - Shows only the vehicles of a search result
+
+Sits between VehicleTableModel and the view. Rows stay in source order;
+fetchMore requests are passed through to the source model.
+"""
+from PyQt6.QtCore import QSortFilterProxyModel
+
+
+class VehicleFilterProxyModel(QSortFilterProxyModel):
+    """Filters source rows by a set of vehicle ids"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = None
+
+    def set_ids(self, ids):
+        """Show only these vehicle ids (None shows everything)"""
+        if ids is None and self.ids is None:
+            return
+        self.ids = ids
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.ids is None:
+            return True
+        return self.sourceModel().vehicle_at(source_row)['id'] in self.ids
+
+    def vehicle_at(self, row):
+        """Vehicle record shown in a proxy row"""
+        source_row = self.mapToSource(self.index(row, 0)).row()
+        return self.sourceModel().vehicle_at(source_row)
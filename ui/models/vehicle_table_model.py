@@ -0,0 +1,375 @@
+"""
+Vehicle Table Model - Lazily paged vehicles list for QTableView
+
+Rows are fetched a keyset page at a time when the view scrolls near the
+end (canFetchMore / fetchMore), so opening the list costs one page no
+matter how many vehicles exist, and no per-cell items are created.
+refresh() replays the database change log since the last load and patches
+only the rows that changed, keeping selection and scroll position.
+Sorting (including multi-column) is done by the database: a new order
+reloads from the first page of that order. The loaded state can be saved
+as a snapshot and restored before the database is open (see
+utils.list_snapshot), then reconciled once it is.
+"""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from database.db_manager import LIST_COLUMNS, PAGE_SIZE, sort_order
+from database.models import Vehicle, column_index
+from utils.list_snapshot import SNAPSHOT_MARGIN, SNAPSHOT_MAX_ROWS, reconcile_snapshot
+from utils.translator import translator
+
+
+# Newest first until a header is clicked
+DEFAULT_ORDER = sort_order('created_at')
+
+
+def compare_vehicles(a, b, order):
+    """-1, 0 or 1 as a sorts before, with or after b (NULLs first, as SQLite)"""
+    for field, descending in order:
+        x, y = a[field], b[field]
+        if x == y:
+            continue
+        result = -1 if x is None or (y is not None and x < y) else 1
+        return -result if descending else result
+    return 0
+
+
+class VehicleTableModel(QAbstractTableModel):
+    """Read-only table of Vehicle records loaded on demand"""
+
+    # (vehicle field, translation key of the header)
+    COLUMNS = (
+        ('license_plate', 'license_plate'),
+        ('brand', 'brand'),
+        ('model', 'model'),
+        ('year', 'year_prod'),
+        ('mileage', 'mileage'),
+        ('insurance_expiry', 'insurance_expiry'),
+        ('kteo_next', 'kteo_next'),
+    )
+
+    # data() returns the whole Vehicle record for this role
+    VehicleRole = Qt.ItemDataRole.UserRole
+
+    # After every fetched page or applied refresh, even an empty one
+    page_loaded = pyqtSignal()
+
+    def __init__(self, db, async_db=None, page_size=PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        # May be None until set_database(); nothing is fetched meanwhile
+        self.db = db
+        self.async_db = async_db
+        self.page_size = page_size
+        self.vehicles = []
+        self.next_key = None
+        self.exhausted = False
+        self.fetching = False
+        # Search query the pages are restricted to (None: all vehicles)
+        self.search = None
+        # User-chosen (field, descending) sort columns, primary first
+        self.sort_columns = []
+        self.order = DEFAULT_ORDER
+        # Change-log position the loaded rows are current with
+        self.change_seq = None
+        # Loaded vehicle of each id; its row is found by its sort key
+        self.loaded = {}
+        self.fields = [field for field, _ in self.COLUMNS]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.vehicles)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        vehicle = self.vehicles[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = vehicle.get(self.fields[index.column()])
+            return '' if value is None else str(value)
+        if role == self.VehicleRole:
+            return vehicle
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            title = translator.get(self.COLUMNS[section][1])
+            # Number the columns of a multi-column sort
+            if len(self.sort_columns) > 1:
+                for rank, (field, descending) in enumerate(self.sort_columns, 1):
+                    if field == self.fields[section]:
+                        return f"{title} {'▼' if descending else '▲'}{rank}"
+            return title
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (
+            self.db is not None and not parent.isValid()
+            and not self.exhausted and not self.fetching
+        )
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next page (in the background when async_db is set)"""
+        if not self.canFetchMore(parent):
+            return
+
+        self.fetching = True
+        if self.async_db:
+            self.async_db.submit(
+                self.db.get_vehicles_page, self.next_key, self.page_size,
+                order_by=self.order,
+                columns=LIST_COLUMNS,
+                search=self.search,
+                key=('vehicle_page', id(self)),
+                callback=self.append_page,
+                error_callback=self.on_fetch_failed
+            )
+        else:
+            self.append_page(self.db.get_vehicles_page(
+                self.next_key, self.page_size, self.order, columns=LIST_COLUMNS, search=self.search
+            ))
+
+    def append_page(self, page):
+        """Insert a fetched (vehicles, next_key) page at the end"""
+        vehicles, next_key = page
+        self.fetching = False
+        self.next_key = next_key
+        self.exhausted = next_key is None
+        if vehicles:
+            first = len(self.vehicles)
+            self.beginInsertRows(QModelIndex(), first, first + len(vehicles) - 1)
+            self.vehicles.extend(vehicles)
+            self.loaded.update((vehicle['id'], vehicle) for vehicle in vehicles)
+            self.endInsertRows()
+        self.page_loaded.emit()
+
+    def on_fetch_failed(self, error):
+        """Stop paging after a failed fetch; reload() starts over"""
+        self.fetching = False
+        self.exhausted = True
+        print(f"❌ Error loading vehicles: {error}")
+
+    def on_refresh_failed(self, error):
+        """Keep the rows as they are; the next refresh() retries"""
+        print(f"❌ Error refreshing vehicles: {error}")
+
+    def reload(self):
+        """Drop loaded rows and start again from the first page"""
+        if self.async_db:
+            self.async_db.cancel(('vehicle_page', id(self)))
+            self.async_db.cancel(('vehicle_changes', id(self)))
+        # Taken before the first page: later changes are replayed by refresh()
+        self.change_seq = self.db.latest_change_seq()
+        self.beginResetModel()
+        self.vehicles = []
+        self.loaded = {}
+        self.next_key = None
+        self.exhausted = False
+        self.fetching = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def refresh(self):
+        """Bring loaded rows up to date with changes since the last load"""
+        if self.change_seq is None:
+            self.reload()
+        elif self.async_db:
+            self.async_db.submit(
+                self.db.get_changed_vehicles, self.change_seq,
+                columns=LIST_COLUMNS,
+                search=self.search,
+                key=('vehicle_changes', id(self)),
+                callback=self.apply_changes,
+                error_callback=self.on_refresh_failed
+            )
+        else:
+            self.apply_changes(self.db.get_changed_vehicles(
+                self.change_seq, columns=LIST_COLUMNS, search=self.search
+            ))
+
+    def apply_changes(self, changes):
+        """Patch rows from a get_changed_vehicles() result
+
+        Deleted vehicles (and, while searching, ones that no longer match)
+        are removed, changed ones updated in place (or moved if their sort
+        position changed) and new ones inserted at their sort position if it
+        lies within the loaded pages (otherwise a later page brings them).
+        Rows are located by binary search, so the cost grows with the number
+        of changes, not with the number of loaded rows.
+        """
+        if changes is None:
+            # Change log compacted past our position
+            self.reload()
+            return
+
+        self.change_seq, changed = changes
+        removed_rows = []
+        added = []
+        for vehicle_id, vehicle in changed.items():
+            row = self.row_of(vehicle_id)
+            if vehicle is None:
+                if row is not None:
+                    removed_rows.append(row)
+            elif row is None:
+                added.append(vehicle)
+            elif vehicle == self.vehicles[row]:
+                continue
+            elif compare_vehicles(vehicle, self.vehicles[row], self.order) != 0:
+                removed_rows.append(row)
+                added.append(vehicle)
+            else:
+                self.vehicles[row] = vehicle
+                self.loaded[vehicle_id] = vehicle
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+        # Bottom-up so earlier removals do not shift later rows
+        for row in sorted(removed_rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.loaded[self.vehicles[row]['id']]
+            del self.vehicles[row]
+            self.endRemoveRows()
+
+        for vehicle in added:
+            row = self.insert_position(vehicle)
+            if row == len(self.vehicles) and not self.exhausted:
+                continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.vehicles.insert(row, vehicle)
+            self.loaded[vehicle['id']] = vehicle
+            self.endInsertRows()
+        self.page_loaded.emit()
+
+    def row_of(self, vehicle_id):
+        """Row of a loaded vehicle, or None if it is not loaded
+
+        The order always ends with id, so the row holding a vehicle is the
+        one its sort key bisects to.
+        """
+        vehicle = self.loaded.get(vehicle_id)
+        return None if vehicle is None else self.insert_position(vehicle)
+
+    def insert_position(self, vehicle):
+        """Row a vehicle belongs at in the current order"""
+        low, high = 0, len(self.vehicles)
+        while low < high:
+            middle = (low + high) // 2
+            if compare_vehicles(self.vehicles[middle], vehicle, self.order) < 0:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort by one column (QAbstractItemModel API)"""
+        self.sort_columns = [(self.fields[column], order == Qt.SortOrder.DescendingOrder)]
+        self.apply_sort()
+
+    def sort_by(self, column, add=False):
+        """Header click: sort by column, toggling its direction if sorted
+
+        With add, the column becomes the next tie-breaker of the current
+        sort instead of replacing it.
+        """
+        field = self.fields[column]
+        if add:
+            if field in dict(self.sort_columns):
+                self.sort_columns = [(name, not descending if name == field else descending)
+                                     for name, descending in self.sort_columns]
+            else:
+                self.sort_columns.append((field, False))
+        else:
+            primary = self.sort_columns[0] if self.sort_columns else None
+            descending = primary == (field, False)
+            self.sort_columns = [(field, descending)]
+        self.apply_sort()
+
+    def apply_sort(self):
+        """Reload in the order of sort_columns"""
+        self.order = sort_order(self.sort_columns) if self.sort_columns else DEFAULT_ORDER
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.COLUMNS) - 1)
+        self.reload()
+
+    def sort_indicator(self):
+        """(column, Qt.SortOrder) of the primary sort column, or None"""
+        if not self.sort_columns:
+            return None
+        field, descending = self.sort_columns[0]
+        order = Qt.SortOrder.DescendingOrder if descending else Qt.SortOrder.AscendingOrder
+        return self.fields.index(field), order
+
+    def set_database(self, db, async_db=None):
+        """Start using a database opened after the model was created"""
+        self.db = db
+        self.async_db = async_db
+
+    def snapshot(self, first_visible_row=0):
+        """Loaded state for utils.list_snapshot.save_snapshot, or None
+
+        Keeps the rows up to one margin past first_visible_row. A searched
+        list is not worth restoring.
+        """
+        if self.db is None or self.search is not None or self.change_seq is None:
+            return None
+        count = min(len(self.vehicles), max(first_visible_row, 0) + SNAPSHOT_MARGIN, SNAPSHOT_MAX_ROWS)
+        rows = [[vehicle.get(column) for column in LIST_COLUMNS] for vehicle in self.vehicles[:count]]
+        if count == len(self.vehicles):
+            next_key = self.next_key
+        else:
+            # Continue paging right after the last kept row
+            last = self.vehicles[count - 1]
+            next_key = tuple(last[column] for column, _ in self.order)
+        return {
+            'schema_version': self.db.schema_version(),
+            'change_seq': self.change_seq,
+            'columns': list(LIST_COLUMNS),
+            'sort_columns': [list(column) for column in self.sort_columns],
+            'rows': rows,
+            'next_key': list(next_key) if next_key is not None else None,
+            'exhausted': self.exhausted and count == len(self.vehicles),
+            'scroll_row': first_visible_row if first_visible_row < count else 0,
+        }
+
+    def restore(self, snapshot):
+        """Show a snapshot's rows; reconcile() checks them once a database is set"""
+        index = column_index(tuple(snapshot['columns']))
+        self.beginResetModel()
+        self.sort_columns = [(field, descending) for field, descending in snapshot['sort_columns']]
+        self.order = sort_order(self.sort_columns) if self.sort_columns else DEFAULT_ORDER
+        self.vehicles = [Vehicle(index, tuple(row)) for row in snapshot['rows']]
+        self.loaded = {vehicle['id']: vehicle for vehicle in self.vehicles}
+        self.next_key = tuple(snapshot['next_key']) if snapshot['next_key'] is not None else None
+        self.exhausted = snapshot['exhausted'] or self.next_key is None
+        self.fetching = False
+        self.search = None
+        self.change_seq = snapshot['change_seq']
+        self.endResetModel()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.COLUMNS) - 1)
+
+    def reconcile(self, snapshot):
+        """Patch restored rows from the database, or reload if the snapshot is stale"""
+        if self.async_db:
+            self.async_db.submit(
+                reconcile_snapshot, self.db, snapshot,
+                key=('vehicle_changes', id(self)),
+                callback=self.apply_changes,
+                error_callback=lambda error: self.reload()
+            )
+        else:
+            self.apply_changes(reconcile_snapshot(self.db, snapshot))
+
+    def set_search(self, query):
+        """Page through only the vehicles matching query (None: all) and reload"""
+        if query == self.search:
+            return
+        self.search = query
+        self.reload()
+
+    def vehicle_at(self, row):
+        """Vehicle record shown in a row"""
+        return self.vehicles[row]
+
+    def retranslate(self):
+        """Refresh header texts after a language change"""
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.COLUMNS) - 1)
@@ -4,54 +4,8 @@ from PyQt6.QtWidgets import (
     QComboBox, QPushButton, QWidget
 )
 from PyQt6.QtCore import Qt
-import json
-import os
-
-# Global variables for current settings
-current_language = "el"  # Default: Greek
-current_theme = "light"  # Default: Light theme
-
-def load_preferences():
-    """Load saved preferences from file"""
-    global current_language, current_theme
-    
-    try:
-        if os.path.exists("preferences.json"):
-            with open("preferences.json", "r", encoding="utf-8") as f:
-                prefs = json.load(f)
-                current_language = prefs.get("language", "el")
-                current_theme = prefs.get("theme", "light")
-                
-                # Apply theme
-                from utils.theme_manager import theme
-                theme.set_theme(current_theme)
-    except Exception as e:
-        print(f"Error loading preferences: {e}")
-
-def save_preferences(language, theme_name):
-    """Save preferences to file"""
-    global current_language, current_theme
-    
-    try:
-        prefs = {
-            "language": language,
-            "theme": theme_name
-        }
-        
-        with open("preferences.json", "w", encoding="utf-8") as f:
-            json.dump(prefs, f, indent=4)
-        
-        # Update globals
-        current_language = language
-        current_theme = theme_name
-        
-        # Apply theme
-        from utils.theme_manager import theme
-        theme.set_theme(theme_name)
-        
-        print(f"✅ Preferences saved: {language}, {theme_name}")
-    except Exception as e:
-        print(f"❌ Error saving preferences: {e}")
+from utils import settings
+from utils.settings import save_preferences
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -99,7 +53,7 @@ class SettingsDialog(QDialog):
         """)
         
         # Set current language
-        index = self.language_combo.findData(current_language)
+        index = self.language_combo.findData(settings.current_language)
         if index >= 0:
             self.language_combo.setCurrentIndex(index)
         
@@ -133,7 +87,7 @@ class SettingsDialog(QDialog):
         """)
         
         # Set current theme
-        index = self.theme_combo.findData(current_theme)
+        index = self.theme_combo.findData(settings.current_theme)
         if index >= 0:
             self.theme_combo.setCurrentIndex(index)
         
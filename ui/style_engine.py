@@ -0,0 +1,69 @@
+"""
+Style Engine - One compiled stylesheet per theme, applied to the whole app
+
+The sections in ui/stylesheets.py are rendered with a theme's palette once
+and cached. Widgets are matched by object name and dynamic properties
+instead of carrying their own stylesheets, so a theme switch is a single
+QApplication.setStyleSheet() call (one repolish of every widget) and
+opening a dialog parses no QSS at all.
+"""
+from PyQt6.QtWidgets import QApplication
+
+from ui.stylesheets import SECTIONS, STYLE_COLORS
+from utils.icon_manager import icon_manager
+from utils.theme_manager import theme
+
+
+class StyleEngine:
+    """Compiles, caches and applies per-theme stylesheets"""
+
+    def __init__(self):
+        self.compiled = {}
+        self.applied = None
+
+    def palette(self, theme_name):
+        """Everything the sections may refer to for one theme"""
+        return {
+            'name': theme_name,
+            **theme.themes[theme_name],
+            **STYLE_COLORS[theme_name],
+            'chevron_down': icon_manager.get_icon_path_for_css("chevron-down"),
+            'chevron_up': icon_manager.get_icon_path_for_css("chevron-up"),
+            'calendar': icon_manager.get_icon_path_for_css("calendar"),
+        }
+
+    def stylesheet(self, theme_name):
+        """Compiled stylesheet of a theme (cached per palette)"""
+        palette = self.palette(theme_name)
+        key = tuple(sorted(palette.items()))
+        sheet = self.compiled.get(key)
+        if sheet is None:
+            sheet = "\n".join(section(palette) for section in SECTIONS)
+            self.compiled[key] = sheet
+        return sheet
+
+    def apply(self, theme_name=None):
+        """Style the application with a theme; False if nothing changed"""
+        sheet = self.stylesheet(theme_name or theme.current_theme)
+        app = QApplication.instance()
+        if app is None or sheet == self.applied:
+            return False
+        app.setStyleSheet(sheet)
+        self.applied = sheet
+        return True
+
+    def set_property(self, widget, name, value):
+        """Set a dynamic property the stylesheet selects on, and restyle the widget"""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def clear_cache(self):
+        """Forget compiled stylesheets"""
+        self.compiled.clear()
+
+
+# Global style engine instance
+style_engine = StyleEngine()
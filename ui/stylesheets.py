@@ -0,0 +1,561 @@
+"""
+Stylesheets - Theme-aware QSS sections compiled by ui/style_engine.py
+
+Each section renders a palette (the theme's colors from utils/theme_manager.py
+plus STYLE_COLORS below) to QSS. Widgets are selected by object name and
+dynamic properties; rules scoped to one dialog or view start with its
+object name so they never leak into the rest of the application.
+"""
+from utils.theme_manager import theme
+
+# Colors the sections need beyond the theme palette
+STYLE_COLORS = {
+    "light": {
+        "dialog_bg": "#F5F7FA",
+        "card_bg": "white",
+        "card_border": "#E5E9F0",
+        "input_bg": "white",
+        "input_border": "#D8DEE9",
+        "input_text": "#2E3440",
+        "placeholder": "#A0AEC0",
+        "focus": "#5E81AC",
+        "accent": "#5E81AC",
+        "label": "#4C566A",
+        "heading": "#2E3440",
+        "muted": "#95a5a6",
+        "success": "#27ae60",
+        "separator": "#e0e0e0",
+        "popup_selection": "#5E81AC",
+        "popup_selection_text": "white",
+        "tint_hover": "rgba(94, 129, 172, 0.1)",
+        "tint_pressed": "rgba(94, 129, 172, 0.2)",
+        "danger_tint_hover": "rgba(191, 97, 106, 0.1)",
+        "danger_tint_pressed": "rgba(191, 97, 106, 0.2)",
+        "primary_button_bg": "#5E81AC",
+        "primary_button_text": "white",
+        "primary_button_hover": "#81A1C1",
+        "primary_button_pressed": "#4C7AA0",
+        "secondary_button_bg": "#E5E9F0",
+        "secondary_button_text": "#2E3440",
+        "secondary_button_hover": "#D8DEE9",
+        "secondary_button_pressed": "#D8DEE9",
+        "subtle_button_bg": "#ECEFF4",
+        "danger_button_bg": "#BF616A",
+        "danger_button_hover": "#D08770",
+        "disabled_text": "#A0A8B7",
+        "scroll_track": "#ECEFF4",
+        "scroll_handle": "#D8DEE9",
+        "scroll_handle_hover": "#5E81AC",
+        "badge_icon_bg": "#ECEFF4",
+        "badge_title": "#888",
+    },
+    "dark": {
+        "dialog_bg": "#2E3440",
+        "card_bg": "#3B4252",
+        "card_border": "#4C566A",
+        "input_bg": "#434C5E",
+        "input_border": "#4C566A",
+        "input_text": "#ECEFF4",
+        "placeholder": "#616E88",
+        "focus": "#88C0D0",
+        "accent": "#88C0D0",
+        "label": "#ECEFF4",
+        "heading": "#ECEFF4",
+        "muted": "#D8DEE9",
+        "success": "#27ae60",
+        "separator": "#4C566A",
+        "popup_selection": "#5E81AC",
+        "popup_selection_text": "#ECEFF4",
+        "tint_hover": "rgba(136, 192, 208, 0.1)",
+        "tint_pressed": "rgba(136, 192, 208, 0.2)",
+        "danger_tint_hover": "rgba(191, 97, 106, 0.1)",
+        "danger_tint_pressed": "rgba(191, 97, 106, 0.2)",
+        "primary_button_bg": "#88C0D0",
+        "primary_button_text": "#2E3440",
+        "primary_button_hover": "#8FBCBB",
+        "primary_button_pressed": "#81A1C1",
+        "secondary_button_bg": "#4C566A",
+        "secondary_button_text": "#ECEFF4",
+        "secondary_button_hover": "#5E6875",
+        "secondary_button_pressed": "#434C5E",
+        "subtle_button_bg": "#4C566A",
+        "danger_button_bg": "#BF616A",
+        "danger_button_hover": "#D08770",
+        "disabled_text": "#7B88A1",
+        "scroll_track": "#3B4252",
+        "scroll_handle": "#4C566A",
+        "scroll_handle_hover": "#5E81AC",
+        "badge_icon_bg": "#434C5E",
+        "badge_title": "#D8DEE9",
+    },
+}
+
+# Layout of the main window (theme colors are layered on by theme_colors)
+GLOBAL_STYLE = """
+/* Main Window */
+QMainWindow {
+    background-color: #ECEFF4;
+}
+
+/* Header Area */
+QWidget#header_widget {
+    background-color: #FFFFFF;
+    border-bottom: 1px solid #D8DEE9;
+}
+
+QLabel#header_logo {
+    background-color: #5E81AC;
+    border-radius: 25px;
+}
+
+QLabel#header_logo_text {
+    font-size: 10px;
+    font-weight: 600;
+    color: #4C566A;
+    letter-spacing: 1.5px;
+    line-height: 14px;
+}
+
+QLabel#header_user_label {
+    color: #2E3440;
+    font-size: 14px;
+    font-weight: 500;
+    padding-right: 10px;
+}
+
+QPushButton#header_icon_button {
+    background-color: #ECEFF4;
+    border: none;
+    border-radius: 20px;
+    padding: 8px;
+    min-width: 36px;
+    min-height: 36px;
+    font-size: 16px;
+}
+
+QPushButton#header_icon_button:hover {
+    background-color: #D8DEE9;
+}
+
+/* Body Container (gray background) */
+QWidget#body_container {
+    background-color: #ECEFF4;
+}
+
+/* Navigation Sidebar - WHITE CONTAINER */
+QWidget#navigation_menu {
+    background-color: #FFFFFF;
+    border-radius: 12px;
+}
+
+/* Navigation Buttons */
+QPushButton#nav_button {
+    background-color: transparent;
+    border: none;
+    color: #4C566A;
+    text-align: left;
+    padding: 12px 20px;
+    font-size: 14px;
+    font-weight: 500;
+    border-radius: 10px;
+    margin: 5px 10px;
+}
+
+QPushButton#nav_button:hover {
+    background-color: #ECEFF4;
+}
+
+QPushButton#nav_button:checked {
+    background-color: #5E81AC;
+    color: #FFFFFF;
+}
+
+/* Content Area - WHITE CONTAINER */
+QWidget#content_area {
+    background-color: #FFFFFF;
+    border-radius: 12px;
+}
+
+QLabel#view_placeholder {
+    font-size: 20px;
+    color: #4C566A;
+}
+
+/* Search & Button */
+QLineEdit#search_box {
+    background-color: #FFFFFF;
+    border: 1px solid #D8DEE9;
+    border-radius: 8px;
+    padding: 10px 15px 10px 40px;
+    font-size: 14px;
+}
+
+QLineEdit#search_box:focus {
+    border: 1px solid #5E81AC;
+}
+
+QPushButton#add_button {
+    background-color: #5E81AC;
+    color: #FFFFFF;
+    font-size: 14px;
+    font-weight: 600;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 24px;
+}
+
+QPushButton#add_button:hover {
+    background-color: #81A1C1;
+}
+
+/* Table */
+QTableView {
+    background-color: #FFFFFF;
+    border: 1px solid #E5E9F0;
+    gridline-color: transparent;
+}
+QTableView::item {
+    padding: 14px;
+    border-bottom: 1px solid #ECEFF4;
+    color: #2E3440;
+    border-left: none;
+    border-right: none;
+}
+QTableView::item:selected {
+    background-color: #5E81AC;
+    color: #FFFFFF;
+}
+QHeaderView::section {
+    background-color: #FFFFFF;
+    padding: 12px 8px;
+    border: none;
+    border-bottom: 1px solid #E5E9F0;
+    font-size: 10px;
+    font-weight: 600;
+    color: #4C566A;
+    text-transform: uppercase;
+    min-height: 50px;
+}
+"""
+
+
+def main_window(t):
+    """Main window layout"""
+    return GLOBAL_STYLE
+
+
+def theme_colors(t):
+    """Theme colors of the main window"""
+    return theme.get_stylesheet(t['name'])
+
+
+def vehicles_view(t):
+    """Search bar and buttons of the vehicles list"""
+    return f"""
+    QLabel#search_icon {{
+        padding-left: 12px;
+        background-color: {t['input_bg']};
+        border: 1px solid {t['card_border']};
+        border-right: none;
+        border-top-left-radius: 8px;
+        border-bottom-left-radius: 8px;
+    }}
+    QLineEdit#search_input {{
+        background-color: {t['input_bg']};
+        border: 1px solid {t['card_border']};
+        border-left: none;
+        border-top-right-radius: 8px;
+        border-bottom-right-radius: 8px;
+        padding: 0 16px;
+        font-size: 14px;
+        color: {t['input_text']};
+    }}
+    QLineEdit#search_input:focus {{
+        border: 1px solid {t['focus']};
+        border-left: none;
+    }}
+    QPushButton#add_vehicle_btn {{
+        background-color: {t['primary_button_bg']};
+        color: {t['primary_button_text']};
+        border: none;
+        border-radius: 8px;
+        padding: 0 24px;
+        font-size: 14px;
+        font-weight: 600;
+    }}
+    QPushButton#add_vehicle_btn:hover {{
+        background-color: {t['primary_button_hover']};
+    }}
+    QPushButton#import_btn {{
+        background-color: {t['subtle_button_bg']};
+        color: {t['secondary_button_text']};
+        border: none;
+        border-radius: 8px;
+        padding: 0 24px;
+        font-size: 14px;
+        font-weight: 600;
+    }}
+    QPushButton#import_btn:hover {{
+        background-color: {t['secondary_button_hover']};
+    }}
+    QPushButton#import_btn:disabled {{
+        color: {t['disabled_text']};
+    }}
+    """
+
+
+def vehicle_detail(t):
+    """Inline vehicle detail card and its badges"""
+    return f"""
+    QFrame#detail_card {{
+        background-color: {t['card_bg']};
+        border: 1px solid {t['card_border']};
+        border-radius: 12px;
+    }}
+    QLabel#detail_title {{
+        font-size: 24px;
+        font-weight: 600;
+        color: {t['heading']};
+    }}
+    QFrame#detail_separator {{
+        background: {t['separator']};
+        border: none;
+    }}
+    QWidget#badge {{
+        background: transparent;
+        border: none;
+    }}
+    QLabel#badge_icon {{
+        background: {t['badge_icon_bg']};
+        border-radius: 24px;
+        padding: 8px;
+    }}
+    QLabel#badge_icon[fallback="true"] {{
+        background: {t['primary_button_bg']};
+        color: {t['primary_button_text']};
+        padding: 0px;
+        font-size: 20px;
+    }}
+    QLabel#badge_title {{
+        background: transparent;
+        border: none;
+        font-size: 11px;
+        color: {t['badge_title']};
+    }}
+    QLabel#badge_value {{
+        background: transparent;
+        border: none;
+        font-size: 13px;
+        font-weight: bold;
+        color: {t['heading']};
+    }}
+    QPushButton#edit_btn, QPushButton#delete_btn {{
+        background-color: {t['primary_button_bg']};
+        color: {t['primary_button_text']};
+        border: none;
+        border-radius: 8px;
+        padding: 0 20px;
+        font-size: 14px;
+        font-weight: 600;
+    }}
+    QPushButton#edit_btn:hover {{
+        background-color: {t['primary_button_hover']};
+    }}
+    QPushButton#delete_btn {{
+        background-color: {t['danger_button_bg']};
+        color: white;
+    }}
+    QPushButton#delete_btn:hover {{
+        background-color: {t['danger_button_hover']};
+    }}
+    """
+
+
+def add_vehicle_dialog(t):
+    """AddVehicleDialog, scoped by its object name"""
+    d = "#addVehicleDialog"
+    return f"""
+    QDialog{d} {{
+        background-color: {t['dialog_bg']};
+    }}
+    {d} QWidget#mainContainer {{
+        background-color: {t['card_bg']};
+        border: 1px solid {t['card_border']};
+        border-radius: 12px;
+    }}
+    {d} QWidget#borderedSection {{
+        background-color: transparent;
+        border: 1px solid {t['card_border']};
+        border-radius: 8px;
+    }}
+    {d} QWidget#buttonBar {{
+        background-color: transparent;
+        border-top: 1px solid {t['card_border']};
+        border-radius: 0px;
+    }}
+    {d} QLabel {{
+        color: {t['label']};
+        font-size: 12px;
+        font-weight: 500;
+        background: transparent;
+        border: none;
+    }}
+    {d} QLabel#headerTitle {{
+        font-size: 13px;
+        font-weight: 600;
+        color: {t['heading']};
+    }}
+    {d} QLabel#fileLabel {{
+        color: {t['muted']};
+        font-style: italic;
+        font-size: 11px;
+    }}
+    {d} QLabel#fileLabel[attached="true"] {{
+        color: {t['success']};
+        font-style: normal;
+        font-weight: 600;
+        font-size: 12px;
+    }}
+    {d} QLineEdit, {d} QSpinBox, {d} QComboBox, {d} QDateEdit, {d} QTextEdit {{
+        border: 1px solid {t['input_border']};
+        border-radius: 6px;
+        padding: 6px 12px;
+        background-color: {t['input_bg']};
+        color: {t['input_text']};
+        font-size: 13px;
+    }}
+    {d} QLineEdit:focus, {d} QSpinBox:focus, {d} QComboBox:focus, {d} QDateEdit:focus, {d} QTextEdit:focus {{
+        border: 2px solid {t['focus']};
+        padding: 5px 11px;
+    }}
+    {d} QLineEdit::placeholder, {d} QTextEdit::placeholder {{
+        color: {t['placeholder']};
+    }}
+    {d} QComboBox::drop-down, {d} QDateEdit::drop-down {{
+        border: none;
+        background: transparent;
+        width: 20px;
+    }}
+    {d} QComboBox::down-arrow {{
+        image: url({t['chevron_down']});
+        width: 12px;
+        height: 12px;
+    }}
+    {d} QComboBox QAbstractItemView {{
+        background-color: {t['input_bg']};
+        color: {t['input_text']};
+        border: 1px solid {t['input_border']};
+        selection-background-color: {t['popup_selection']};
+        selection-color: {t['popup_selection_text']};
+    }}
+    {d} QDateEdit::down-arrow {{
+        image: url({t['calendar']});
+        width: 12px;
+        height: 12px;
+    }}
+    {d} QSpinBox::up-button, {d} QSpinBox::down-button {{
+        background: transparent;
+        border: none;
+    }}
+    {d} QSpinBox::up-arrow {{
+        image: url({t['chevron_up']});
+        width: 10px;
+        height: 10px;
+    }}
+    {d} QSpinBox::down-arrow {{
+        image: url({t['chevron_down']});
+        width: 10px;
+        height: 10px;
+    }}
+    {d} QCheckBox {{
+        color: {t['label']};
+        font-size: 12px;
+        font-weight: 500;
+        spacing: 8px;
+        background: transparent;
+        border: none;
+    }}
+    {d} QCheckBox::indicator {{
+        width: 16px;
+        height: 16px;
+        border: 2px solid {t['input_border']};
+        border-radius: 3px;
+        background-color: {t['input_bg']};
+    }}
+    {d} QCheckBox::indicator:checked {{
+        background-color: {t['accent']};
+        border-color: {t['accent']};
+    }}
+    {d} QCheckBox::indicator:hover {{
+        border-color: {t['accent']};
+    }}
+    {d} QPushButton {{
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+    }}
+    {d} QPushButton:hover {{
+        background-color: {t['tint_hover']};
+    }}
+    {d} QPushButton:pressed {{
+        background-color: {t['tint_pressed']};
+    }}
+    {d} QPushButton#removeButton:hover {{
+        background-color: {t['danger_tint_hover']};
+    }}
+    {d} QPushButton#removeButton:pressed {{
+        background-color: {t['danger_tint_pressed']};
+    }}
+    {d} QPushButton#saveButton, {d} QPushButton#cancelButton {{
+        background-color: {t['primary_button_bg']};
+        color: {t['primary_button_text']};
+        border: none;
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 13px;
+    }}
+    {d} QPushButton#saveButton:hover {{
+        background-color: {t['primary_button_hover']};
+    }}
+    {d} QPushButton#saveButton:pressed {{
+        background-color: {t['primary_button_pressed']};
+    }}
+    {d} QPushButton#cancelButton {{
+        background-color: {t['secondary_button_bg']};
+        color: {t['secondary_button_text']};
+    }}
+    {d} QPushButton#cancelButton:hover {{
+        background-color: {t['secondary_button_hover']};
+    }}
+    {d} QPushButton#cancelButton:pressed {{
+        background-color: {t['secondary_button_pressed']};
+    }}
+    {d} QScrollArea {{
+        background-color: transparent;
+        border: none;
+    }}
+    {d} QScrollBar:vertical {{
+        background-color: {t['scroll_track']};
+        width: 8px;
+        margin: 0px;
+        border-radius: 4px;
+    }}
+    {d} QScrollBar::handle:vertical {{
+        background-color: {t['scroll_handle']};
+        min-height: 30px;
+        border-radius: 4px;
+    }}
+    {d} QScrollBar::handle:vertical:hover {{
+        background-color: {t['scroll_handle_hover']};
+    }}
+    {d} QScrollBar::add-line:vertical, {d} QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    {d} QScrollBar::add-page:vertical, {d} QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+    """
+
+
+# Compiled in this order; later rules win ties
+SECTIONS = (main_window, theme_colors, vehicles_view, vehicle_detail, add_vehicle_dialog)
@@ -3,26 +3,107 @@ Vehicles View - Main vehicle management interface
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView,
-    QAbstractItemView, QMessageBox, QLabel
+    QLineEdit, QTableView, QHeaderView,
+    QAbstractItemView, QMessageBox, QLabel, QFileDialog, QApplication
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
+from database.async_db import AsyncDatabase
+from database.db_manager import search_terms
+from ui.models import VehicleTableModel, VehicleFilterProxyModel
+from ui.delegates import BrandLogoDelegate
+from utils.vehicle_search import run_search
 from ui.widgets.vehicle_detail_widget import VehicleDetailWidget
-from utils.translator import translator
 from utils.icon_manager import icon_manager
-from ui.dialogs import AddVehicleDialog, EditVehicleDialog
+from utils.brand_manager import brand_model_index
 
 
-class VehiclesView(QWidget):
-    def __init__(self, db, parent=None):
+class ImportWorker(QThread):
+    """Runs a fleet file import off the GUI thread"""
+    
+    progress = pyqtSignal(int, int, int)
+    finished_import = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, db, file_path, rejects_path, parent=None):
         super().__init__(parent)
         self.db = db
-        self.current_selected_row = None
+        self.file_path = file_path
+        self.rejects_path = rejects_path
+    
+    def run(self):
+        """Import through the shared DatabaseManager (its writer is thread-safe)"""
+        from utils.fleet_importer import import_file
+        
+        try:
+            summary = import_file(
+                self.db, self.file_path, self.rejects_path,
+                progress=self.progress.emit
+            )
+            self.finished_import.emit(summary)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.db.release_reader()
+
+
+# Wait this long after the last keystroke before searching
+SEARCH_DEBOUNCE_MS = 200
+
+
+class VehiclesView(QWidget):
+    def __init__(self, db, parent=None, snapshot=None):
+        """db may be None at first: a snapshot is shown until set_database()"""
+        super().__init__(parent)
+        self.db = None
+        self.async_db = None
+        self.current_selected_id = None
+        # Last database search result, narrowed in memory while typing on
+        self.last_search = None
+        # Restored list state, reconciled once the database is set
+        self.snapshot = snapshot
         self.init_ui()
-        self.load_vehicles()
+        if snapshot:
+            self.model.restore(snapshot)
+            self.update_sort_indicator()
+            self.restore_scroll(snapshot['scroll_row'])
+        self.set_controls_enabled(False)
+        if db is not None:
+            self.set_database(db)
         self.update_translations()
 
+    def set_database(self, db):
+        """Start querying db: reconcile the snapshot or load the first page"""
+        self.db = db
+        # Queries run on worker threads; results arrive via callbacks
+        self.async_db = AsyncDatabase(db, parent=self)
+        self.model.set_database(db, self.async_db)
+        self.set_controls_enabled(True)
+        if self.snapshot:
+            self.model.reconcile(self.snapshot)
+            self.snapshot = None
+        else:
+            self.load_vehicles()
+
+    def set_controls_enabled(self, enabled):
+        """Search, add and import need the database"""
+        for widget in (self.search_input, self.add_btn, self.import_btn):
+            widget.setEnabled(enabled)
+
+    def restore_scroll(self, row):
+        """Scroll a restored row to the top once the table is laid out"""
+        if row > 0:
+            QTimer.singleShot(0, lambda: self.table.scrollTo(
+                self.proxy.index(row, 0), QAbstractItemView.ScrollHint.PositionAtTop
+            ))
+
+    def list_snapshot(self):
+        """Current list state for utils.list_snapshot.save_snapshot, or None"""
+        first_visible = self.table.rowAt(0)
+        if first_visible < 0:
+            return self.model.snapshot()
+        return self.model.snapshot(self.proxy.mapToSource(self.proxy.index(first_visible, 0)).row())
+
     def init_ui(self):
         """Initialize the UI"""
         layout = QVBoxLayout(self)
@@ -46,38 +127,18 @@ class VehiclesView(QWidget):
         # Search icon
         self.search_icon_label = QLabel()
         self.search_icon_label.setPixmap(icon_manager.get_icon("search").pixmap(QSize(20, 20)))
-        self.search_icon_label.setStyleSheet("""
-            QLabel {
-                padding-left: 12px;
-                background-color: white;
-                border: 1px solid #E5E9F0;
-                border-right: none;
-                border-top-left-radius: 8px;
-                border-bottom-left-radius: 8px;
-            }
-        """)
+        self.search_icon_label.setObjectName("search_icon")
 
         # Search input
         self.search_input = QLineEdit()
+        self.search_input.setObjectName("search_input")
         self.search_input.setPlaceholderText("Search...")
         self.search_input.setFixedHeight(44)
-        self.search_input.textChanged.connect(self.filter_vehicles)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                border: 1px solid #E5E9F0;
-                border-left: none;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                padding: 0 16px;
-                font-size: 14px;
-                color: #2E3440;
-            }
-            QLineEdit:focus {
-                border: 1px solid #5E81AC;
-                border-left: none;
-            }
-        """)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.filter_vehicles)
+        self.search_input.textChanged.connect(self.search_timer.start)
 
         search_layout.addWidget(self.search_icon_label)
         search_layout.addWidget(self.search_input)
@@ -90,43 +151,44 @@ class VehiclesView(QWidget):
         self.add_btn.setIcon(icon_manager.get_icon("add"))
         self.add_btn.setIconSize(QSize(20, 20))
         self.add_btn.clicked.connect(self.add_vehicle)
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5E81AC;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 24px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #81A1C1;
-            }
-        """)
         top_bar.addWidget(self.add_btn)
 
+        # Import button (CSV / JSON fleet lists)
+        self.import_btn = QPushButton("Import")
+        self.import_btn.setObjectName("import_btn")
+        self.import_btn.setFixedHeight(44)
+        self.import_btn.setIcon(icon_manager.get_icon("attachment"))
+        self.import_btn.setIconSize(QSize(20, 20))
+        self.import_btn.clicked.connect(self.import_vehicles)
+        top_bar.addWidget(self.import_btn)
+
         layout.addLayout(top_bar)
 
-        # Vehicles table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "LICENSE PLATE", "BRAND", "MODEL", "YEAR", "MILEAGE", "INSURANCE_EXPIRY", "NOTES",
-        ])
+        # Vehicles table: rows are paged in by the model as the view scrolls
+        self.model = VehicleTableModel(self.db, self.async_db, parent=self)
+        # Search results narrow the list through the proxy
+        self.proxy = VehicleFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
 
         # Table properties
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        # Uniform rows let the view skip measuring each one
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setAlternatingRowColors(True)
+        # Brand logos are painted by a delegate, decoded off the GUI thread
+        self.brand_delegate = BrandLogoDelegate(self.table)
+        self.table.setItemDelegateForColumn(self.model.fields.index('brand'), self.brand_delegate)
 
         # Column widths
         header = self.table.horizontalHeader()
         self.table.setColumnWidth(0, 140)  # LICENSE PLATE
-        self.table.setColumnWidth(1, 110)  # BRAND
+        self.table.setColumnWidth(1, 140)  # BRAND (with logo)
         self.table.setColumnWidth(2, 110)  # MODEL
         self.table.setColumnWidth(3, 140)   # YEAR
         self.table.setColumnWidth(4, 100)  # MILEAGE
@@ -138,101 +200,120 @@ class VehiclesView(QWidget):
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)  # NOTES - stretch
+        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)  # KTEO - stretch
+
+        # Sorting is done by the database, not the view or the proxy
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        header.sectionClicked.connect(self.on_header_clicked)
 
         # Connect row click
-        self.table.cellClicked.connect(self.on_row_clicked)
+        self.table.clicked.connect(self.on_row_clicked)
         layout.addWidget(self.table)
 
     def update_translations(self):
         """Update UI text based on current language"""
-        if self.vehicle:
-            self.title_label.setText(f"{translator.get('vehicle.information')}")
-        else:
-            self.title_label.setText(f"{translator.get('vehicle.information')}")
-        
         # Update table headers
-        self.table.setHorizontalHeaderLabels([
-            translator.get("license_plate"),
-            translator.get("brand"),
-            translator.get("model"),
-            translator.get("year_prod"),
-            translator.get("mileage"),
-            translator.get("insurance_expiry"),
-            translator.get("notes"),
-        ])
+        self.model.retranslate()
 
     def load_vehicles(self):
-        """Load vehicles from database"""
-        vehicles = self.db.get_all_vehicles()
-        self.populate_table(vehicles)
-
-    def populate_table(self, vehicles):
-        """Populate table with vehicle data"""
-        self.table.setRowCount(0)
-        for vehicle in vehicles:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # License Plate
-            license_item = QTableWidgetItem(vehicle.get('license_plate', ''))
-            license_item.setData(Qt.ItemDataRole.UserRole, vehicle)
-            self.table.setItem(row, 0, license_item)
-
-            # Brand
-            self.table.setItem(row, 1, QTableWidgetItem(vehicle.get('brand', '')))
+        """Reload the list; the model fetches pages as they are scrolled to"""
+        self.model.reload()
+        self.invalidate_search()
 
-            # Model
-            self.table.setItem(row, 2, QTableWidgetItem(vehicle.get('model', '')))
+    def refresh_vehicles(self):
+        """Patch the list with vehicles changed since it was loaded"""
+        self.model.refresh()
+        self.invalidate_search()
 
-            # Year
-            self.table.setItem(row, 3, QTableWidgetItem(str(vehicle.get('year', ''))))
-            
-            # Mileage
-            self.table.setItem(row, 4, QTableWidgetItem(str(vehicle.get('mileage', ''))))          
+    def invalidate_search(self):
+        """Drop the last search result after a write; re-run an active query
 
-            # Ασφαλισμένο εώς
-            self.table.setItem(row, 5, QTableWidgetItem(str(vehicle.get('insurance_expiry', ''))))      
-
-            # Επόμενο Κτεο
-            self.table.setItem(row, 6, QTableWidgetItem(str(vehicle.get('kteo_next', ''))))    
-
-            # Επόμενο ΚΕΚ
-            self.table.setItem(row, 7, QTableWidgetItem(str(vehicle.get('kek_renewal', ''))))   
-
-            # Σημειώσεις
-            self.table.setItem(row, 8, QTableWidgetItem(str(vehicle.get('notes', ''))))
+        The model re-evaluates the query on every page and refresh, but
+        narrowing uses the result's ids, which miss vehicles added since.
+        """
+        self.last_search = None
+        if search_terms(self.search_input.text()):
+            self.filter_vehicles()
 
     def filter_vehicles(self):
-        """Filter vehicles based on search input"""
-        search_text = self.search_input.text().lower()
-        for row in range(self.table.rowCount()):
-            should_show = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            self.table.setRowHidden(row, not should_show)
-
-    def on_row_clicked(self, row, column):
+        """Filter vehicles by the search input (debounced)"""
+        terms = search_terms(self.search_input.text())
+        if not terms:
+            self.async_db.cancel('search')
+            self.last_search = None
+            self.proxy.set_ids(None)
+            self.model.set_search(None)
+            return
+        
+        # A longer version of the last query only removes rows: narrow the
+        # loaded result in memory instead of querying again
+        if self.last_search and self.last_search.refines(terms):
+            self.proxy.set_ids(self.last_search.narrow(terms))
+            return
+        
+        # A newer search supersedes one still running
+        self.async_db.submit(
+            run_search, self.db, self.search_input.text(),
+            key='search',
+            callback=self.on_search_results
+        )
+
+    def on_search_results(self, result):
+        """Page the list through the vehicles matching a new search"""
+        self.last_search = result
+        self.proxy.set_ids(None)
+        self.model.set_search(result.query)
+        # The text may have grown while the query ran
+        terms = search_terms(self.search_input.text())
+        if terms != result.terms and result.refines(terms):
+            self.proxy.set_ids(result.narrow(terms))
+
+    def on_header_clicked(self, column):
+        """Sort by a column; Ctrl/Shift+click adds it as a secondary sort"""
+        if self.db is None:
+            self.update_sort_indicator()
+            return
+        modifiers = QApplication.keyboardModifiers()
+        add = bool(modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier))
+        self.model.sort_by(column, add=add)
+        self.update_sort_indicator()
+
+    def update_sort_indicator(self):
+        """Show the model's primary sort column in the header"""
+        indicator = self.model.sort_indicator()
+        header = self.table.horizontalHeader()
+        if indicator:
+            header.setSortIndicator(*indicator)
+        else:
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+
+    def on_row_clicked(self, index):
         """Handle row click - toggle detail view"""
-        if self.current_selected_row == row and self.detail_widget.isVisible():
+        vehicle = self.proxy.vehicle_at(index.row())
+        if self.current_selected_id == vehicle['id'] and self.detail_widget.isVisible():
             self.detail_widget.hide()
             self.table.clearSelection()
-            self.current_selected_row = None
+            self.current_selected_id = None
         else:
-            license_item = self.table.item(row, 0)
-            if license_item:
-                license_plate = license_item.text()
-                self.show_vehicle_details(license_plate)
-            self.current_selected_row = row
+            self.show_vehicle_details(vehicle['license_plate'])
+            self.current_selected_id = vehicle['id']
 
     def show_vehicle_details(self, license_plate):
         """Show vehicle details in detail widget"""
-        vehicle = self.db.get_vehicle_by_license(license_plate)
+        if self.db is None:
+            return
+        self.async_db.submit(
+            self.db.get_vehicle_by_license, license_plate,
+            key='details',
+            callback=lambda vehicle: self.on_details_loaded(license_plate, vehicle)
+        )
+
+    def on_details_loaded(self, license_plate, vehicle):
+        """Show a fetched vehicle, or report that it no longer exists"""
         if vehicle:
-            self.detail_widget.show_vehicle(vehicle, self.db)
+            self.detail_widget.show_vehicle(vehicle, self.db, self.async_db)
         else:
             QMessageBox.warning(
                 self,
@@ -243,12 +324,48 @@ class VehiclesView(QWidget):
     def on_detail_closed(self):
         """Handle detail panel close"""
         self.table.clearSelection()
-        self.current_selected_row = None
+        self.current_selected_id = None
 
     def add_vehicle(self):
         """Add new vehicle"""
+        # The dialog module is large; load it on first use
+        from ui.dialogs import AddVehicleDialog
         dialog = AddVehicleDialog(self.db, self)
         if dialog.exec():
-            self.load_vehicles()  # Reload table
-            
-
+            self.refresh_vehicles()
+
+    def import_vehicles(self):
+        """Import vehicles from a CSV/JSON file in the background"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Εισαγωγή οχημάτων", "",
+            "Fleet files (*.csv *.json *.jsonl *.ndjson);;All Files (*)"
+        )
+        if not file_path:
+            return
+        
+        self.import_btn.setEnabled(False)
+        self.import_worker = ImportWorker(self.db, file_path, f"{file_path}.rejects.csv", self)
+        self.import_worker.progress.connect(
+            lambda done, ok, bad: self.import_btn.setText(f"Import ({done})")
+        )
+        self.import_worker.finished_import.connect(self.on_import_finished)
+        self.import_worker.failed.connect(self.on_import_failed)
+        self.import_worker.start()
+    
+    def on_import_finished(self, summary):
+        """Show import summary and reload the table"""
+        self.import_btn.setEnabled(True)
+        self.import_btn.setText("Import")
+        self.load_vehicles()
+        brand_model_index.invalidate()
+        
+        message = f"Εισήχθησαν {summary['inserted']} από {summary['processed']} εγγραφές."
+        if summary['rejects_path']:
+            message += f"\n{summary['rejected']} απορρίφθηκαν: {summary['rejects_path']}"
+        QMessageBox.information(self, "Εισαγωγή", message)
+    
+    def on_import_failed(self, error):
+        """Report an import that could not run"""
+        self.import_btn.setEnabled(True)
+        self.import_btn.setText("Import")
+        QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα εισαγωγής:\n{error}")
@@ -6,12 +6,21 @@ from PyQt6.QtWidgets import (
     QPushButton, QFrame
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
-from ui.dialogs import EditVehicleDialog
+from database.async_db import dispatch
 from PyQt6.QtWidgets import QMessageBox
 from utils.translator import translator
+from utils.pixmap_cache import pixmap_cache
 
-import os
+# (vehicle field, badge title, icon path)
+BADGES = (
+    ('license_plate', "Αρ. Κυκλοφορίας:", "resources/icons/license_plate.png"),
+    ('year', "Έτος Κυκλοφορίας:", "resources/icons/year.png"),
+    ('insurance_expiry', "Ασφαλισμένο εως:", "resources/icons/insurance.png"),
+    ('kteo_next', "Επόμενος ΚΤΕΟ:", "resources/icons/inspection.png"),
+    ('kek_renewal', "Ανανέωση ΚΕΚ:", "resources/icons/kek.png"),
+)
+
+BADGE_ICON_SIZE = 32
 
 
 class VehicleDetailWidget(QWidget):
@@ -23,6 +32,7 @@ class VehicleDetailWidget(QWidget):
         super().__init__(parent)
         self.vehicle = None
         self.db = None
+        self.async_db = None
         self.init_ui()
         self.hide()
     
@@ -34,13 +44,7 @@ class VehicleDetailWidget(QWidget):
         
         # Main card
         self.card = QFrame()
-        self.card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E9F0;
-                border-radius: 12px;
-            }
-        """)
+        self.card.setObjectName("detail_card")
         
         card_layout = QVBoxLayout(self.card)
         card_layout.setContentsMargins(30, 30, 30, 30)
@@ -50,7 +54,7 @@ class VehicleDetailWidget(QWidget):
         header_layout = QHBoxLayout()
         
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 24px; font-weight: 600; color: #2E3440;")
+        self.title_label.setObjectName("detail_title")
         self.update_translations()
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
@@ -61,20 +65,26 @@ class VehicleDetailWidget(QWidget):
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
         sep.setFixedHeight(1)
-        sep.setStyleSheet("background: #e0e0e0; border: none;")
+        sep.setObjectName("detail_separator")
         card_layout.addWidget(sep)
         
         # === BADGES ONLY ===
+        # Built once; show_vehicle only changes their values
         self.badges_layout = QHBoxLayout()
         self.badges_layout.setSpacing(10)
         self.badges_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.badge_values = {}
+        for field, title, icon_path in BADGES:
+            badge, value_label = self._create_badge(title, icon_path)
+            self.badge_values[field] = value_label
+            self.badges_layout.addWidget(badge)
         card_layout.addLayout(self.badges_layout)
         
         # === SEPARATOR ===
         sep2 = QFrame()
         sep2.setFrameShape(QFrame.Shape.HLine)
         sep2.setFixedHeight(1)
-        sep2.setStyleSheet("background: #e0e0e0; border: none;")
+        sep2.setObjectName("detail_separator")
         card_layout.addWidget(sep2)
         
         # Buttons
@@ -85,50 +95,24 @@ class VehicleDetailWidget(QWidget):
         self.edit_btn = QPushButton("✏️ Edit")  # ΠΡΟΣΘΗΚΗ self.
         self.edit_btn.setFixedHeight(44)
         self.edit_btn.clicked.connect(self.edit_vehicle)
-        self.edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5E81AC;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #81A1C1;
-            }
-        """)
+        self.edit_btn.setObjectName("edit_btn")
         button_layout.addWidget(self.edit_btn)
         
         # Delete button
         self.delete_btn = QPushButton("🗑️ Delete")  # ΠΡΟΣΘΗΚΗ self.
         self.delete_btn.setFixedHeight(44)
         self.delete_btn.clicked.connect(self.delete_vehicle)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #BF616A;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #D08770;
-            }
-        """)
+        self.delete_btn.setObjectName("delete_btn")
         button_layout.addWidget(self.delete_btn)
         
         card_layout.addLayout(button_layout)
         
         layout.addWidget(self.card)
     
-    def _create_badge(self, title, value, icon_path):
-        """Create a badge with icon and text"""
+    def _create_badge(self, title, icon_path):
+        """Create a badge with icon and title, returning it and its value label"""
         w = QWidget()
-        w.setStyleSheet("background: transparent; border: none;")
+        w.setObjectName("badge")
         
         layout = QHBoxLayout(w)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -137,87 +121,67 @@ class VehicleDetailWidget(QWidget):
         
         # Icon
         icon_label = QLabel()
+        icon_label.setObjectName("badge_icon")
         icon_label.setFixedSize(48, 48)
         
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            icon_label.setPixmap(pixmap.scaled(
-                32, 32, 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            ))
-            icon_label.setStyleSheet("""
-                background: #ECEFF4;
-                border-radius: 24px;
-                padding: 8px;
-            """)
+        pixmap = pixmap_cache.pixmap(icon_path, BADGE_ICON_SIZE, self.devicePixelRatioF())
+        if pixmap:
+            icon_label.setPixmap(pixmap)
         else:
             icon_label.setText("📋")
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            icon_label.setStyleSheet("""
-                background: #5E81AC;
-                border-radius: 24px;
-                color: white;
-                font-size: 20px;
-            """)
+            icon_label.setProperty("fallback", True)
         
-        # Text
-        text_html = f'<span style="font-size:11px;color:#888">{title}</span><br><b style="font-size:13px;color:#2E3440">{value}</b>'
-        text_label = QLabel(text_html)
-        text_label.setStyleSheet("background: transparent; border: none;")
+        # Text: fixed title above the value of the shown vehicle
+        text_layout = QVBoxLayout()
+        text_layout.setContentsMargins(0, 0, 0, 0)
+        text_layout.setSpacing(0)
+        title_label = QLabel(title)
+        title_label.setObjectName("badge_title")
+        value_label = QLabel()
+        value_label.setTextFormat(Qt.TextFormat.PlainText)
+        value_label.setObjectName("badge_value")
+        text_layout.addWidget(title_label)
+        text_layout.addWidget(value_label)
         
         layout.addWidget(icon_label)
-        layout.addWidget(text_label)
+        layout.addLayout(text_layout)
         
-        return w
+        return w, value_label
     
-    def show_vehicle(self, vehicle, db):
+    def show_vehicle(self, vehicle, db, async_db=None):
         """Show vehicle details - BADGES ONLY"""
         self.vehicle = vehicle
         self.db = db
+        self.async_db = async_db
         
         # Update title
         self.title_label.setText(f"{translator.get('vehicle_information')}")
         
-        # Clear existing badges
-        while self.badges_layout.count():
-            item = self.badges_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add badges ONLY
-        badges = [
-            ("Αρ. Κυκλοφορίας:", vehicle.get('license_plate', '-'), "resources/icons/license_plate.png"),
-            ("Έτος Κυκλοφορίας:", str(vehicle.get('year', '-')), "resources/icons/year.png"),
-            ("Ασφαλισμένο εως:", vehicle.get('insurance_expiry', '-'), "resources/icons/insurance.png"),
-            ("Επόμενος ΚΤΕΟ:", vehicle.get('kteo_next', '-'), "resources/icons/inspection.png"),
-            ("Ανανέωση ΚΕΚ:", vehicle.get('kek_renewal', '-'), "resources/icons/kek.png"),
-        ]
-        
-        for title, value, icon_path in badges:
-            badge = self._create_badge(title, value, icon_path)
-            self.badges_layout.addWidget(badge)
+        # Update badge values in place
+        for field, value_label in self.badge_values.items():
+            value_label.setText(str(vehicle.get(field, '-')))
         
         # Show the widget
         self.show()
     
     def update_translations(self):
-    """Update UI text based on current language"""
-    if self.vehicle:
-        self.title_label.setText(f"📋 {translator.get('vehicle.information')}")
-        self.brand_label.setText(translator.get("vehicle.brand"))
-        self.model_label.setText(translator.get("vehicle.model"))
-        self.license_label.setText(translator.get("vehicle.license_plate"))
-        self.vin_label.setText(translator.get("vehicle.vin"))
-        self.year_label.setText(translator.get("vehicle.year"))
-        self.color_label.setText(translator.get("vehicle.color"))
-        self.fuel_label.setText(translator.get("vehicle.fuel_type"))
-        self.cc_label.setText(translator.get("vehicle.engine_cc"))
-        self.mileage_label.setText(translator.get("vehicle.mileage"))
-        self.gps_checkbox.setText(translator.get("vehicle.has_gps"))
-    else:
-        # Similar labels for driver if needed
-        pass
+        """Update UI text based on current language"""
+        if self.vehicle:
+            self.title_label.setText(f"📋 {translator.get('vehicle.information')}")
+            self.brand_label.setText(translator.get("vehicle.brand"))
+            self.model_label.setText(translator.get("vehicle.model"))
+            self.license_label.setText(translator.get("vehicle.license_plate"))
+            self.vin_label.setText(translator.get("vehicle.vin"))
+            self.year_label.setText(translator.get("vehicle.year"))
+            self.color_label.setText(translator.get("vehicle.color"))
+            self.fuel_label.setText(translator.get("vehicle.fuel_type"))
+            self.cc_label.setText(translator.get("vehicle.engine_cc"))
+            self.mileage_label.setText(translator.get("vehicle.mileage"))
+            self.gps_checkbox.setText(translator.get("vehicle.has_gps"))
+        else:
+            # Similar labels for driver if needed
+            pass
     
     def close_panel(self):
         """Close the panel"""
@@ -229,15 +193,24 @@ class VehicleDetailWidget(QWidget):
         if not self.vehicle or not self.db:
             return
             
+        # The dialog module is large; load it on first use
+        from ui.dialogs import EditVehicleDialog
         dialog = EditVehicleDialog(self.db, self.vehicle, self)
         if dialog.exec():
             # Reload vehicle data
-            updated_vehicle = self.db.get_vehicle_by_license(self.vehicle['license_plate'])
-            if updated_vehicle:
-                self.show_vehicle(updated_vehicle, self.db)
-            # Reload table in parent vehicles_view
+            dispatch(
+                self.async_db, self.db.get_vehicle_by_license, self.vehicle['license_plate'],
+                key='details',
+                callback=self.on_vehicle_reloaded
+            )
+            # Patch the changed row in parent vehicles_view
             if self.parent():
-                self.parent().load_vehicles()
+                self.parent().refresh_vehicles()
+
+    def on_vehicle_reloaded(self, vehicle):
+        """Show the vehicle again after an edit"""
+        if vehicle:
+            self.show_vehicle(vehicle, self.db, self.async_db)
 
     def delete_vehicle(self):
         """Delete current vehicle"""
@@ -260,20 +233,33 @@ class VehicleDetailWidget(QWidget):
             
             if reply == QMessageBox.StandardButton.Yes:
                 # ✅ DELETE από database
-                self.db.delete_vehicle(license_plate)
-                
-                QMessageBox.information(self, "Επιτυχία", "Το όχημα διαγράφηκε επιτυχώς!")
-                
-                # ✅ Close detail panel
-                self.hide()
-                self.closed.emit()
-                
-                # ✅ Refresh parent table
-                parent_widget = self.parent()
-                if parent_widget and hasattr(parent_widget, 'load_vehicles'):
-                    parent_widget.load_vehicles()
+                self.delete_btn.setEnabled(False)
+                dispatch(
+                    self.async_db, self.db.delete_vehicle, license_plate,
+                    callback=lambda _: self.on_vehicle_deleted(),
+                    error_callback=self.on_delete_failed
+                )
                     
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα διαγραφής:\n{str(e)}")
+            self.on_delete_failed(e)
+
+    def on_vehicle_deleted(self):
+        """Close the panel and refresh the table after a delete"""
+        self.delete_btn.setEnabled(True)
+        QMessageBox.information(self, "Επιτυχία", "Το όχημα διαγράφηκε επιτυχώς!")
+        
+        # ✅ Close detail panel
+        self.hide()
+        self.closed.emit()
+        
+        # ✅ Refresh parent table
+        parent_widget = self.parent()
+        if parent_widget and hasattr(parent_widget, 'refresh_vehicles'):
+            parent_widget.refresh_vehicles()
+
+    def on_delete_failed(self, error):
+        """Report a failed delete"""
+        self.delete_btn.setEnabled(True)
+        import traceback
+        traceback.print_exception(error)
+        QMessageBox.critical(self, "Σφάλμα", f"Σφάλμα διαγραφής:\n{str(error)}")
@@ -0,0 +1,83 @@
+"""
+Brand Logo Cache - Brand logos decoded off the GUI thread, for list delegates
+
+logo() returns a cached pixmap at once, or None while the logo is still
+being decoded on a worker thread (BrandManager.load_logo_image) - the
+caller paints a placeholder and repaints on logo_ready. Each brand is
+decoded once per size and device pixel ratio, brands without a logo are
+remembered as such, and the pixmaps are held in a byte-bounded LRU.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QPixmap
+
+from utils.brand_manager import BrandManager, normalize_brand
+from utils.lru_cache import LRUCache
+from utils.pixmap_cache import pixmap_bytes
+
+LOGO_WORKERS = 1
+
+# Bytes of logo pixmaps kept; a few hundred brands at list size fit easily
+BRAND_LOGO_CACHE_BYTES = 4 * 1024 * 1024
+
+
+class BrandLogoCache(QObject):
+    """Asynchronously decoded, LRU-bounded brand logo pixmaps"""
+
+    # Brand whose logo (or lack of one) is now known
+    logo_ready = pyqtSignal(str)
+
+    # Emitted from the worker thread; queued to the GUI thread
+    _decoded = pyqtSignal(object, object, object)
+
+    def __init__(self, max_bytes=BRAND_LOGO_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.cache = LRUCache(max_bytes, sizeof=pixmap_bytes)
+        # Keys being decoded, so a brand is never queued twice
+        self.pending = set()
+        self.requests = 0
+        self.executor = None
+        self._decoded.connect(self._store)
+
+    def logo(self, brand, size, device_pixel_ratio=1.0):
+        """Logo pixmap of brand, or None if it has none or is not decoded yet"""
+        key = (normalize_brand(brand), size, device_pixel_ratio)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return None if pixmap.isNull() else pixmap
+
+        if key not in self.pending:
+            self.pending.add(key)
+            self.requests += 1
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=LOGO_WORKERS, thread_name_prefix="logo-worker")
+            self.executor.submit(self._decode, key, brand, size, device_pixel_ratio)
+        return None
+
+    def _decode(self, key, brand, size, device_pixel_ratio):
+        """Worker thread: decode and scale one logo"""
+        try:
+            image = BrandManager.load_logo_image(brand, size, device_pixel_ratio)
+        except Exception as e:
+            print(f"⚠️ Could not load the {brand} logo: {e}")
+            image = None
+        self._decoded.emit(key, brand, image)
+
+    def _store(self, key, brand, image):
+        """GUI thread: cache a decoded logo (a null pixmap for none)"""
+        self.pending.discard(key)
+        self.cache.put(key, QPixmap.fromImage(image) if image is not None else QPixmap())
+        self.logo_ready.emit(brand)
+
+    def clear(self):
+        """Forget every logo (e.g. after the logo files changed)"""
+        self.cache.clear()
+
+    def stats(self):
+        """LRU counters plus the number of decodes requested"""
+        return {**self.cache.stats(), 'decodes': self.requests}
+
+
+# Global brand logo cache instance
+brand_logo_cache = BrandLogoCache()
@@ -1,12 +1,50 @@
 """
 Brand Manager - Handles vehicle brand logos and data
+
+Logo files are looked up in an index of resources/brand, built by one
+directory scan keyed by normalized brand name and rebuilt when the
+directory's mtime changes. Decoded logos are cached per size and device
+pixel ratio: QImages, which worker threads may load (e.g. for list
+delegates), and QPixmaps for the GUI thread.
 """
 import os
-from PyQt6.QtGui import QPixmap
+import threading
+import time
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+
+from utils.brand_model_index import BrandModelIndex
+from utils.lru_cache import LRUCache
+from utils.pixmap_cache import pixmap_bytes
+
+BRAND_DIR = "resources/brand"
+
+# Seconds between checks of the logo directory's mtime
+LOGO_INDEX_CHECK_SECONDS = 2.0
+
+# Bytes of decoded logos kept, per cache (images and pixmaps)
+LOGO_CACHE_BYTES = 8 * 1024 * 1024
+
+
+def normalize_brand(name):
+    """Index key of a brand name or logo file name (ignores case, spaces and hyphens)"""
+    return name.upper().replace(" ", "").replace("-", "")
+
 
 class BrandManager:
     """Manages vehicle brands and their logos"""
     
+    # {normalized brand: logo path}, the directory mtime it was built at,
+    # and when that mtime was last checked
+    logo_files = None
+    logo_dir_mtime = None
+    logo_checked_at = 0.0
+    logo_lock = threading.Lock()
+    
+    # Decoded logos keyed by (path, size, device pixel ratio)
+    logo_images = LRUCache(LOGO_CACHE_BYTES, sizeof=pixmap_bytes)
+    logo_pixmaps = LRUCache(LOGO_CACHE_BYTES, sizeof=pixmap_bytes)
+    
     BRANDS = [
         # Αυτοκίνητα - Ευρωπαϊκές
         "Abarth", "Alfa Romeo", "Aston Martin", "Audi", "Bentley", "BMW", 
@@ -40,7 +78,7 @@ class BrandManager:
         
         # Μηχανές - Ευρωπαϊκές
         "Aprilia", "Ducati", "Husqvarna", "KTM", 
-        "Piaggio", "Triumph", "Vespa", "Vespa", "SYM",
+        "Piaggio", "Triumph", "Vespa", "SYM",
         
         # Μηχανές - Αμερικανικές
         "Harley-Davidson",
@@ -52,56 +90,123 @@ class BrandManager:
         "Caterpillar", "JCB", "Deutz-Fahr", "Fendt", "John Deere",         
     ]
     
+    # BRANDS sorted once, without duplicates
+    sorted_brands = None
+    
     @staticmethod
     def get_all_brands():
         """Get list of all brands"""
-        return sorted(BrandManager.BRANDS)
+        if BrandManager.sorted_brands is None:
+            BrandManager.sorted_brands = sorted(set(BrandManager.BRANDS))
+        return list(BrandManager.sorted_brands)
     
     @staticmethod
-    def get_brand_logo(brand_name):
-        """Get brand logo pixmap"""
+    def logo_index():
+        """{normalized brand: logo path}, rescanned when the directory changes"""
+        with BrandManager.logo_lock:
+            now = time.monotonic()
+            if (BrandManager.logo_files is not None
+                    and now - BrandManager.logo_checked_at < LOGO_INDEX_CHECK_SECONDS):
+                return BrandManager.logo_files
+            BrandManager.logo_checked_at = now
+            
+            try:
+                mtime = os.stat(BRAND_DIR).st_mtime_ns
+            except OSError:
+                mtime = None
+            if BrandManager.logo_files is None or mtime != BrandManager.logo_dir_mtime:
+                BrandManager.logo_files = BrandManager.scan_logos() if mtime is not None else {}
+                BrandManager.logo_dir_mtime = mtime
+                # Files may have been replaced
+                BrandManager.logo_images.clear()
+                BrandManager.logo_pixmaps.clear()
+            return BrandManager.logo_files
+    
+    @staticmethod
+    def scan_logos():
+        """Read the logo directory once into {normalized brand: path}"""
+        files = {}
+        for name in sorted(os.listdir(BRAND_DIR)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() == ".png":
+                files.setdefault(normalize_brand(stem), f"{BRAND_DIR}/{name}")
+        return files
+    
+    @staticmethod
+    def logo_path(brand_name):
+        """Logo file of a brand, or None"""
         if not brand_name:
-            return BrandManager.get_default_logo()
-        
-        # Normalize brand name (uppercase, no spaces)
-        normalized = brand_name.upper().replace(" ", "").replace("-", "")
-        
-        # Try exact match first
-        logo_path = f"resources/brand/{brand_name}.png"
-        if os.path.exists(logo_path):
-            return QPixmap(logo_path)
-        
-        # Try normalized match
-        logo_path = f"resources/brand/{normalized}.png"
-        if os.path.exists(logo_path):
-            return QPixmap(logo_path)
-        
-        # Try lowercase
-        logo_path = f"resources/brand/{brand_name.lower()}.png"
-        if os.path.exists(logo_path):
-            return QPixmap(logo_path)
-        
-        # Return default
-        return BrandManager.get_default_logo()
+            return None
+        return BrandManager.logo_index().get(normalize_brand(brand_name))
     
     @staticmethod
-    def get_default_logo():
+    def logo_image(path, size=None, device_pixel_ratio=1.0):
+        """Decoded logo file, fitted into size x size logical pixels (cached, thread-safe)"""
+        key = (path, size, device_pixel_ratio)
+        image = BrandManager.logo_images.get(key)
+        if image is None:
+            image = QImage(path)
+            if size and not image.isNull():
+                device_size = round(size * device_pixel_ratio)
+                image = image.scaled(
+                    device_size, device_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                image.setDevicePixelRatio(device_pixel_ratio)
+            BrandManager.logo_images.put(key, image)
+        return image
+    
+    @staticmethod
+    def load_logo_image(brand_name, size=None, device_pixel_ratio=1.0):
+        """Brand logo as a QImage, or None without one; safe on worker threads"""
+        path = BrandManager.logo_path(brand_name)
+        if path is None:
+            return None
+        image = BrandManager.logo_image(path, size, device_pixel_ratio)
+        return None if image.isNull() else image
+    
+    @staticmethod
+    def logo_pixmap(path, size=None, device_pixel_ratio=1.0):
+        """Decoded logo file as a QPixmap (cached, GUI thread only)"""
+        key = (path, size, device_pixel_ratio)
+        pixmap = BrandManager.logo_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(BrandManager.logo_image(path, size, device_pixel_ratio))
+            BrandManager.logo_pixmaps.put(key, pixmap)
+        return pixmap
+    
+    @staticmethod
+    def get_brand_logo(brand_name, size=None, device_pixel_ratio=1.0):
+        """Get brand logo pixmap, optionally fitted into size x size logical pixels"""
+        path = BrandManager.logo_path(brand_name)
+        if path is None:
+            return BrandManager.get_default_logo(size, device_pixel_ratio)
+        return BrandManager.logo_pixmap(path, size, device_pixel_ratio)
+    
+    @staticmethod
+    def get_default_logo(size=None, device_pixel_ratio=1.0):
         """Get default car logo"""
-        default_path = "resources/brand/default.png"
-        if os.path.exists(default_path):
-            return QPixmap(default_path)
-        return QPixmap(64, 64)  # Empty pixmap
+        default_path = BrandManager.logo_index().get(normalize_brand("default"))
+        if default_path:
+            return BrandManager.logo_pixmap(default_path, size, device_pixel_ratio)
+        pixmap = QPixmap(size or 64, size or 64)  # Empty pixmap
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
     
     @staticmethod
     def has_logo(brand_name):
         """Check if brand has a logo"""
-        if not brand_name:
-            return False
-        
-        normalized = brand_name.upper().replace(" ", "").replace("-", "")
-        
-        return (
-            os.path.exists(f"resources/brand/{brand_name}.png") or
-            os.path.exists(f"resources/brand/{normalized}.png") or
-            os.path.exists(f"resources/brand/{brand_name.lower()}.png")
-        )
+        return BrandManager.logo_path(brand_name) is not None
+    
+    @staticmethod
+    def clear_logo_cache():
+        """Forget the logo index and decoded logos"""
+        with BrandManager.logo_lock:
+            BrandManager.logo_files = None
+            BrandManager.logo_images.clear()
+            BrandManager.logo_pixmaps.clear()
+
+
+# Global brand and model autocomplete index
+brand_model_index = BrandModelIndex(BrandManager.get_all_brands())
@@ -0,0 +1,75 @@
+"""
+Brand Model Index - Brand and per-brand model suggestions for autocomplete
+
+Brands come from the known brand list plus every brand in the database;
+models are kept in one prefix trie per brand, filled from the database's
+distinct (brand, model) pairs. load() runs one indexed query and may run
+on a worker thread; add() records a newly saved vehicle without reloading.
+"""
+import threading
+
+from utils.prefix_trie import PrefixTrie, fold
+
+# Suggestions offered for one prefix
+MAX_SUGGESTIONS = 12
+
+
+class BrandModelIndex:
+    """Prefix tries of brands and of each brand's models"""
+
+    def __init__(self, brands=()):
+        self.known_brands = list(brands)
+        self.lock = threading.Lock()
+        self.brands = PrefixTrie(self.known_brands)
+        # {folded brand: PrefixTrie of its models}
+        self.models = {}
+        # Database the index was last loaded from
+        self.source = None
+
+    def is_loaded(self, db):
+        """Whether the index holds db's brands and models"""
+        return self.source is db
+
+    def load(self, db):
+        """Rebuild the index from db's (brand, model) pairs"""
+        brands = PrefixTrie(self.known_brands)
+        models = {}
+        for brand, model in db.get_brand_models():
+            brands.insert(brand)
+            key = fold(brand.strip())
+            if key not in models:
+                models[key] = PrefixTrie()
+            models[key].insert(model)
+
+        with self.lock:
+            self.brands = brands
+            self.models = models
+            self.source = db
+        return len(brands)
+
+    def invalidate(self):
+        """Reload on next use (e.g. after a bulk import)"""
+        self.source = None
+
+    def add(self, brand, model=None):
+        """Record a saved vehicle's brand and model"""
+        if not brand or not brand.strip():
+            return
+        with self.lock:
+            self.brands.insert(brand)
+            if model and model.strip():
+                key = fold(brand.strip())
+                if key not in self.models:
+                    self.models[key] = PrefixTrie()
+                self.models[key].insert(model)
+
+    def suggest_brands(self, prefix, limit=MAX_SUGGESTIONS):
+        """Brands with a word starting with prefix"""
+        with self.lock:
+            return self.brands.complete(prefix, limit)
+
+    def suggest_models(self, brand, prefix, limit=MAX_SUGGESTIONS):
+        """Models of brand with a word starting with prefix"""
+        with self.lock:
+            models = self.models.get(fold(brand.strip())) if brand else None
+            return models.complete(prefix, limit) if models else []
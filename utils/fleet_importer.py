@@ -0,0 +1,313 @@
+"""
+Fleet Importer - Streams CSV/JSON fleet lists into the database
+
+Records are read lazily, validated in chunks on a process pool with the
+same rules as AddVehicleDialog and inserted in batched transactions, so
+memory stays bounded by (workers * chunk size) regardless of file size.
+
+Usage:
+    python -m utils.fleet_importer fleet.csv --rejects rejects.csv
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from utils.vehicle_validator import normalize_vehicle, validate_vehicle
+
+CHUNK_SIZE = 1000
+READ_BLOCK_SIZE = 64 * 1024
+
+# Longest JSON array element; one that has not decoded by then is malformed
+MAX_RECORD_SIZE = 1024 * 1024
+
+
+class MalformedRecord:
+    """A line or array element that is not a valid record, rejected with its row"""
+
+    def __init__(self, text, error):
+        self.text = text
+        self.error = error
+
+
+def iter_records(path):
+    """Yield (row_number, record) from a CSV, JSON array or JSON Lines file"""
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.csv':
+        return iter_csv_records(path)
+    if extension in ('.jsonl', '.ndjson'):
+        return iter_json_lines(path)
+    if extension == '.json':
+        return iter_json_records(path)
+
+    raise ValueError(f"Unsupported import format: {extension}")
+
+
+def iter_csv_records(path):
+    """Yield CSV rows as dicts keyed by the header row"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        # Row 1 is the header, so data starts at row 2
+        for row_number, record in enumerate(csv.DictReader(f), start=2):
+            yield row_number, record
+
+
+def iter_json_lines(path):
+    """Yield one JSON object per non-empty line (MalformedRecord if it does not parse)"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for row_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                record = MalformedRecord(line, str(e))
+            yield row_number, record
+
+
+def iter_json_records(path):
+    """Yield the elements of a top-level JSON array without loading it whole
+
+    Elements that are not objects are yielded as MalformedRecord, to be
+    rejected like a bad JSON line. A broken array (bad separator, element
+    that does not decode) cannot be resumed and raises ValueError.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def read_more():
+            """Append the next block to the unconsumed part of the buffer"""
+            nonlocal buffer, pos, eof
+            block = f.read(READ_BLOCK_SIZE)
+            eof = not block
+            buffer = buffer[pos:] + block
+            pos = 0
+
+        def peek():
+            """Next non-whitespace character ('' at the end of the file)"""
+            nonlocal pos
+            while True:
+                pos = _skip_whitespace(buffer, pos)
+                if pos < len(buffer) or eof:
+                    return buffer[pos:pos + 1]
+                read_more()
+
+        if peek() != '[':
+            raise ValueError("JSON import file must contain an array of vehicles")
+        pos += 1
+        if peek() == ']':
+            return
+        row_number = 0
+
+        while True:
+            if peek() in (',', ']'):
+                raise ValueError(f"Expected a value at element {row_number + 1}")
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # Probably cut off at the end of the buffer: read on and retry
+                if eof or len(buffer) - pos > MAX_RECORD_SIZE:
+                    raise ValueError(f"Malformed JSON at element {row_number + 1}: {e}") from e
+                read_more()
+                continue
+            if end == len(buffer) and not eof:
+                # A number may go on in the next block
+                read_more()
+                continue
+
+            row_number += 1
+            if isinstance(record, dict):
+                yield row_number, record
+            else:
+                yield row_number, MalformedRecord(buffer[pos:end], "expected a JSON object")
+            pos = end
+
+            # Exactly one comma between elements
+            separator = peek()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' after element {row_number}")
+            pos += 1
+
+
+def _skip_whitespace(text, pos):
+    """Return the index of the next non-whitespace character"""
+    while pos < len(text) and text[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+
+def validate_chunk(chunk, current_year=None):
+    """Normalize and validate a chunk of (row_number, record)
+
+    Runs in worker processes. Returns (valid, rejects) where valid is a
+    list of (row_number, vehicle_data) and rejects a list of
+    (row_number, record, reasons).
+    """
+    valid = []
+    rejects = []
+
+    for row_number, record in chunk:
+        if isinstance(record, MalformedRecord):
+            rejects.append((row_number, record.text, [f"Μη έγκυρο JSON: {record.error}"]))
+            continue
+        if not isinstance(record, dict):
+            rejects.append((row_number, record, ["Η εγγραφή δεν είναι αντικείμενο"]))
+            continue
+
+        vehicle_data, errors = normalize_vehicle(record)
+        errors.extend(validate_vehicle(vehicle_data, current_year))
+
+        if errors:
+            rejects.append((row_number, record, [message for _, message in errors]))
+        else:
+            valid.append((row_number, vehicle_data))
+
+    return valid, rejects
+
+
+def iter_chunks(records, chunk_size):
+    """Group an iterator into lists of at most chunk_size items"""
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_validated_chunks(records, chunk_size=CHUNK_SIZE, workers=None):
+    """Validate chunks on a process pool, yielding results in file order
+
+    At most 2 * workers chunks are in flight so a huge file never gets
+    queued into memory at once. workers=1 validates in-process.
+    """
+    chunks = iter_chunks(iter(records), chunk_size)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for chunk in chunks:
+            yield validate_chunk(chunk)
+        return
+
+    # spawn keeps workers independent of the (possibly Qt, threaded) parent
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(validate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class RejectsWriter:
+    """Writes rejected rows with their reasons to a CSV file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.file = None
+        self.writer = None
+
+    def write(self, row_number, record, reasons):
+        """Append one rejected row (file is created on first reject)"""
+        self.count += 1
+        if self.path is None:
+            return
+        if self.writer is None:
+            self.file = open(self.path, 'w', encoding='utf-8', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['row', 'reasons', 'record'])
+        self.writer.writerow([
+            row_number,
+            '; '.join(reasons),
+            json.dumps(record, ensure_ascii=False, default=str)
+        ])
+
+    def close(self):
+        """Close the rejects file"""
+        if self.file:
+            self.file.close()
+
+
+def import_file(db, path, rejects_path=None, chunk_size=CHUNK_SIZE, workers=None, progress=None):
+    """Import a fleet file into db, returning a summary dict
+
+    progress, if given, is called with (processed, inserted, rejected)
+    after every chunk.
+    """
+    rejects = RejectsWriter(rejects_path)
+    processed = 0
+    inserted = 0
+
+    try:
+        for valid, rejected in iter_validated_chunks(iter_records(path), chunk_size, workers):
+            for row_number, record, reasons in rejected:
+                rejects.write(row_number, record, reasons)
+
+            ids, conflicts = db.add_vehicles_bulk(
+                (vehicle_data for _, vehicle_data in valid),
+                chunk_size=chunk_size
+            )
+            for conflict in conflicts:
+                row_number, vehicle_data = valid[conflict['index']]
+                rejects.write(row_number, vehicle_data, [conflict['error']])
+
+            processed += len(valid) + len(rejected)
+            inserted += len(ids)
+            if progress:
+                progress(processed, inserted, rejects.count)
+    finally:
+        rejects.close()
+
+    return {
+        'processed': processed,
+        'inserted': inserted,
+        'rejected': rejects.count,
+        'rejects_path': rejects_path if rejects.count else None,
+    }
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Import a CSV/JSON fleet list")
+    parser.add_argument('path', help="CSV, JSON array or JSON Lines file")
+    parser.add_argument('--db', default='fleet_manager.db', help="Database file")
+    parser.add_argument('--rejects', help="CSV file for rejected rows (default: <path>.rejects.csv)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None, help="Validation processes")
+    args = parser.parse_args(argv)
+
+    from database.db_manager import DatabaseManager
+
+    rejects_path = args.rejects or f"{args.path}.rejects.csv"
+    db = DatabaseManager(args.db)
+    try:
+        summary = import_file(
+            db, args.path, rejects_path,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            progress=lambda done, ok, bad: print(f"\r{done} rows, {ok} inserted, {bad} rejected", end='')
+        )
+    finally:
+        db.close()
+
+    print()
+    print(f"✅ Imported {summary['inserted']} of {summary['processed']} rows")
+    if summary['rejects_path']:
+        print(f"⚠️ {summary['rejected']} rejected rows written to {summary['rejects_path']}")
+
+
+if __name__ == '__main__':
+    main()
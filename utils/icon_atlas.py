@@ -0,0 +1,151 @@
+"""
+Icon Atlas - Colorized icons packed into one cached image per (theme, color, DPR)
+
+Every PNG in resources/icons is scaled and colorized once and packed into a
+grid in a single PNG under .cache/icon_atlas. Its offsets index travels in
+the PNG's own text chunk, so loading an atlas is one file read. The index
+records each source icon's size, mtime and SHA-1 and a hash of the theme
+color map; an atlas whose sources or colors changed is rebuilt.
+"""
+import hashlib
+import json
+import math
+import os
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+
+ATLAS_DIR = os.path.join(".cache", "icon_atlas")
+ATLAS_FORMAT = 1
+
+# Logical size of each packed icon; larger displays scale from the original
+ATLAS_ICON_SIZE = 64
+
+# PNG text chunk holding the offsets index
+INDEX_KEY = "fleet-icon-atlas"
+
+
+def file_hash(path):
+    """SHA-1 of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class IconAtlas:
+    """Builds, caches and slices colorized icon atlases"""
+
+    def __init__(self, base_path, cache_dir=ATLAS_DIR, icon_size=ATLAS_ICON_SIZE):
+        self.base_path = base_path
+        self.cache_dir = cache_dir
+        self.icon_size = icon_size
+
+    def atlas_path(self, theme, color, dpr):
+        """Cache file of one (theme, color, DPR) atlas"""
+        return os.path.join(self.cache_dir, f"{theme}-{color.lstrip('#').lower()}-{dpr:g}x.png")
+
+    def sources(self):
+        """{icon name: path} of the icon PNGs"""
+        if not os.path.isdir(self.base_path):
+            return {}
+        return {
+            name[:-4]: os.path.join(self.base_path, name)
+            for name in sorted(os.listdir(self.base_path)) if name.endswith('.png')
+        }
+
+    def source_hashes(self, sources, known=None):
+        """{name: [size, mtime_ns, sha1]}, re-hashing only files whose stat changed"""
+        known = known or {}
+        hashes = {}
+        for name, path in sources.items():
+            stat = os.stat(path)
+            entry = known.get(name)
+            if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                hashes[name] = entry
+            else:
+                hashes[name] = [stat.st_size, stat.st_mtime_ns, file_hash(path)]
+        return hashes
+
+    def atlas_key(self, hashes, colors, dpr):
+        """Hash of everything an atlas's pixels depend on"""
+        content = json.dumps([
+            ATLAS_FORMAT, self.icon_size, dpr, colors,
+            sorted((name, entry[2]) for name, entry in hashes.items()),
+        ], sort_keys=True)
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def load(self, theme, color, colors, dpr):
+        """{icon name: QPixmap} colorized with color, from cache or freshly built"""
+        sources = self.sources()
+        path = self.atlas_path(theme, color, dpr)
+        if os.path.exists(path):
+            image = QImage(path)
+            try:
+                index = json.loads(image.text(INDEX_KEY) or 'null')
+                hashes = self.source_hashes(sources, index['files'])
+                if index['key'] == self.atlas_key(hashes, colors, dpr):
+                    return self.slice(image, index['rects'], dpr)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        image, rects = self.build(sources, color, dpr)
+        hashes = self.source_hashes(sources)
+        image.setText(INDEX_KEY, json.dumps({
+            'key': self.atlas_key(hashes, colors, dpr),
+            'files': hashes,
+            'rects': rects,
+        }))
+        self.save(image, path)
+        return self.slice(image, rects, dpr)
+
+    def build(self, sources, color, dpr):
+        """Pack every source icon, scaled and colorized, into one image"""
+        cell = round(self.icon_size * dpr)
+        columns = max(math.ceil(math.sqrt(len(sources))), 1)
+        rows = max(math.ceil(len(sources) / columns), 1)
+        image = QImage(columns * cell, rows * cell, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+
+        rects = {}
+        painter = QPainter(image)
+        for position, (name, path) in enumerate(sources.items()):
+            icon = QImage(path)
+            if icon.isNull():
+                continue
+            icon = icon.scaled(cell, cell, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+            rect = QRect((position % columns) * cell, (position // columns) * cell,
+                         icon.width(), icon.height())
+            # Same two passes as IconManager.colorize_pixmap
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawImage(rect.topLeft(), icon)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(rect, QColor(color))
+            rects[name] = [rect.x(), rect.y(), rect.width(), rect.height()]
+        painter.end()
+        return image, rects
+
+    def save(self, image, path):
+        """Write an atlas over the stale one at its own path only
+
+        Each (theme, color, DPR) has its own file, and the normal and
+        selected atlases of a theme are both in use, so other files are
+        left alone. Written to a temporary file first so a reader never
+        sees a half-written atlas.
+        """
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if not image.save(temp_path, "PNG"):
+                raise OSError(f"cannot write {temp_path}")
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️ Icon atlas not cached: {e}")
+
+    def slice(self, image, rects, dpr):
+        """Cut an atlas into per-icon pixmaps"""
+        pixmaps = {}
+        for name, (x, y, width, height) in rects.items():
+            pixmap = QPixmap.fromImage(image.copy(x, y, width, height))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmaps[name] = pixmap
+        return pixmaps
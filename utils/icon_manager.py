@@ -1,8 +1,20 @@
-"""Icon Manager - Runtime Icon Colorization"""
+"""Icon Manager - Runtime Icon Colorization
+
+Colorized icons are cached by (name, theme, colors, size, device pixel
+ratio), so repeated lookups and switching back to a theme reuse them.
+QIcons are built from the on-disk icon atlases (utils/icon_atlas.py), so a
+warm start colorizes nothing.
+"""
 import os
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QGuiApplication
 from PyQt6.QtCore import QSize, Qt
 
+from utils.icon_atlas import IconAtlas
+from utils.lru_cache import LRUCache
+
+# Colorized icons / pixmaps kept; the app uses a few dozen per theme
+ICON_CACHE_SIZE = 256
+
 class IconManager:
     """Manages icon loading with runtime colorization"""
     
@@ -22,6 +34,14 @@ class IconManager:
                 "selected": "#ECEFF4"  # White για selected state
             }
         }
+        
+        # Decoded base PNGs (null pixmap for missing files) and colorized results
+        self.base_pixmaps = {}
+        self.cache = LRUCache(ICON_CACHE_SIZE)
+        
+        # Colorized icons per (theme, color, device pixel ratio), from the atlas
+        self.atlas = IconAtlas(self.base_path)
+        self.atlas_pixmaps = {}
     
     def set_theme(self, theme):
         """Update current theme"""
@@ -45,6 +65,7 @@ class IconManager:
         
         # Create colored version
         colored = QPixmap(pixmap.size())
+        colored.setDevicePixelRatio(pixmap.devicePixelRatio())
         colored.fill(Qt.GlobalColor.transparent)
         
         painter = QPainter(colored)
@@ -56,59 +77,108 @@ class IconManager:
         
         return colored
     
-    def get_icon(self, icon_name):
-        """Load icon with theme-aware colorization for both states"""
-        base_path = self.get_base_icon_path(icon_name)
-        
-        if not os.path.exists(base_path):
+    def get_base_pixmap(self, icon_name):
+        """Decoded base icon, read from disk once (null if missing)"""
+        pixmap = self.base_pixmaps.get(icon_name)
+        if pixmap is None:
+            base_path = self.get_base_icon_path(icon_name)
+            pixmap = QPixmap(base_path) if os.path.exists(base_path) else QPixmap()
+            self.base_pixmaps[icon_name] = pixmap
+        return pixmap
+    
+    def device_pixel_ratio(self):
+        """Pixel ratio of the primary screen (1.0 before the app exists)"""
+        screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+        return screen.devicePixelRatio() if screen else 1.0
+    
+    def get_atlas_pixmap(self, icon_name, theme, color, dpr):
+        """Colorized icon from the (theme, color, dpr) atlas (null if missing)"""
+        key = (theme, color, dpr)
+        pixmaps = self.atlas_pixmaps.get(key)
+        if pixmaps is None:
+            pixmaps = self.atlas.load(theme, color, self.colors, dpr)
+            self.atlas_pixmaps[key] = pixmaps
+        return pixmaps.get(icon_name, QPixmap())
+    
+    def scale_pixmap(self, pixmap, size, dpr):
+        """Scale to size logical pixels at dpr (no-op without a size)"""
+        if not size or pixmap.isNull():
+            return pixmap
+        scaled = pixmap.scaled(size * dpr, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+        scaled.setDevicePixelRatio(dpr)
+        return scaled
+    
+    def get_icon(self, icon_name, size=None, theme=None):
+        """Load icon with theme-aware colorization for both states (cached)
+        
+        With a QSize, the pixmaps are pre-scaled for the screen's pixel
+        ratio instead of being scaled at every paint.
+        """
+        theme = theme or self.current_theme
+        colors = self.colors["light"] if theme == "light" else self.colors["dark"]
+        dpr = self.device_pixel_ratio()
+        key = ('icon', icon_name, theme, colors["normal"], colors["selected"],
+               (size.width(), size.height()) if size else None, dpr)
+        icon = self.cache.get(key)
+        if icon is not None:
+            return icon
+        
+        normal_pixmap = self.get_atlas_pixmap(icon_name, theme, colors["normal"], dpr)
+        if normal_pixmap.isNull():
             return QIcon()
         
-        # Load base pixmap
-        base_pixmap = QPixmap(base_path)
-        
         # Create QIcon with different states
         icon = QIcon()
         
         # Normal state - theme dependent color
-        if self.current_theme == "light":
-            normal_color = self.colors["light"]["normal"]
-        else:
-            normal_color = self.colors["dark"]["normal"]
-        
-        normal_pixmap = self.colorize_pixmap(base_pixmap, normal_color)
+        normal_pixmap = self.scale_pixmap(normal_pixmap, size, dpr)
         icon.addPixmap(normal_pixmap, QIcon.Mode.Normal, QIcon.State.Off)
         
         # Selected state - always white
-        if self.current_theme == "light":
-            selected_color = self.colors["light"]["selected"]
-        else:
-            selected_color = self.colors["dark"]["selected"]
-        
-        selected_pixmap = self.colorize_pixmap(base_pixmap, selected_color)
+        selected_pixmap = self.get_atlas_pixmap(icon_name, theme, colors["selected"], dpr)
+        selected_pixmap = self.scale_pixmap(selected_pixmap, size, dpr)
         icon.addPixmap(selected_pixmap, QIcon.Mode.Normal, QIcon.State.On)
         icon.addPixmap(selected_pixmap, QIcon.Mode.Active, QIcon.State.On)
         
+        self.cache.put(key, icon)
         return icon
     
     def get_pixmap(self, icon_name, size=None, color=None):
-        """Load icon as QPixmap with optional size and color"""
-        base_path = self.get_base_icon_path(icon_name)
+        """Load icon as QPixmap with optional size and color (cached)"""
+        dpr = self.device_pixel_ratio()
+        key = ('pixmap', icon_name, color, (size.width(), size.height()) if size else None, dpr)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return pixmap
         
-        if not os.path.exists(base_path):
+        pixmap = self.get_base_pixmap(icon_name)
+        if pixmap.isNull():
             return QPixmap()
         
-        pixmap = QPixmap(base_path)
-        
-        # Colorize if color provided
+        # Resize if size provided, then colorize the (smaller) result
+        pixmap = self.scale_pixmap(pixmap, size, dpr)
         if color:
             pixmap = self.colorize_pixmap(pixmap, color)
         
-        # Resize if size provided
-        if size:
-            pixmap = pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio,
-                                  Qt.TransformationMode.SmoothTransformation)
-        
+        self.cache.put(key, pixmap)
         return pixmap
+    
+    def prewarm(self, icon_names, themes=None, size=None):
+        """Colorize icons ahead of use, e.g. for every theme after startup"""
+        for theme in themes or (self.current_theme,):
+            for icon_name in icon_names:
+                self.get_icon(icon_name, size, theme)
+    
+    def clear_cache(self):
+        """Forget decoded and colorized icons (e.g. after icon files changed)"""
+        self.base_pixmaps.clear()
+        self.atlas_pixmaps.clear()
+        self.cache.clear()
+    
+    def stats(self):
+        """Hit/miss counters of the icon cache"""
+        return self.cache.stats()
 
 # Global icon manager instance
 icon_manager = IconManager()
@@ -0,0 +1,94 @@
+"""
+List Snapshot - The vehicles list as it was at exit, for an instant first paint
+
+On exit the loaded rows (the first pages up to the scroll position), sort
+order and scroll position are written next to the database. On launch they
+are shown before the database is open, then reconciled in the background:
+the change log since the snapshot's position is replayed, and the rows it
+does not mention are checked against their current updated_at. A snapshot
+that cannot be proven current (other schema version, change log compacted
+or rolled back, a row changed behind the log's back) is discarded and the
+list reloads from the database.
+"""
+import json
+import os
+
+from database.db_manager import LIST_COLUMNS, PAGE_SIZE, sort_order
+
+SNAPSHOT_FORMAT = 1
+
+# Rows kept beyond the scroll position, and in total
+SNAPSHOT_MARGIN = PAGE_SIZE
+SNAPSHOT_MAX_ROWS = 5000
+
+
+def snapshot_path(db_path):
+    """Snapshot file belonging to a database file"""
+    return f"{db_path}.list-snapshot.json"
+
+
+def save_snapshot(db_path, snapshot):
+    """Write a snapshot atomically; failures only cost the next fast start"""
+    path = snapshot_path(db_path)
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': SNAPSHOT_FORMAT, **snapshot}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"⚠️ Could not save the vehicle list snapshot: {e}")
+
+
+def load_snapshot(db_path):
+    """The saved snapshot for db_path, or None if missing or unusable"""
+    path = snapshot_path(db_path)
+    if not os.path.exists(path) or not os.path.exists(db_path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get('format') != SNAPSHOT_FORMAT or snapshot['columns'] != list(LIST_COLUMNS):
+            return None
+        # Raises on columns that can no longer be sorted by
+        sort_order(snapshot['sort_columns'] or 'created_at')
+        if any(len(row) != len(LIST_COLUMNS) for row in snapshot['rows']):
+            return None
+        int(snapshot['change_seq'])
+        int(snapshot['schema_version'])
+        return snapshot
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ Ignoring the vehicle list snapshot: {e}")
+        return None
+
+
+def reconcile_snapshot(db, snapshot):
+    """Changes to apply to the snapshot rows, or None if it is stale (worker-thread safe)
+
+    Returns a DatabaseManager.get_changed_vehicles() result.
+    """
+    if db.schema_version() != snapshot['schema_version']:
+        return None
+    # A position ahead of the database: it was restored or replaced
+    if snapshot['change_seq'] > db.latest_change_seq():
+        return None
+    changes = db.get_changed_vehicles(snapshot['change_seq'], columns=LIST_COLUMNS)
+    if changes is None:
+        return None
+
+    # Rows the log does not mention must be exactly as saved
+    _, changed = changes
+    id_column = LIST_COLUMNS.index('id')
+    updated_column = LIST_COLUMNS.index('updated_at')
+    saved = {
+        row[id_column]: row[updated_column]
+        for row in snapshot['rows'] if row[id_column] not in changed
+    }
+    if saved:
+        current, _ = db.get_vehicles_page(
+            None, len(saved), 'id', columns=('id', 'updated_at'), ids=list(saved)
+        )
+        if len(current) != len(saved):
+            return None
+        if any(vehicle['updated_at'] != saved[vehicle['id']] for vehicle in current):
+            return None
+    return changes
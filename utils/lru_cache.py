@@ -0,0 +1,101 @@
+"""
+LRU Cache - Bounded, thread-safe least-recently-used cache with counters
+"""
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Least-recently-used cache bounded by entry count or total cost
+
+    With sizeof, maxsize bounds the sum of sizeof(value) (e.g. bytes)
+    instead of the number of entries. on_evict(key, value), if given, is
+    called for every entry evicted to make room, after the lock is released.
+    """
+
+    def __init__(self, maxsize=256, sizeof=None, on_evict=None):
+        self.maxsize = maxsize
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value (marking it recently used) or default"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting least recently used entries if needed"""
+        cost = self.sizeof(value) if self.sizeof else 1
+        evicted = []
+        with self._lock:
+            old = self._data.pop(key, _MISSING)
+            if old is not _MISSING:
+                self.size -= self.sizeof(old) if self.sizeof else 1
+            if cost > self.maxsize:
+                # Would evict everything and still not fit
+                return
+            self._data[key] = value
+            self.size += cost
+            while self.size > self.maxsize:
+                evicted_key, evicted_value = self._data.popitem(last=False)
+                self.size -= self.sizeof(evicted_value) if self.sizeof else 1
+                self.evictions += 1
+                evicted.append((evicted_key, evicted_value))
+
+        if self.on_evict:
+            for evicted_key, evicted_value in evicted:
+                self.on_evict(evicted_key, evicted_value)
+
+    def pop(self, key, default=None):
+        """Remove and return an entry without counting a hit or miss"""
+        with self._lock:
+            value = self._data.pop(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self.size -= self.sizeof(value) if self.sizeof else 1
+            return value
+
+    def peek(self, key, default=None):
+        """Return an entry without touching recency or counters"""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def stats(self):
+        """Counters for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'size': self.size,
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
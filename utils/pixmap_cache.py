@@ -0,0 +1,58 @@
+"""
+Pixmap Cache - Decoded, scaled image files shared across widgets
+
+Pixmaps are keyed by (path, size, device pixel ratio), so each icon file
+is read, decoded and smooth-scaled once per size and screen density.
+Missing files are cached too, as null pixmaps.
+"""
+import os
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+from utils.lru_cache import LRUCache
+
+# Bytes of scaled pixmaps kept in memory
+PIXMAP_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def pixmap_bytes(pixmap):
+    """Approximate memory used by a pixmap (32 bits per pixel)"""
+    return max(pixmap.width() * pixmap.height() * 4, 1)
+
+
+class PixmapCache:
+    """LRU of scaled QPixmaps loaded from image files"""
+
+    def __init__(self, max_bytes=PIXMAP_CACHE_BYTES):
+        self.cache = LRUCache(max_bytes, sizeof=pixmap_bytes)
+
+    def pixmap(self, path, size, device_pixel_ratio=1.0):
+        """Pixmap of path fitted into size x size logical pixels, or None if unreadable"""
+        key = (path, size, device_pixel_ratio)
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap()
+            if os.path.exists(path) and pixmap.load(path):
+                # Scale to device pixels so the icon stays sharp on HiDPI
+                device_size = round(size * device_pixel_ratio)
+                pixmap = pixmap.scaled(
+                    device_size, device_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self.cache.put(key, pixmap)
+        return None if pixmap.isNull() else pixmap
+
+    def clear(self):
+        """Forget every pixmap (e.g. after icon files changed)"""
+        self.cache.clear()
+
+    def stats(self):
+        """Hit/miss counters of the underlying LRU"""
+        return self.cache.stats()
+
+
+# Global instance
+pixmap_cache = PixmapCache()
@@ -0,0 +1,74 @@
+"""
+Prefix Trie - Case- and accent-insensitive prefix lookup for autocomplete
+
+Each string is indexed under its own start and under the start of every
+later word in it, so "rom" finds "Alfa Romeo". A lookup walks one node per
+typed character and then collects matches, ordered by the matched word,
+until the limit, so its cost does not grow with the number of indexed
+strings.
+"""
+import re
+import unicodedata
+
+# Key of the list of strings ending at a node (never a typed character)
+END = ""
+
+WORD_START = re.compile(r"\w+")
+
+
+def fold(text):
+    """Lowercase text without accents, as typed prefixes are compared"""
+    text = unicodedata.normalize('NFD', text.casefold())
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+class PrefixTrie:
+    """Strings indexed by the prefixes of their words"""
+
+    def __init__(self, words=()):
+        self.root = {}
+        # Folded form of every indexed string; the first spelling wins
+        self.keys = set()
+        for word in words:
+            self.insert(word)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, word):
+        return fold(word) in self.keys
+
+    def insert(self, word):
+        """Index word; False if it is empty or already indexed in any spelling"""
+        key = fold(word.strip()) if word else ""
+        if not key or key in self.keys:
+            return False
+        self.keys.add(key)
+
+        starts = {0} | {match.start() for match in WORD_START.finditer(key)}
+        for start in sorted(starts):
+            node = self.root
+            for char in key[start:]:
+                node = node.setdefault(char, {})
+            node.setdefault(END, []).append(word.strip())
+        return True
+
+    def complete(self, prefix, limit=None):
+        """Indexed strings with a word starting with prefix, ordered by that word"""
+        node = self.root
+        for char in fold(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+
+        # Depth-first in character order; END sorts before every character
+        results = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for word in sorted(node.get(END, ())):
+                results.setdefault(word)
+                if limit is not None and len(results) >= limit:
+                    return list(results)
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != END)
+        return list(results)
@@ -0,0 +1,58 @@
+"""
+Settings - Current language and theme, saved in preferences.json
+
+Kept free of Qt widgets so the main window can read them at startup
+without importing the settings dialog.
+"""
+import json
+import os
+
+PREFERENCES_PATH = "preferences.json"
+
+# Global variables for current settings
+current_language = "el"  # Default: Greek
+current_theme = "light"  # Default: Light theme
+
+
+def load_preferences():
+    """Load saved preferences from file"""
+    global current_language, current_theme
+
+    try:
+        if os.path.exists(PREFERENCES_PATH):
+            with open(PREFERENCES_PATH, "r", encoding="utf-8") as f:
+                prefs = json.load(f)
+                current_language = prefs.get("language", "el")
+                current_theme = prefs.get("theme", "light")
+
+                # Apply theme
+                from utils.theme_manager import theme
+                theme.set_theme(current_theme)
+    except Exception as e:
+        print(f"Error loading preferences: {e}")
+
+
+def save_preferences(language, theme_name):
+    """Save preferences to file"""
+    global current_language, current_theme
+
+    try:
+        prefs = {
+            "language": language,
+            "theme": theme_name
+        }
+
+        with open(PREFERENCES_PATH, "w", encoding="utf-8") as f:
+            json.dump(prefs, f, indent=4)
+
+        # Update globals
+        current_language = language
+        current_theme = theme_name
+
+        # Apply theme
+        from utils.theme_manager import theme
+        theme.set_theme(theme_name)
+
+        print(f"✅ Preferences saved: {language}, {theme_name}")
+    except Exception as e:
+        print(f"❌ Error saving preferences: {e}")
@@ -0,0 +1,46 @@
+"""
+Startup Timer - Cold-start milestones of the application
+
+main.py imports this module first, so times are measured from then (the
+interpreter's own startup is not included). Set FLEET_STARTUP_TIMING=1 to
+print the milestones once the window is interactive, or
+FLEET_STARTUP_TIMING=exit to also quit then, as bench_startup.py does.
+"""
+import os
+import time
+
+# Printed lines start with this, so benchmarks can parse them
+REPORT_PREFIX = "⏱️ startup"
+
+
+class StartupTimer:
+    """Records the first time each named milestone is reached"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = {}
+        self.mode = os.environ.get("FLEET_STARTUP_TIMING", "")
+
+    @property
+    def enabled(self):
+        return bool(self.mode)
+
+    @property
+    def exit_when_interactive(self):
+        return self.mode == "exit"
+
+    def mark(self, name):
+        """Record milestone name (only its first occurrence counts)"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def report(self):
+        """Print every milestone in order, if timing is enabled"""
+        if not self.enabled:
+            return
+        for name, seconds in sorted(self.marks.items(), key=lambda item: item[1]):
+            print(f"{REPORT_PREFIX} {name}: {seconds * 1000:.1f} ms", flush=True)
+
+
+# Global startup timer instance
+startup_timer = StartupTimer()
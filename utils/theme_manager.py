@@ -43,9 +43,9 @@ class Theme:
         """Get theme color value"""
         return self.themes[self.current_theme].get(key, "#000000")
     
-    def get_stylesheet(self):
-        """Generate theme stylesheet"""
-        t = self.themes[self.current_theme]
+    def get_stylesheet(self, theme_name=None):
+        """Generate theme stylesheet (of the current theme by default)"""
+        t = self.themes[theme_name or self.current_theme]
         
         return f"""
         /* Theme Colors */
@@ -80,21 +80,21 @@ class Theme:
         }}
         
         /* Table Text Colors */
-        QTableWidget::item {{
+        QTableView::item {{
             color: {t['text']};
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {t['selected']};
             color: {t['selected_text']};
         }}
         
-        QTableWidget {{
+        QTableView {{
             background-color: {t['surface']};
             border: 1px solid {t['border']};
         }}
         
-        QTableWidget QTableCornerButton::section {{
+        QTableView QTableCornerButton::section {{
             background-color: {t['surface']};
             border: none;
         }}
@@ -0,0 +1,88 @@
+"""
+Vehicle Search - Full-text search with in-memory narrowing for the list
+
+A query goes to the FTS5 index once; the matching vehicles' words are kept
+in a sorted in-memory prefix index. While the user keeps typing a longer
+version of that query, results are narrowed from this index without
+touching the database.
+"""
+from bisect import bisect_left
+
+from database.db_manager import search_terms
+
+# Result sets up to this size are indexed for narrowing; larger ones only
+# keep their ids and the next keystroke queries the database again
+NARROW_LIMIT = 20000
+
+# Fields matched by DatabaseManager.search_vehicles (the FTS5 columns)
+TEXT_FIELDS = ('license_plate', 'brand', 'model', 'vin_number', 'notes')
+
+
+def vehicle_words(vehicle):
+    """Words of a vehicle as the FTS5 index sees them"""
+    words = set()
+    for field in TEXT_FIELDS:
+        value = vehicle.get(field)
+        if value:
+            words.update(search_terms(str(value)))
+    plate = vehicle.get('license_plate') or ''
+    # The index's plate_key column: the plate without separators
+    words.update(search_terms(plate.replace('-', '').replace(' ', '')))
+    return words
+
+
+class SearchResult:
+    """Ids matching a query, plus a prefix index to narrow them further"""
+
+    def __init__(self, terms, ids, vehicles=None):
+        self.terms = terms
+        self.ids = frozenset(ids)
+        self.words = None
+        self.word_ids = None
+
+        if vehicles is not None:
+            pairs = sorted(
+                (word, vehicle['id']) for vehicle in vehicles for word in vehicle_words(vehicle)
+            )
+            self.words = [word for word, _ in pairs]
+            self.word_ids = [vehicle_id for _, vehicle_id in pairs]
+
+    @property
+    def query(self):
+        """The terms as a query for DatabaseManager's search parameters"""
+        return " ".join(self.terms)
+
+    def refines(self, terms):
+        """True if terms can only match a subset of this result
+
+        Holds when every earlier term is a prefix of some new term, e.g.
+        'toy' -> 'toyota' or 'toyota' -> 'toyota yar'.
+        """
+        if self.words is None or not terms:
+            return False
+        return all(any(term.startswith(old) for term in terms) for old in self.terms)
+
+    def narrow(self, terms):
+        """Ids matching every term by word prefix"""
+        ids = set(self.ids)
+        for term in terms:
+            first = bisect_left(self.words, term)
+            last = bisect_left(self.words, term + '\uffff', first)
+            ids.intersection_update(self.word_ids[first:last])
+            if not ids:
+                break
+        return ids
+
+
+def run_search(db, query, narrow_limit=NARROW_LIMIT):
+    """Query the full-text index, returning a SearchResult (worker-thread safe)"""
+    terms = search_terms(query)
+    vehicles = db.search_vehicles(
+        query, limit=narrow_limit + 1, columns=('id',) + TEXT_FIELDS
+    )
+    if len(vehicles) <= narrow_limit:
+        return SearchResult(terms, [vehicle['id'] for vehicle in vehicles], vehicles)
+
+    # Too many to index: keep just the ids
+    ids = [vehicle['id'] for vehicle in db.search_vehicles(query, limit=None, columns=('id',))]
+    return SearchResult(terms, ids)
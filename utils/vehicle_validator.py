@@ -0,0 +1,92 @@
+"""
+Vehicle Validator - Validation rules shared by AddVehicleDialog and imports
+"""
+from datetime import date
+
+VIN_LENGTH = 17
+MIN_YEAR = 1900
+
+# Fields converted to int when they arrive as text (CSV/JSON imports)
+INTEGER_FIELDS = ('year', 'mileage', 'engine_cc', 'has_gps')
+
+# Fields stored as text; JSON numbers there (e.g. a numeric VIN) become strings
+TEXT_FIELDS = (
+    'license_plate', 'brand', 'model', 'vehicle_type', 'vin_number', 'fuel_type', 'color',
+    'notes', 'insurance_expiry', 'kteo_next', 'kek_renewal', 'status',
+)
+
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'ναι', 'x')
+
+
+def normalize_vehicle(record):
+    """Clean a raw record (strings from CSV/JSON) into vehicle data
+
+    Returns (vehicle_data, errors). Unknown keys are kept untouched so
+    the database column mapping decides what is stored.
+    """
+    vehicle_data = {}
+    errors = []
+
+    for key, value in record.items():
+        if key is None:
+            continue
+        key = key.strip()
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                continue
+
+        if key in INTEGER_FIELDS and value is not None:
+            if key == 'has_gps' and isinstance(value, str):
+                value = 1 if value.lower() in TRUE_VALUES else 0
+            else:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    errors.append((key, f"Μη έγκυρος αριθμός στο πεδίο {key}: {value}"))
+                    continue
+        elif key in TEXT_FIELDS and value is not None and not isinstance(value, str):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append((key, f"Μη έγκυρη τιμή στο πεδίο {key}: {value}"))
+                continue
+            value = str(value)
+
+        vehicle_data[key] = value
+
+    for key in ('license_plate', 'vin_number'):
+        if isinstance(vehicle_data.get(key), str):
+            vehicle_data[key] = vehicle_data[key].upper()
+
+    return vehicle_data, errors
+
+
+def validate_vehicle(vehicle_data, current_year=None):
+    """Check vehicle data against the AddVehicleDialog rules
+
+    Returns a list of (field, message) tuples, empty when the data is valid.
+    """
+    if current_year is None:
+        current_year = date.today().year
+
+    errors = []
+
+    if not vehicle_data.get('license_plate'):
+        errors.append(('license_plate', "Παρακαλώ εισάγετε αριθμό κυκλοφορίας!"))
+
+    if not vehicle_data.get('brand'):
+        errors.append(('brand', "Παρακαλώ εισάγετε μάρκα!"))
+
+    if not vehicle_data.get('model'):
+        errors.append(('model', "Παρακαλώ εισάγετε μοντέλο!"))
+
+    vin = vehicle_data.get('vin_number')
+    if vin and len(str(vin)) != VIN_LENGTH:
+        errors.append(('vin_number', f"Το VIN πρέπει να είναι {VIN_LENGTH} χαρακτήρες!"))
+
+    year = vehicle_data.get('year')
+    if year is not None and year > current_year + 1:
+        errors.append(('year', f"Το έτος δεν μπορεί να είναι > {current_year + 1}!"))
+    elif year is not None and year < MIN_YEAR:
+        errors.append(('year', f"Το έτος δεν μπορεί να είναι < {MIN_YEAR}!"))
+
+    return errors